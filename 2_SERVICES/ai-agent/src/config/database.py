@@ -3,7 +3,8 @@ Database configuration and connection management
 """
 
 import asyncio
-from typing import AsyncGenerator, Optional
+import time
+from typing import AsyncGenerator, Dict, List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -113,6 +114,50 @@ async def check_db_health() -> dict:
         return {"status": "unhealthy", "error": str(e)}
 
 
+class ComplianceRuleCache:
+    """Per-jurisdiction active rule sets, held in process and stamped with a version"""
+    
+    def __init__(self):
+        # jurisdiction -> (version, rules, last confirmed current at)
+        self._rule_sets: Dict[str, Tuple[str, List[dict], float]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+    
+    def cached(self, jurisdiction: str) -> Optional[Tuple[str, List[dict]]]:
+        """Rule set served without touching the database, if it was confirmed recently"""
+        entry = self._rule_sets.get(jurisdiction)
+        if entry and time.monotonic() - entry[2] < settings.compliance_rules_probe_interval:
+            return entry[0], entry[1]
+        return None
+    
+    def get(self, jurisdiction: str) -> Optional[Tuple[str, List[dict]]]:
+        entry = self._rule_sets.get(jurisdiction)
+        return (entry[0], entry[1]) if entry else None
+    
+    def store(self, jurisdiction: str, version: str, rules: List[dict]):
+        self._rule_sets[jurisdiction] = (version, rules, time.monotonic())
+    
+    def lock(self, jurisdiction: str) -> asyncio.Lock:
+        return self._locks.setdefault(jurisdiction, asyncio.Lock())
+    
+    def invalidate(self, jurisdiction: Optional[str] = None):
+        """Drop one jurisdiction's rule set, or all of them"""
+        if jurisdiction is None:
+            self._rule_sets.clear()
+        else:
+            self._rule_sets.pop(jurisdiction.upper(), None)
+    
+    def status(self) -> dict:
+        """Cached rule set versions for /health/detailed"""
+        return {
+            jurisdiction: {"version": version, "rules": len(rules)}
+            for jurisdiction, (version, rules, _) in self._rule_sets.items()
+        }
+
+
+# Shared by every DatabaseManager in this process; change notifications invalidate it
+compliance_rule_cache = ComplianceRuleCache()
+
+
 class DatabaseManager:
     """Database operations manager"""
     
@@ -172,10 +217,27 @@ class DatabaseManager:
         result = await self.execute_query(query, {"job_id": job_id})
         return dict(result[0]) if result else None
     
+    async def execute_write(self, query: str, params_list: list) -> None:
+        """Execute a write statement once per parameter set and commit"""
+        try:
+            async with self.session_maker() as session:
+                await session.execute(text(query), params_list)
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Write execution failed: {e}")
+            raise
+
     async def save_matching_score(self, job_id: str, talent_id: str, scores: dict) -> None:
         """Save matching scores to database"""
+        await self.save_matching_scores(job_id, [(talent_id, scores)])
+
+    async def save_matching_scores(self, job_id: str, talent_scores: list) -> None:
+        """Bulk upsert matching scores for a job from (talent_id, scores) pairs"""
+        if not talent_scores:
+            return
+
         query = """
-        INSERT INTO matching.job_talent_scores 
+        INSERT INTO matching.job_talent_scores
         (job_id, talent_id, overall_score, skills_score, experience_score, 
          location_score, availability_score, salary_score, ai_explanation, 
          confidence_level, calculation_version)
@@ -196,32 +258,67 @@ class DatabaseManager:
             calculation_version = :calculation_version
         """
         
-        params = {
-            "job_id": job_id,
-            "talent_id": talent_id,
-            "overall_score": scores.get("overall_score", 0),
-            "skills_score": scores.get("skills_score", 0),
-            "experience_score": scores.get("experience_score", 0),
-            "location_score": scores.get("location_score", 0),
-            "availability_score": scores.get("availability_score", 0),
-            "salary_score": scores.get("salary_score", 0),
-            "ai_explanation": scores.get("explanation", ""),
-            "confidence_level": scores.get("confidence", 0.8),
-            "calculation_version": "2.0"
-        }
-        
-        await self.execute_query(query, params)
+        params_list = [
+            {
+                "job_id": job_id,
+                "talent_id": talent_id,
+                "overall_score": scores.get("overall_score", 0),
+                "skills_score": scores.get("skills_score", 0),
+                "experience_score": scores.get("experience_score", 0),
+                "location_score": scores.get("location_score", 0),
+                "availability_score": scores.get("availability_score", 0),
+                "salary_score": scores.get("salary_score", 0),
+                "ai_explanation": scores.get("explanation", ""),
+                "confidence_level": scores.get("confidence", 0.8),
+                "calculation_version": "2.0"
+            }
+            for talent_id, scores in talent_scores
+        ]
+
+        await self.execute_write(query, params_list)
     
     async def get_compliance_rules(self, jurisdiction: str) -> list:
         """Get compliance rules for jurisdiction"""
-        query = """
-        SELECT rule_category, rule_name, rule_description, rule_parameters, severity
-        FROM compliance.regulatory_rules
-        WHERE jurisdiction = :jurisdiction AND is_active = true
-        ORDER BY severity DESC, rule_category
-        """
-        result = await self.execute_query(query, {"jurisdiction": jurisdiction.upper()})
-        return [dict(row) for row in result]
+        _, rules = await self.get_compliance_rule_set(jurisdiction)
+        return list(rules)
+    
+    async def get_compliance_rule_set(self, jurisdiction: str) -> Tuple[str, List[dict]]:
+        """Versioned active rules for a jurisdiction, refetched only when the version moved"""
+        jurisdiction = jurisdiction.upper()
+        rule_set = compliance_rule_cache.cached(jurisdiction)
+        if rule_set:
+            return rule_set
+        
+        async with compliance_rule_cache.lock(jurisdiction):
+            rule_set = compliance_rule_cache.cached(jurisdiction)
+            if rule_set:
+                return rule_set
+            
+            # Row count catches deletes that max(updated_at) alone would miss
+            probe = await self.execute_query("""
+            SELECT COUNT(*), MAX(updated_at)
+            FROM compliance.regulatory_rules
+            WHERE jurisdiction = :jurisdiction
+            """, {"jurisdiction": jurisdiction})
+            count, updated_at = probe[0]
+            version = f"{count}:{updated_at.isoformat() if updated_at else 'none'}"
+            
+            previous = compliance_rule_cache.get(jurisdiction)
+            if previous and previous[0] == version:
+                rules = previous[1]
+            else:
+                query = """
+                SELECT id, rule_category, rule_name, rule_description, rule_parameters, severity
+                FROM compliance.regulatory_rules
+                WHERE jurisdiction = :jurisdiction AND is_active = true
+                ORDER BY severity DESC, rule_category
+                """
+                result = await self.execute_query(query, {"jurisdiction": jurisdiction})
+                rules = [dict(row) for row in result]
+                logger.info(f"Loaded {len(rules)} compliance rules for {jurisdiction} (version {version})")
+            
+            compliance_rule_cache.store(jurisdiction, version, rules)
+            return version, rules
     
     async def save_compliance_check(self, check_data: dict) -> None:
         """Save compliance check results"""
@@ -85,6 +85,57 @@ async def check_redis_health() -> dict:
         return {"status": "unhealthy", "error": str(e)}
 
 
+# Member every complete top-K list holds, scored below any match, so a job
+# with no matches still has a list and is not rebuilt from SQL on each read
+TOP_K_MARKER = "__complete__"
+
+# Fold matches into a top-K list in one step, so concurrent updates cannot
+# interleave between reading the list and writing it.
+# KEYS: topk:{job_id}, topk:{job_id}:data, then topk_jobs:{talent_id} per match
+# ARGV: K, job_id, index TTL, then talent_id, overall_score, row per match
+UPDATE_TOP_MATCHES_SCRIPT = """
+local key, data_key = KEYS[1], KEYS[2]
+if redis.call('EXISTS', key) == 0 then
+    return 0
+end
+local k = tonumber(ARGV[1])
+local marked = redis.call('ZSCORE', key, ARGV[4]) and 1 or 0
+local size = redis.call('ZCARD', key) - marked
+
+if size >= k then
+    for i = 5, #ARGV, 3 do
+        local previous = redis.call('ZSCORE', key, ARGV[i])
+        if previous and tonumber(ARGV[i + 1]) < tonumber(previous) then
+            -- A member lost rank, so rows trimmed earlier may now outrank it
+            redis.call('DEL', key, data_key)
+            return 0
+        end
+    end
+end
+
+for i = 5, #ARGV, 3 do
+    redis.call('ZADD', key, ARGV[i + 1], ARGV[i])
+    redis.call('HSET', data_key, ARGV[i], ARGV[i + 2])
+    redis.call('SADD', KEYS[3 + (i - 5) / 3], ARGV[2])
+    redis.call('EXPIRE', KEYS[3 + (i - 5) / 3], ARGV[3])
+end
+-- An empty list has no data hash until now; it expires with the list
+local ttl = redis.call('PTTL', key)
+if ttl > 0 then
+    redis.call('PEXPIRE', data_key, ttl)
+end
+
+-- The marker ranks lowest, so the overflow starts right after it
+local overflow = redis.call('ZCARD', key) - marked - k
+if overflow > 0 then
+    local trimmed = redis.call('ZRANGE', key, marked, marked + overflow - 1)
+    redis.call('ZREMRANGEBYRANK', key, marked, marked + overflow - 1)
+    redis.call('HDEL', data_key, unpack(trimmed))
+end
+return 1
+"""
+
+
 class RedisManager:
     """Redis operations manager with caching utilities"""
     
@@ -156,6 +207,47 @@ class RedisManager:
             logger.error(f"Redis delete error for key {key}: {e}")
             return False
     
+    async def delete_many(self, keys: list) -> int:
+        """Delete several keys from Redis in one round trip"""
+        try:
+            if not self.client or not keys:
+                return 0
+            
+            return await self.client.delete(*keys)
+            
+        except Exception as e:
+            logger.error(f"Redis delete error for {len(keys)} keys: {e}")
+            return 0
+    
+    async def get_many_json(self, keys: list) -> list:
+        """Get several JSON values in one round trip; misses and errors come back as None"""
+        try:
+            if not self.client or not keys:
+                return [None] * len(keys)
+            
+            values = await self.client.mget(keys)
+            return [json.loads(value) if value is not None else None for value in values]
+            
+        except Exception as e:
+            logger.error(f"Redis mget error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+    
+    async def set_many_json(self, values: dict, ttl: Optional[int] = None) -> bool:
+        """Set several JSON values with a shared TTL in one round trip"""
+        try:
+            if not self.client or not values:
+                return False
+            
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.set(key, json.dumps(value), ex=ttl or self.default_ttl)
+                await pipe.execute()
+            return True
+            
+        except Exception as e:
+            logger.error(f"Redis pipelined set error for {len(values)} keys: {e}")
+            return False
+    
     async def exists(self, key: str) -> bool:
         """Check if key exists in Redis"""
         try:
@@ -245,13 +337,152 @@ class RedisManager:
     async def cache_match_result(self, job_id: str, talent_id: str, result: dict) -> bool:
         """Cache matching result"""
         key = f"match:{job_id}:{talent_id}"
-        return await self.set(key, result, ttl=3600)  # Cache for 1 hour
+        return await self.set(key, result, ttl=settings.match_cache_ttl)
     
     async def get_cached_match(self, job_id: str, talent_id: str) -> Optional[dict]:
         """Get cached matching result"""
         key = f"match:{job_id}:{talent_id}"
         return await self.get(key)
     
+    # Top-K match list methods
+    # topk:{job_id} is a sorted set of talent_id -> overall_score holding the
+    # job's best `match_top_k` matches; topk:{job_id}:data holds each entry's
+    # serialized match row so reads never touch Postgres.
+    def _top_k_keys(self, job_id: str) -> tuple[str, str]:
+        return f"topk:{job_id}", f"topk:{job_id}:data"
+
+    # topk_jobs:{talent_id} is a set of the job ids whose top-K list the talent
+    # was added to. Entries are not removed when a talent is trimmed from a
+    # list, so readers check membership; a list's expiry is only set when it is
+    # rebuilt, so the index entries for its members always outlive it.
+    def _top_k_jobs_key(self, talent_id: str) -> str:
+        return f"topk_jobs:{talent_id}"
+
+    def _index_top_matches(self, pipe, job_id: str, talent_ids: list) -> None:
+        for talent_id in talent_ids:
+            jobs_key = self._top_k_jobs_key(talent_id)
+            pipe.sadd(jobs_key, job_id)
+            pipe.expire(jobs_key, settings.match_top_k_ttl)
+
+    async def get_top_matches(self, job_id: str, limit: int,
+                              min_score: float = 0.0) -> Optional[list]:
+        """Get the best matches for a job from its top-K list, None on a miss"""
+        try:
+            if not self.client:
+                return None
+
+            key, data_key = self._top_k_keys(job_id)
+            talent_ids = await self.client.zrevrangebyscore(
+                key, "+inf", min_score, start=0, num=limit
+            )
+            if not talent_ids:
+                return [] if await self.client.exists(key) else None
+
+            rows = await self.client.hmget(data_key, talent_ids)
+            if any(row is None for row in rows):
+                # Sorted set and data hash out of sync, rebuild from SQL
+                return None
+
+            return [json.loads(row) for row in rows]
+
+        except Exception as e:
+            logger.error(f"Redis top-K read error for job {job_id}: {e}")
+            return None
+
+    async def set_top_matches(self, job_id: str, matches: list) -> bool:
+        """Replace a job's top-K list with matches sorted by overall_score"""
+        try:
+            if not self.client:
+                return False
+
+            key, data_key = self._top_k_keys(job_id)
+            matches = matches[:settings.match_top_k]
+
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.delete(key, data_key)
+                # The marker keeps an empty list cached until it expires
+                pipe.zadd(key, {TOP_K_MARKER: float("-inf"), **{m["talent_id"]: m["overall_score"] for m in matches}})
+                pipe.expire(key, settings.match_top_k_ttl)
+                if matches:
+                    pipe.hset(data_key, mapping={m["talent_id"]: json.dumps(m) for m in matches})
+                    pipe.expire(data_key, settings.match_top_k_ttl)
+                    self._index_top_matches(pipe, job_id, [m["talent_id"] for m in matches])
+                await pipe.execute()
+            return True
+
+        except Exception as e:
+            logger.error(f"Redis top-K write error for job {job_id}: {e}")
+            return False
+
+    async def update_top_matches(self, job_id: str, matches: list) -> bool:
+        """Fold freshly upserted matches into a job's top-K list and trim it to K, atomically"""
+        try:
+            if not self.client or not matches:
+                return False
+
+            key, data_key = self._top_k_keys(job_id)
+            talent_ids = [m["talent_id"] for m in matches]
+            args = [settings.match_top_k, job_id, settings.match_top_k_ttl, TOP_K_MARKER]
+            for match in matches:
+                args += [match["talent_id"], match["overall_score"], json.dumps(match)]
+
+            # Only a complete list can be maintained incrementally; without one
+            # the next read rebuilds it from SQL. The list keeps the expiry set
+            # when it was built, which bounds how long updates can drift from SQL.
+            update = self.client.register_script(UPDATE_TOP_MATCHES_SCRIPT)
+            updated = await update(
+                keys=[key, data_key] + [self._top_k_jobs_key(talent_id) for talent_id in talent_ids],
+                args=args
+            )
+            return bool(updated)
+
+        except Exception as e:
+            logger.error(f"Redis top-K update error for job {job_id}: {e}")
+            return False
+
+    async def drop_top_matches(self, job_id: str) -> bool:
+        """Drop a job's top-K list so the next read rebuilds it from SQL"""
+        return await self.delete_many(list(self._top_k_keys(job_id))) > 0
+
+    async def find_top_match_jobs(self, talent_id: str) -> list:
+        """Find the jobs whose top-K list contains a talent"""
+        try:
+            if not self.client:
+                return []
+
+            jobs_key = self._top_k_jobs_key(talent_id)
+            candidates = [job_id.decode('utf-8') for job_id in await self.client.smembers(jobs_key)]
+            if not candidates:
+                return []
+
+            async with self.client.pipeline(transaction=False) as pipe:
+                for job_id in candidates:
+                    pipe.zscore(self._top_k_keys(job_id)[0], talent_id)
+                scores = await pipe.execute()
+
+            job_ids = [job_id for job_id, score in zip(candidates, scores) if score is not None]
+            stale = [job_id for job_id, score in zip(candidates, scores) if score is None]
+            if stale:
+                await self.client.srem(jobs_key, *stale)
+            return job_ids
+
+        except Exception as e:
+            logger.error(f"Redis top-K index error for talent {talent_id}: {e}")
+            return []
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete every key matching a glob pattern"""
+        try:
+            if not self.client:
+                return 0
+
+            keys = [key async for key in self.client.scan_iter(match=pattern, count=500)]
+            return await self.delete_many(keys)
+
+        except Exception as e:
+            logger.error(f"Redis delete error for pattern {pattern}: {e}")
+            return 0
+
     # Rate limiting methods
     async def check_rate_limit(self, identifier: str, limit: int, window: int) -> tuple[bool, int]:
         """Check rate limit for identifier"""
@@ -73,6 +73,27 @@ class Settings(BaseSettings):
     # Caching
     cache_ttl: int = Field(default=3600, env="CACHE_TTL")  # 1 hour
     embedding_cache_ttl: int = Field(default=86400, env="EMBEDDING_CACHE_TTL")  # 24 hours
+    # Entity caches are invalidated on change, so their TTLs only bound orphaned keys
+    job_analysis_cache_ttl: int = Field(default=604800, env="JOB_ANALYSIS_CACHE_TTL")  # 7 days
+    match_cache_ttl: int = Field(default=604800, env="MATCH_CACHE_TTL")  # 7 days
+    
+    # Change-Driven Cache Invalidation
+    enable_change_invalidation: bool = Field(default=True, env="ENABLE_CHANGE_INVALIDATION")
+    change_invalidation_mode: str = Field(default="listen", env="CHANGE_INVALIDATION_MODE")  # listen|poll
+    change_poll_interval: int = Field(default=30, env="CHANGE_POLL_INTERVAL")  # seconds
+    change_debounce_seconds: float = Field(default=1.0, env="CHANGE_DEBOUNCE_SECONDS")
+    
+    # Cache Warming
+    enable_cache_warming: bool = Field(default=True, env="ENABLE_CACHE_WARMING")
+    cache_warm_startup_delay: int = Field(default=10, env="CACHE_WARM_STARTUP_DELAY")  # seconds
+    cache_warm_interval: int = Field(default=900, env="CACHE_WARM_INTERVAL")  # 15 minutes
+    cache_warm_max_jobs: int = Field(default=50, env="CACHE_WARM_MAX_JOBS")  # per cycle
+    cache_warm_time_budget: int = Field(default=120, env="CACHE_WARM_TIME_BUDGET")  # seconds per cycle
+    cache_warm_candidates_per_job: int = Field(default=50, env="CACHE_WARM_CANDIDATES_PER_JOB")
+    
+    # Currency Rates (same file as the compliance engine's)
+    currency_rates_path: str = Field(default="/etc/iworkz/currency_rates.json", env="CURRENCY_RATES_PATH")
+    currency_refresh_seconds: int = Field(default=300, env="CURRENCY_REFRESH_SECONDS")
     
     # Monitoring
     sentry_dsn: Optional[str] = Field(default=None, env="SENTRY_DSN")
@@ -94,6 +115,27 @@ class Settings(BaseSettings):
         default=["UK", "DE", "AU", "US", "CA", "FR", "NL", "SG", "JP"],
         env="SUPPORTED_JURISDICTIONS"
     )
+    # Batched rule analysis: one LLM call judges several rules against the same entity context
+    compliance_batch_analysis: bool = Field(default=True, env="COMPLIANCE_BATCH_ANALYSIS")
+    compliance_batch_token_budget: int = Field(default=3000, env="COMPLIANCE_BATCH_TOKEN_BUDGET")  # prompt tokens per call
+    compliance_verdict_tokens: int = Field(default=250, env="COMPLIANCE_VERDICT_TOKENS")  # completion tokens per rule
+    # Resolve rules with machine-checkable parameters locally; only ambiguous ones go to the LLM
+    compliance_local_prescreen: bool = Field(default=True, env="COMPLIANCE_LOCAL_PRESCREEN")
+    # Verdict keys change with the rule or the fields it reads, so the TTL only bounds orphaned keys
+    compliance_verdict_cache_ttl: int = Field(default=604800, env="COMPLIANCE_VERDICT_CACHE_TTL")  # 7 days
+    compliance_llm_concurrency: int = Field(default=8, env="COMPLIANCE_LLM_CONCURRENCY")  # in-flight LLM calls
+    compliance_bulk_timeout: float = Field(default=60.0, env="COMPLIANCE_BULK_TIMEOUT")  # seconds
+    # Cached rule sets are re-validated with a version probe at most this often; edits notify immediately
+    compliance_rules_probe_interval: int = Field(default=60, env="COMPLIANCE_RULES_PROBE_INTERVAL")  # seconds
+    
+    # Compliance engine: deterministic wage, hours, probation and consent checks
+    enable_compliance_engine: bool = Field(default=True, env="ENABLE_COMPLIANCE_ENGINE")
+    compliance_engine_url: str = Field(default="http://localhost:8003", env="COMPLIANCE_ENGINE_URL")
+    use_mock_compliance_engine: bool = Field(default=False, env="USE_MOCK_COMPLIANCE_ENGINE")
+    compliance_engine_timeout: float = Field(default=10.0, env="COMPLIANCE_ENGINE_TIMEOUT")  # seconds
+    compliance_engine_batch_size: int = Field(default=100, env="COMPLIANCE_ENGINE_BATCH_SIZE")  # checks per request
+    compliance_engine_batch_window_ms: int = Field(default=5, env="COMPLIANCE_ENGINE_BATCH_WINDOW_MS")
+    compliance_engine_max_connections: int = Field(default=20, env="COMPLIANCE_ENGINE_MAX_CONNECTIONS")
     
     # Skills Database
     skills_database_url: Optional[str] = Field(default=None, env="SKILLS_DATABASE_URL")
@@ -109,6 +151,10 @@ class Settings(BaseSettings):
     # Matching Configuration
     min_match_score: float = Field(default=0.3, env="MIN_MATCH_SCORE")
     max_matches_per_request: int = Field(default=100, env="MAX_MATCHES_PER_REQUEST")
+    match_top_k: int = Field(default=100, env="MATCH_TOP_K")  # Matches kept per job in topk:{job_id}
+    match_top_k_ttl: int = Field(default=86400, env="MATCH_TOP_K_TTL")  # 24 hours
+    candidate_pool_size: int = Field(default=500, env="CANDIDATE_POOL_SIZE")
+    candidate_min_experience_ratio: float = Field(default=0.5, env="CANDIDATE_MIN_EXPERIENCE_RATIO")
     
     # Rate Limiting
     rate_limit_requests: int = Field(default=1000, env="RATE_LIMIT_REQUESTS")
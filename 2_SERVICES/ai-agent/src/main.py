@@ -29,6 +29,10 @@ from src.routers import (
 from src.utils.logger import setup_logger
 from src.services.ai_manager import AIManager
 from src.services.mock_ai_manager import MockAIManager
+from src.services.cache_warmer import CacheWarmer
+from src.services.change_listener import ChangeListener
+from src.services.compliance_engine_client import get_compliance_engine_client
+from src.services.currency import get_currency_service
 
 # Setup logging
 logger = setup_logger(__name__)
@@ -37,11 +41,17 @@ settings = get_settings()
 # Global AI Manager instance
 ai_manager: AIManager = None
 
+# Global cache warmer instance
+cache_warmer: CacheWarmer = None
+
+# Global change listener instance
+change_listener: ChangeListener = None
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan events"""
-    global ai_manager
+    global ai_manager, cache_warmer, change_listener
     
     logger.info("Starting iWORKZ AI Agent Service...")
     
@@ -66,10 +76,26 @@ async def lifespan(app: FastAPI):
         app.state.ai_manager = ai_manager
         logger.info("AI Manager initialized")
         
+        # Start warming caches for active jobs, yielding to interactive traffic
+        cache_warmer = CacheWarmer(ai_manager, load_probe=lambda: app.state.inflight_requests)
+        cache_warmer.start()
+        app.state.cache_warmer = cache_warmer
+        logger.info("Cache warmer started")
+        
+        # Invalidate and rescore cached entities when their rows change
+        change_listener = ChangeListener(ai_manager)
+        change_listener.start()
+        app.state.change_listener = change_listener
+        logger.info("Change listener started")
+        
+        # Pick up exchange rate file changes without a restart
+        get_currency_service().start()
+        app.state.currency_service = get_currency_service()
+        
         logger.info("✅ AI Agent Service startup complete")
         
         yield
-        
+    
     except Exception as e:
         logger.error(f"Failed to start AI Agent Service: {e}")
         raise
@@ -78,6 +104,17 @@ async def lifespan(app: FastAPI):
         # Cleanup
         logger.info("Shutting down AI Agent Service...")
         
+        await get_currency_service().stop()
+        await get_compliance_engine_client().close()
+        
+        if change_listener:
+            await change_listener.stop()
+            logger.info("Change listener stopped")
+        
+        if cache_warmer:
+            await cache_warmer.stop()
+            logger.info("Cache warmer stopped")
+        
         if ai_manager:
             await ai_manager.cleanup()
             logger.info("AI Manager cleaned up")
@@ -116,6 +153,22 @@ app.add_middleware(
 )
 
 
+# Track in-flight interactive requests so background work can yield to them
+app.state.inflight_requests = 0
+
+
+@app.middleware("http")
+async def track_inflight_requests(request, call_next):
+    if request.url.path.startswith("/health"):
+        return await call_next(request)
+    
+    app.state.inflight_requests += 1
+    try:
+        return await call_next(request)
+    finally:
+        app.state.inflight_requests -= 1
+
+
 # Custom exception handlers
 @app.exception_handler(ValueError)
 async def value_error_handler(request, exc):
@@ -176,6 +229,29 @@ async def detailed_health_check():
         redis_status = await check_redis_health()
         health_status["components"]["redis"] = redis_status
         
+        # Check cache warm-up progress
+        if hasattr(app.state, 'cache_warmer') and app.state.cache_warmer:
+            health_status["components"]["cache_warmer"] = app.state.cache_warmer.status()
+        
+        # Check change-driven invalidation
+        if hasattr(app.state, 'change_listener') and app.state.change_listener:
+            health_status["components"]["change_listener"] = app.state.change_listener.status()
+        
+        # Check exchange rates used for salary scoring
+        if hasattr(app.state, 'currency_service') and app.state.currency_service:
+            health_status["components"]["currency_rates"] = app.state.currency_service.status()
+        
+        # Check cached compliance rule sets
+        from src.config.database import compliance_rule_cache
+        health_status["components"]["compliance_rules"] = {
+            "status": "healthy",
+            "rule_sets": compliance_rule_cache.status()
+        }
+        
+        # Check compliance engine delegation
+        if settings.enable_compliance_engine:
+            health_status["components"]["compliance_engine"] = get_compliance_engine_client().status()
+        
         # Overall status
         component_statuses = [comp["status"] for comp in health_status["components"].values()]
         if all(status == "healthy" for status in component_statuses):
@@ -186,7 +262,7 @@ async def detailed_health_check():
             health_status["status"] = "degraded"
         
         return health_status
-        
+    
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         return {
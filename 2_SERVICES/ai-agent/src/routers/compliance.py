@@ -3,6 +3,8 @@ Compliance Checking Router
 AI-powered regulatory compliance verification for multiple jurisdictions
 """
 
+import asyncio
+import json
 import time
 import uuid
 from typing import List, Dict, Any, Optional, Literal
@@ -11,13 +13,20 @@ from pydantic import BaseModel, Field
 from enum import Enum
 
 from src.services.ai_manager import AIManager
+from src.services.compliance_engine_client import engine_compliance_type, engine_verdicts, get_compliance_engine_client
+from src.services.rule_evaluator import prescreen_rule
+from src.services.verdict_cache import VerdictCache
 from src.config.database import DatabaseManager
-from src.config.redis_client import RedisManager
+from src.config.settings import get_settings
 from src.utils.logger import setup_logger, log_compliance_check
 
 logger = setup_logger(__name__)
+settings = get_settings()
 router = APIRouter()
 
+# In-flight compliance LLM calls, shared by single and bulk checks
+llm_slots = asyncio.Semaphore(settings.compliance_llm_concurrency)
+
 
 class EntityType(str, Enum):
     TALENT = "talent"
@@ -49,6 +58,17 @@ class ComplianceIssue(BaseModel):
     affected_fields: List[str] = []
 
 
+class RuleVerdict(BaseModel):
+    rule_id: Optional[str] = None
+    rule_category: str
+    rule_name: str
+    compliant: bool
+    compliance_score: float
+    resolved_locally: bool = False
+    resolved_by_engine: bool = False
+    reused: bool = Field(default=False, description="Verdict reused because the rule and the fields it reads are unchanged")
+
+
 class ComplianceCheckRequest(BaseModel):
     entity_type: EntityType
     entity_id: str
@@ -71,6 +91,12 @@ class ComplianceCheckResponse(BaseModel):
     checked_at: str
     processing_time_ms: float
     cached: bool = False
+    rules_evaluated: int = 0
+    rules_resolved_locally: int = 0
+    local_resolution_rate: float = Field(default=0.0, description="Share of rules resolved without the LLM")
+    rules_resolved_by_engine: int = 0
+    rules_reused: int = 0
+    rule_verdicts: List[RuleVerdict] = []
 
 
 class BulkComplianceRequest(BaseModel):
@@ -85,6 +111,8 @@ class BulkComplianceResponse(BaseModel):
     processed_entities: int
     processing_time_ms: float
     results: List[ComplianceCheckResponse]
+    failed_entity_ids: List[str] = []
+    timed_out_entity_ids: List[str] = Field(default=[], description="Still running when the bulk timeout expired")
 
 
 class ComplianceRule(BaseModel):
@@ -120,29 +148,14 @@ async def check_compliance(
         logger.info(f"Starting compliance check {check_id} for {request.entity_type} {request.entity_id} in {request.jurisdiction}")
         
         db_manager = DatabaseManager()
-        redis_manager = RedisManager()
         
         # Validate jurisdiction
-        from src.config.settings import get_settings
-        settings = get_settings()
         if request.jurisdiction.upper() not in settings.supported_jurisdictions:
             raise HTTPException(
                 status_code=400, 
                 detail=f"Jurisdiction {request.jurisdiction} not supported"
             )
         
-        # Check cache first
-        cache_key = f"compliance:{request.entity_type}:{request.entity_id}:{request.jurisdiction}"
-        cached_result = None
-        
-        if request.use_cached_results:
-            cached_result = await redis_manager.get(cache_key)
-        
-        if cached_result and request.use_cached_results:
-            cached_result['cached'] = True
-            cached_result['processing_time_ms'] = (time.time() - start_time) * 1000
-            return ComplianceCheckResponse(**cached_result)
-        
         # Get entity data
         entity_data = await get_entity_data(request.entity_type, request.entity_id, db_manager)
         if not entity_data:
@@ -156,59 +169,13 @@ async def check_compliance(
                 detail=f"No compliance rules found for jurisdiction {request.jurisdiction}"
             )
         
-        # Filter rules by check types
-        if "all" not in request.check_types:
-            compliance_rules = [
-                rule for rule in compliance_rules 
-                if rule['rule_category'] in request.check_types
-            ]
-        
-        # Perform AI-powered compliance analysis
-        compliance_result = await analyze_compliance(
-            entity_data, compliance_rules, request.jurisdiction, ai_manager
-        )
-        
-        # Prepare response
-        processing_time = (time.time() - start_time) * 1000
-        
-        response = ComplianceCheckResponse(
-            check_id=check_id,
-            entity_type=request.entity_type,
-            entity_id=request.entity_id,
-            jurisdiction=request.jurisdiction,
-            status=compliance_result['status'],
-            overall_score=compliance_result['overall_score'],
-            confidence_level=compliance_result['confidence_level'],
-            issues_found=compliance_result['issues'],
-            recommendations=compliance_result['recommendations'] if request.include_recommendations else [],
-            checked_at=time.strftime('%Y-%m-%dT%H:%M:%SZ'),
-            processing_time_ms=processing_time,
-            cached=False
-        )
-        
-        # Cache the result (without processing time and cached flag)
-        cache_data = response.dict()
-        cache_data.pop('processing_time_ms', None)
-        cache_data.pop('cached', None)
-        await redis_manager.set(cache_key, cache_data, ttl=86400)  # Cache for 24h
+        compliance_rules = filter_rules_by_check_types(compliance_rules, request.check_types)
         
-        # Save to database in background
-        background_tasks.add_task(
-            save_compliance_check,
-            db_manager,
-            check_id,
-            request,
-            compliance_result
+        return await run_compliance_check(
+            check_id, request, entity_data, compliance_rules,
+            ai_manager, db_manager, background_tasks, start_time
         )
-        
-        # Log the result
-        log_compliance_check(
-            logger, request.entity_id, request.jurisdiction, 
-            len(compliance_result['issues']), processing_time, check_id
-        )
-        
-        return response
-        
+    
     except Exception as e:
         logger.error(f"Compliance check failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -217,6 +184,7 @@ async def check_compliance(
 @router.post("/bulk-check", response_model=BulkComplianceResponse)
 async def bulk_compliance_check(
     request: BulkComplianceRequest,
+    background_tasks: BackgroundTasks,
     ai_manager: AIManager = Depends(get_ai_manager)
 ):
     """
@@ -227,29 +195,64 @@ async def bulk_compliance_check(
     try:
         logger.info(f"Starting bulk compliance check for {len(request.entity_ids)} entities")
         
-        results = []
+        if request.jurisdiction.upper() not in settings.supported_jurisdictions:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Jurisdiction {request.jurisdiction} not supported"
+            )
+        
+        db_manager = DatabaseManager()
+        entity_ids = list(dict.fromkeys(request.entity_ids))
+        
+        # One rules fetch and one entity query for the whole batch
+        compliance_rules, entities = await asyncio.gather(
+            db_manager.get_compliance_rules(request.jurisdiction),
+            get_entities_data(request.entity_type, entity_ids, db_manager)
+        )
+        if not compliance_rules:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"No compliance rules found for jurisdiction {request.jurisdiction}"
+            )
+        compliance_rules = filter_rules_by_check_types(compliance_rules, request.check_types)
         
-        for entity_id in request.entity_ids:
-            try:
-                check_request = ComplianceCheckRequest(
+        failed_entity_ids = [entity_id for entity_id in entity_ids if entity_id not in entities]
+        tasks = {
+            entity_id: asyncio.create_task(run_compliance_check(
+                str(uuid.uuid4()),
+                ComplianceCheckRequest(
                     entity_type=request.entity_type,
                     entity_id=entity_id,
                     jurisdiction=request.jurisdiction,
                     check_types=request.check_types,
                     use_cached_results=True
-                )
-                
-                result = await check_compliance(
-                    check_request, 
-                    BackgroundTasks(),
-                    ai_manager
-                )
-                results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Failed to check compliance for entity {entity_id}: {e}")
-                # Continue with other entities
+                ),
+                entities[entity_id], compliance_rules,
+                ai_manager, db_manager, background_tasks, time.time()
+            ))
+            for entity_id in entity_ids if entity_id in entities
+        }
+        
+        # Entities share the LLM slots, so the batch takes roughly its slowest entity, not the sum
+        timed_out_entity_ids = []
+        if tasks:
+            _, pending = await asyncio.wait(tasks.values(), timeout=settings.compliance_bulk_timeout)
+            for task in pending:
+                task.cancel()
+            timed_out_entity_ids = [entity_id for entity_id, task in tasks.items() if task in pending]
+        
+        results = []
+        for entity_id, task in tasks.items():
+            if entity_id in timed_out_entity_ids:
+                continue
+            if task.exception():
+                logger.error(f"Failed to check compliance for entity {entity_id}: {task.exception()}")
+                failed_entity_ids.append(entity_id)
                 continue
+            results.append(task.result())
+        
+        if timed_out_entity_ids:
+            logger.warning(f"Bulk compliance check timed out for {len(timed_out_entity_ids)} entities")
         
         processing_time = (time.time() - start_time) * 1000
         
@@ -257,9 +260,13 @@ async def bulk_compliance_check(
             total_entities=len(request.entity_ids),
             processed_entities=len(results),
             processing_time_ms=processing_time,
-            results=results
+            results=results,
+            failed_entity_ids=failed_entity_ids,
+            timed_out_entity_ids=timed_out_entity_ids
         )
-        
+    
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Bulk compliance check failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -272,16 +279,17 @@ async def get_compliance_rules(jurisdiction: str):
     """
     try:
         db_manager = DatabaseManager()
-        rules = await db_manager.get_compliance_rules(jurisdiction)
+        version, rules = await db_manager.get_compliance_rule_set(jurisdiction)
         
         return {
             "jurisdiction": jurisdiction.upper(),
+            "rules_version": version,
             "total_rules": len(rules),
             "rules": [
                 ComplianceRule(**rule) for rule in rules
             ]
         }
-        
+    
     except Exception as e:
         logger.error(f"Failed to get compliance rules: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -292,9 +300,6 @@ async def get_supported_jurisdictions():
     """
     Get list of supported jurisdictions
     """
-    from src.config.settings import get_settings
-    settings = get_settings()
-    
     jurisdiction_details = {
         "UK": {"name": "United Kingdom", "code": "UK", "region": "Europe"},
         "DE": {"name": "Germany", "code": "DE", "region": "Europe"},
@@ -341,25 +346,158 @@ async def get_entity_data(entity_type: EntityType, entity_id: str,
             return dict(result[0]) if result else None
         else:
             return None
-            
+    
     except Exception as e:
         logger.error(f"Failed to get entity data: {e}")
         return None
 
 
+async def get_entities_data(entity_type: EntityType, entity_ids: List[str],
+                            db_manager: DatabaseManager) -> Dict[str, Dict[str, Any]]:
+    """Get data for many entities of one type with a single query, keyed by requested id"""
+    def is_uuid(value: str) -> bool:
+        try:
+            uuid.UUID(value)
+            return True
+        except ValueError:
+            return False
+    
+    # Malformed ids cannot match and would fail the whole uuid[] cast
+    ids = [entity_id for entity_id in entity_ids if is_uuid(entity_id)]
+    if not ids:
+        return {}
+    
+    if entity_type == EntityType.TALENT:
+        query = """
+        SELECT t.*, p.first_name, p.last_name, p.email
+        FROM users.talents t
+        JOIN users.profiles p ON t.profile_id = p.id
+        WHERE t.id = ANY(CAST(:ids AS uuid[])) OR t.profile_id = ANY(CAST(:ids AS uuid[]))
+        """
+        id_columns = ('id', 'profile_id')
+    elif entity_type == EntityType.EMPLOYER:
+        query = """
+        SELECT e.*, p.email, p.first_name, p.last_name
+        FROM users.employers e
+        JOIN users.profiles p ON e.profile_id = p.id
+        WHERE e.id = ANY(CAST(:ids AS uuid[]))
+        """
+        id_columns = ('id',)
+    elif entity_type == EntityType.JOB_POSTING:
+        query = """
+        SELECT j.*, e.company_name, e.company_size, e.industry
+        FROM jobs.postings j
+        JOIN users.employers e ON j.employer_id = e.id
+        WHERE j.id = ANY(CAST(:ids AS uuid[]))
+        """
+        id_columns = ('id',)
+    elif entity_type == EntityType.CONTRACT:
+        query = """
+        SELECT * FROM contracts.agreements
+        WHERE id = ANY(CAST(:ids AS uuid[]))
+        """
+        id_columns = ('id',)
+    else:
+        return {}
+    
+    requested = {entity_id.lower(): entity_id for entity_id in ids}
+    entities = {}
+    for row in await db_manager.execute_query(query, {"ids": ids}):
+        entity = dict(row)
+        for column in id_columns:
+            entity_id = requested.get(str(entity.get(column)).lower())
+            if entity_id:
+                entities[entity_id] = entity
+    return entities
+
+
+def filter_rules_by_check_types(rules: List[Dict], check_types: List[str]) -> List[Dict]:
+    """Keep the rules in the requested categories"""
+    if "all" in check_types:
+        return rules
+    return [rule for rule in rules if rule['rule_category'] in check_types]
+
+
+async def run_compliance_check(check_id: str, request: ComplianceCheckRequest, entity_data: Dict[str, Any],
+                               compliance_rules: List[Dict], ai_manager: AIManager, db_manager: DatabaseManager,
+                               background_tasks: BackgroundTasks, start_time: float) -> ComplianceCheckResponse:
+    """Analyze one loaded entity against loaded rules and record the check"""
+    # Perform AI-powered compliance analysis
+    compliance_result = await analyze_compliance(
+        entity_data, compliance_rules, request.jurisdiction, ai_manager,
+        use_cached_verdicts=request.use_cached_results, entity_type=request.entity_type.value
+    )
+    
+    # Prepare response
+    processing_time = (time.time() - start_time) * 1000
+    
+    response = ComplianceCheckResponse(
+        check_id=check_id,
+        entity_type=request.entity_type,
+        entity_id=request.entity_id,
+        jurisdiction=request.jurisdiction,
+        status=compliance_result['status'],
+        overall_score=compliance_result['overall_score'],
+        confidence_level=compliance_result['confidence_level'],
+        issues_found=compliance_result['issues'],
+        recommendations=compliance_result['recommendations'] if request.include_recommendations else [],
+        checked_at=time.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        processing_time_ms=processing_time,
+        cached=bool(compliance_result['rule_verdicts']) and all(
+            verdict.reused for verdict in compliance_result['rule_verdicts']
+        ),
+        rules_evaluated=compliance_result['rules_evaluated'],
+        rules_resolved_locally=compliance_result['rules_resolved_locally'],
+        local_resolution_rate=compliance_result['local_resolution_rate'],
+        rules_resolved_by_engine=compliance_result['rules_resolved_by_engine'],
+        rules_reused=compliance_result['rules_reused'],
+        rule_verdicts=compliance_result['rule_verdicts']
+    )
+    
+    # Save to database in background
+    background_tasks.add_task(
+        save_compliance_check,
+        db_manager,
+        check_id,
+        request,
+        compliance_result
+    )
+    
+    # Log the result
+    log_compliance_check(
+        logger, request.entity_id, request.jurisdiction, 
+        len(compliance_result['issues']), processing_time, check_id
+    )
+    
+    return response
+
+
 async def analyze_compliance(entity_data: Dict[str, Any], rules: List[Dict], 
-                           jurisdiction: str, ai_manager: AIManager) -> Dict[str, Any]:
+                           jurisdiction: str, ai_manager: AIManager,
+                           use_cached_verdicts: bool = True, entity_type: Optional[str] = None) -> Dict[str, Any]:
     """Perform AI-powered compliance analysis"""
     try:
         issues = []
         recommendations = []
         rule_scores = []
+        rule_verdicts = []
         
-        for rule in rules:
-            # Analyze each rule using AI
-            rule_analysis = await analyze_compliance_rule(
-                entity_data, rule, ai_manager
-            )
+        rule_analyses = await analyze_compliance_rules(
+            entity_data, rules, ai_manager, use_cached_verdicts, entity_type=entity_type, jurisdiction=jurisdiction
+        )
+        resolved_locally = sum(1 for analysis in rule_analyses if analysis.get('resolved_locally'))
+        
+        for rule, rule_analysis in zip(rules, rule_analyses):
+            rule_verdicts.append(RuleVerdict(
+                rule_id=str(rule['id']) if rule.get('id') else None,
+                rule_category=rule['rule_category'],
+                rule_name=rule['rule_name'],
+                compliant=rule_analysis['compliant'],
+                compliance_score=rule_analysis['compliance_score'],
+                resolved_locally=rule_analysis.get('resolved_locally', False),
+                resolved_by_engine=rule_analysis.get('resolved_by_engine', False),
+                reused=rule_analysis.get('reused', False)
+            ))
             
             if not rule_analysis['compliant']:
                 issue = ComplianceIssue(
@@ -404,9 +542,15 @@ async def analyze_compliance(entity_data: Dict[str, Any], rules: List[Dict],
             'overall_score': round(overall_score, 3),
             'confidence_level': round(confidence_level, 3),
             'issues': issues,
-            'recommendations': list(set(recommendations))  # Remove duplicates
+            'recommendations': list(set(recommendations)),  # Remove duplicates
+            'rules_evaluated': len(rules),
+            'rules_resolved_locally': resolved_locally,
+            'local_resolution_rate': round(resolved_locally / len(rules), 3) if rules else 0.0,
+            'rules_resolved_by_engine': sum(1 for verdict in rule_verdicts if verdict.resolved_by_engine),
+            'rules_reused': sum(1 for verdict in rule_verdicts if verdict.reused),
+            'rule_verdicts': rule_verdicts
         }
-        
+    
     except Exception as e:
         logger.error(f"Compliance analysis failed: {e}")
         return {
@@ -414,23 +558,230 @@ async def analyze_compliance(entity_data: Dict[str, Any], rules: List[Dict],
             'overall_score': 0.0,
             'confidence_level': 0.1,
             'issues': [],
-            'recommendations': ["Unable to perform compliance analysis due to system error"]
+            'recommendations': ["Unable to perform compliance analysis due to system error"],
+            'rules_evaluated': len(rules),
+            'rules_resolved_locally': 0,
+            'local_resolution_rate': 0.0,
+            'rules_resolved_by_engine': 0,
+            'rules_reused': 0,
+            'rule_verdicts': []
         }
 
 
-async def analyze_compliance_rule(entity_data: Dict[str, Any], rule: Dict, 
-                                ai_manager: AIManager) -> Dict[str, Any]:
-    """Analyze a specific compliance rule using AI"""
-    try:
-        # Create context for AI analysis
-        entity_context = create_entity_context(entity_data)
-        rule_context = f"""
+COMPLIANCE_SYSTEM_PROMPT = """
+You are a regulatory compliance expert. Analyze the provided entity data against 
+the compliance rule and determine if it meets the requirements. Be thorough but 
+practical in your assessment. Consider both letter and spirit of the rule.
+Return only the JSON response, no other text.
+"""
+
+BATCH_COMPLIANCE_SYSTEM_PROMPT = """
+You are a regulatory compliance expert. Analyze the provided entity data against 
+each numbered compliance rule and return one verdict per rule. Be thorough but 
+practical in your assessment. Consider both letter and spirit of each rule.
+Return only the JSON array of verdicts, no other text.
+"""
+
+BATCH_VERDICT_INSTRUCTIONS = """
+Analyze if the entity data complies with each rule above. Return a JSON array with
+exactly one object per rule, in rule order:
+[
+    {
+        "rule": rule number,
+        "compliant": true/false,
+        "compliance_score": 0.0-1.0,
+        "issue_description": "description if non-compliant",
+        "recommendation": "specific recommendation",
+        "affected_fields": ["list", "of", "fields"],
+        "explanation": "brief explanation"
+    }
+]
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token) for prompt budgeting"""
+    return len(text) // 4 + 1
+
+
+def create_rule_context(rule: Dict) -> str:
+    """Create formatted context string for one compliance rule"""
+    return f"""
         Rule Category: {rule['rule_category']}
         Rule Name: {rule['rule_name']}
         Description: {rule['rule_description']}
         Severity: {rule['severity']}
         Parameters: {rule.get('rule_parameters', {})}
         """
+
+
+def chunk_rules_by_budget(entity_context: str, rules: List[Dict]) -> List[List[Dict]]:
+    """Split rules into batches whose prompts fit the token budget and whose verdicts fit max_tokens"""
+    fixed_tokens = estimate_tokens(entity_context) + estimate_tokens(BATCH_VERDICT_INSTRUCTIONS)
+    rule_budget = settings.compliance_batch_token_budget - fixed_tokens
+    max_rules = max(1, settings.max_tokens // settings.compliance_verdict_tokens)
+    
+    chunks: List[List[Dict]] = []
+    chunk: List[Dict] = []
+    chunk_tokens = 0
+    for rule in rules:
+        rule_tokens = estimate_tokens(create_rule_context(rule))
+        # A rule that alone exceeds the budget still gets a chunk of its own
+        if chunk and (chunk_tokens + rule_tokens > rule_budget or len(chunk) >= max_rules):
+            chunks.append(chunk)
+            chunk, chunk_tokens = [], 0
+        chunk.append(rule)
+        chunk_tokens += rule_tokens
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+async def analyze_compliance_rules(entity_data: Dict[str, Any], rules: List[Dict],
+                                   ai_manager: AIManager, use_cached_verdicts: bool = True,
+                                   entity_type: Optional[str] = None,
+                                   jurisdiction: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Analyze all rules, resolving clear cases locally; returns one analysis per rule, in order"""
+    if settings.compliance_local_prescreen:
+        analyses = [prescreen_rule(entity_data, rule) for rule in rules]
+    else:
+        analyses = [None] * len(rules)
+    escalated = [index for index, analysis in enumerate(analyses) if analysis is None]
+    if not escalated:
+        logger.info(f"Resolved all {len(rules)} compliance rules locally")
+        return analyses
+    
+    # Structured checks go to the compliance engine; the LLM only sees what it could not settle
+    delegated = [index for index in escalated if engine_compliance_type(rules[index])]
+    if settings.enable_compliance_engine and delegated and entity_type and jurisdiction:
+        results = await get_compliance_engine_client().check(
+            jurisdiction, entity_type, entity_data,
+            sorted({engine_compliance_type(rules[index]) for index in delegated})
+        )
+        verdicts = engine_verdicts([rules[index] for index in delegated], results, entity_data)
+        for index, verdict in zip(delegated, verdicts):
+            analyses[index] = verdict
+        engine_resolved = len(escalated)
+        escalated = [index for index in escalated if analyses[index] is None]
+        engine_resolved -= len(escalated)
+    else:
+        engine_resolved = 0
+    if not escalated:
+        logger.info(f"Compliance rules: {len(rules) - engine_resolved} resolved locally, {engine_resolved} by the engine")
+        return analyses
+    
+    # Reuse verdicts whose rule and input fields are unchanged since they were analyzed
+    verdict_cache = VerdictCache()
+    keys = {index: verdict_cache.key(entity_data, rules[index]) for index in escalated}
+    if use_cached_verdicts:
+        cached = await verdict_cache.get_many([keys[index] for index in escalated])
+        for index, verdict in zip(escalated, cached):
+            if verdict is not None:
+                analyses[index] = {**verdict, 'reused': True}
+    
+    pending = [index for index in escalated if analyses[index] is None]
+    if pending:
+        ai_analyses = await analyze_compliance_rules_with_ai(
+            entity_data, [rules[index] for index in pending], ai_manager
+        )
+        for index, analysis in zip(pending, ai_analyses):
+            analyses[index] = analysis
+        await verdict_cache.set_many({
+            keys[index]: analyses[index] for index in pending
+            if not analyses[index].get('analysis_failed')
+        })
+    
+    logger.info(
+        f"Compliance rules: {len(rules) - len(escalated) - engine_resolved} resolved locally, "
+        f"{engine_resolved} by the engine, {len(escalated) - len(pending)} reused, {len(pending)} analyzed"
+    )
+    return analyses
+
+
+async def analyze_compliance_rules_with_ai(entity_data: Dict[str, Any], rules: List[Dict],
+                                           ai_manager: AIManager) -> List[Dict[str, Any]]:
+    """Analyze rules with the LLM, batching several per call; returns one analysis per rule, in order"""
+    if not settings.compliance_batch_analysis or len(rules) < 2:
+        return [await analyze_compliance_rule(entity_data, rule, ai_manager) for rule in rules]
+    
+    entity_context = create_entity_context(entity_data)
+    chunks = chunk_rules_by_budget(entity_context, rules)
+    results = await asyncio.gather(*[
+        analyze_compliance_rule_batch(entity_data, entity_context, chunk, ai_manager)
+        for chunk in chunks
+    ])
+    logger.info(f"Analyzed {len(rules)} compliance rules in {len(chunks)} batched calls")
+    return [analysis for chunk_analyses in results for analysis in chunk_analyses]
+
+
+async def analyze_compliance_rule_batch(entity_data: Dict[str, Any], entity_context: str, rules: List[Dict],
+                                        ai_manager: AIManager) -> List[Dict[str, Any]]:
+    """Analyze several rules in one call; rules without a usable verdict fall back to per-rule calls"""
+    verdicts: Dict[int, Dict[str, Any]] = {}
+    try:
+        rules_context = "\n".join(
+            f"[{number}]{create_rule_context(rule)}" for number, rule in enumerate(rules, start=1)
+        )
+        prompt = f"""
+        Entity Data:
+        {entity_context}
+        
+        Compliance Rules:
+        {rules_context}
+        {BATCH_VERDICT_INSTRUCTIONS}
+        """
+        
+        async with llm_slots:
+            result = await ai_manager.chat_completion(
+                prompt=prompt,
+                system_prompt=BATCH_COMPLIANCE_SYSTEM_PROMPT,
+                temperature=0.2,
+                max_tokens=settings.compliance_verdict_tokens * len(rules)
+            )
+        verdicts = parse_batch_verdicts(result['content'], len(rules))
+    
+    except Exception as e:
+        logger.warning(f"Batched rule analysis failed, falling back to per-rule calls: {e}")
+    
+    missing = [number for number in range(1, len(rules) + 1) if number not in verdicts]
+    if missing:
+        if verdicts:
+            logger.warning(f"Batched rule analysis returned no verdict for {len(missing)} of {len(rules)} rules")
+        fallbacks = await asyncio.gather(*[
+            analyze_compliance_rule(entity_data, rules[number - 1], ai_manager) for number in missing
+        ])
+        verdicts.update(zip(missing, fallbacks))
+    
+    return [verdicts[number] for number in range(1, len(rules) + 1)]
+
+
+def parse_batch_verdicts(content: str, rule_count: int) -> Dict[int, Dict[str, Any]]:
+    """Usable verdicts from a batched analysis response, by rule number"""
+    parsed = json.loads(content)
+    if isinstance(parsed, dict):
+        parsed = parsed.get('verdicts', [])
+    if not isinstance(parsed, list):
+        raise ValueError("Batched analysis response is not a JSON array")
+    
+    verdicts = {}
+    for position, verdict in enumerate(parsed, start=1):
+        if not isinstance(verdict, dict) or 'compliant' not in verdict or 'compliance_score' not in verdict:
+            continue
+        number = verdict.pop('rule', position)
+        if isinstance(number, int) and 1 <= number <= rule_count and number not in verdicts:
+            verdict.setdefault('issue_description', '')
+            verdict.setdefault('recommendation', '')
+            verdicts[number] = verdict
+    return verdicts
+
+
+async def analyze_compliance_rule(entity_data: Dict[str, Any], rule: Dict, 
+                                ai_manager: AIManager) -> Dict[str, Any]:
+    """Analyze a specific compliance rule using AI"""
+    try:
+        # Create context for AI analysis
+        entity_context = create_entity_context(entity_data)
+        rule_context = create_rule_context(rule)
         
         prompt = f"""
         Entity Data:
@@ -450,24 +801,17 @@ async def analyze_compliance_rule(entity_data: Dict[str, Any], rule: Dict,
         }}
         """
         
-        system_prompt = """
-        You are a regulatory compliance expert. Analyze the provided entity data against 
-        the compliance rule and determine if it meets the requirements. Be thorough but 
-        practical in your assessment. Consider both letter and spirit of the rule.
-        Return only the JSON response, no other text.
-        """
-        
-        result = await ai_manager.chat_completion(
-            prompt=prompt,
-            system_prompt=system_prompt,
-            temperature=0.2,
-            max_tokens=1000
-        )
+        async with llm_slots:
+            result = await ai_manager.chat_completion(
+                prompt=prompt,
+                system_prompt=COMPLIANCE_SYSTEM_PROMPT,
+                temperature=0.2,
+                max_tokens=1000
+            )
         
-        import json
         analysis = json.loads(result['content'])
         return analysis
-        
+    
     except Exception as e:
         logger.error(f"Rule analysis failed: {e}")
         return {
@@ -476,7 +820,8 @@ async def analyze_compliance_rule(entity_data: Dict[str, Any], rule: Dict,
             'issue_description': f"Unable to analyze rule: {rule['rule_name']}",
             'recommendation': "Manual review required",
             'affected_fields': [],
-            'explanation': "System error during analysis"
+            'explanation': "System error during analysis",
+            'analysis_failed': True
         }
 
 
@@ -531,6 +876,6 @@ async def save_compliance_check(db_manager: DatabaseManager, check_id: str,
         }
         
         await db_manager.save_compliance_check(check_data)
-        
+    
     except Exception as e:
         logger.error(f"Failed to save compliance check to database: {e}")
\ No newline at end of file
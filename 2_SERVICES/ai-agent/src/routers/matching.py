@@ -3,6 +3,7 @@ Job-Candidate Matching Router
 Advanced AI-powered matching algorithms with comprehensive scoring
 """
 
+import json
 import time
 from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
@@ -12,6 +13,8 @@ import numpy as np
 from src.services.ai_manager import AIManager
 from src.config.database import DatabaseManager, get_db_session
 from src.config.redis_client import RedisManager
+from src.config.settings import get_settings
+from src.services.currency import get_currency_service
 from src.utils.logger import setup_logger, log_matching_result
 
 logger = setup_logger(__name__)
@@ -114,39 +117,15 @@ async def match_candidates_to_job(
                 job_data['description'],
                 user_id=str(job_data.get('employer_id'))
             )
-            await redis_manager.set(job_analysis_key, job_analysis, ttl=86400)  # Cache for 24h
+            await redis_manager.set(job_analysis_key, job_analysis, ttl=get_settings().job_analysis_cache_ttl)
         
         # Get candidate pool
         if request.talent_ids:
             # Specific talents requested
-            talent_query = """
-            SELECT t.*, p.first_name, p.last_name, p.email, 
-                   t.skills, t.total_experience_years, t.current_location,
-                   t.salary_expectation_min, t.salary_expectation_max,
-                   t.availability_status, t.remote_work_preference
-            FROM users.talents t
-            JOIN users.profiles p ON t.profile_id = p.id
-            WHERE t.id = ANY(:talent_ids) AND p.is_active = true
-            """
-            candidates = await db_manager.execute_query(
-                talent_query, 
-                {"talent_ids": request.talent_ids}
-            )
+            candidates = await fetch_candidates(db_manager, request.talent_ids)
         else:
-            # Get active candidates matching basic criteria
-            talent_query = """
-            SELECT t.*, p.first_name, p.last_name, p.email,
-                   t.skills, t.total_experience_years, t.current_location,
-                   t.salary_expectation_min, t.salary_expectation_max,
-                   t.availability_status, t.remote_work_preference
-            FROM users.talents t
-            JOIN users.profiles p ON t.profile_id = p.id
-            WHERE p.is_active = true 
-            AND t.availability_status IN ('available', 'open_to_offers')
-            ORDER BY t.updated_at DESC
-            LIMIT 500
-            """
-            candidates = await db_manager.execute_query(talent_query)
+            # Retrieve only plausible candidates, filtered in SQL
+            candidates = await retrieve_candidates(db_manager, job_analysis, job_data)
         
         if not candidates:
             return MatchResponse(
@@ -160,6 +139,7 @@ async def match_candidates_to_job(
         
         # Process matches
         matches = []
+        scored_matches = []
         
         for candidate in candidates[:request.max_results * 2]:  # Process more than needed
             candidate_dict = dict(candidate)
@@ -217,16 +197,19 @@ async def match_candidates_to_job(
                     # Cache the result
                     result_data = match_result.dict()
                     result_data.pop('cached', None)  # Remove cached field before storing
-                    await redis_manager.set(cache_key, result_data, ttl=3600)
+                    await redis_manager.set(cache_key, result_data, ttl=get_settings().match_cache_ttl)
                     
-                    # Save to database in background
-                    background_tasks.add_task(
-                        save_match_to_db,
-                        db_manager,
-                        request.job_id,
-                        candidate_dict['id'],
-                        match_scores
-                    )
+                    scored_matches.append(match_result)
+        
+        # Save new scores to database and the job's top-K list in background
+        if scored_matches:
+            background_tasks.add_task(
+                save_matches_to_db,
+                db_manager,
+                redis_manager,
+                request.job_id,
+                scored_matches
+            )
         
         # Sort matches by overall score
         matches.sort(key=lambda x: x.overall_score, reverse=True)
@@ -297,7 +280,7 @@ async def match_talent_to_jobs(
                     job_data['description'],
                     user_id=str(job_data.get('employer_id'))
                 )
-                await redis_manager.set(job_analysis_key, job_analysis, ttl=86400)
+                await redis_manager.set(job_analysis_key, job_analysis, ttl=get_settings().job_analysis_cache_ttl)
             
             # Calculate match scores
             match_scores = await calculate_match_scores(
@@ -336,6 +319,95 @@ async def match_talent_to_jobs(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def fetch_candidates(db_manager: DatabaseManager, talent_ids: List[str]) -> list:
+    """Fetch specific active candidates by talent ID"""
+    talent_query = """
+    SELECT t.*, p.first_name, p.last_name, p.email, 
+           t.skills, t.total_experience_years, t.current_location,
+           t.salary_expectation_min, t.salary_expectation_max,
+           t.availability_status, t.remote_work_preference
+    FROM users.talents t
+    JOIN users.profiles p ON t.profile_id = p.id
+    WHERE t.id = ANY(:talent_ids) AND p.is_active = true
+    """
+    return await db_manager.execute_query(talent_query, {"talent_ids": talent_ids})
+
+
+def build_candidate_filters(job_analysis: Dict, job_data: Dict) -> tuple[List[str], Dict[str, Any]]:
+    """Build the hard SQL filters a candidate must pass before any scoring"""
+    settings = get_settings()
+    conditions = [
+        "p.is_active = true",
+        "t.availability_status IN ('available', 'open_to_offers')"
+    ]
+    params: Dict[str, Any] = {"limit": settings.candidate_pool_size}
+    
+    # Case-insensitive overlap with the job's skills, answered by the GIN
+    # expression index on users.talent_skill_names(skills); skills_score itself
+    # comes from embeddings once the pool is retrieved
+    skill_terms = sorted({
+        skill.strip().lower()
+        for skill in (job_analysis.get('required_skills') or []) + (job_data.get('skills_required') or [])
+        if isinstance(skill, str) and skill.strip()
+    })
+    if skill_terms:
+        conditions.append("users.talent_skill_names(t.skills) && CAST(:skill_terms AS text[])")
+        params["skill_terms"] = skill_terms
+    
+    # Experience floor, below which the experience score cannot recover
+    required_years = job_analysis.get('required_experience_years') or 0
+    if required_years > 0:
+        conditions.append("COALESCE(t.total_experience_years, 0) >= :min_experience_years")
+        params["min_experience_years"] = required_years * settings.candidate_min_experience_ratio
+    
+    # Remote-only candidates cannot take onsite roles
+    if job_analysis.get('location_requirements') == 'onsite':
+        conditions.append(
+            "COALESCE(t.remote_work_preference, 'flexible') NOT IN ('remote', 'remote_only')"
+        )
+    
+    return conditions, params
+
+
+async def retrieve_candidates(db_manager: DatabaseManager, job_analysis: Dict,
+                              job_data: Dict) -> list:
+    """Retrieve the candidate pool for a job, most skill overlap first"""
+    conditions, params = build_candidate_filters(job_analysis, job_data)
+    
+    overlap_order = ""
+    if "skill_terms" in params:
+        # Most matching skills first
+        overlap_order = """
+            (
+                SELECT COUNT(*) FROM unnest(users.talent_skill_names(t.skills)) AS skill
+                WHERE skill = ANY(CAST(:skill_terms AS text[]))
+            ) DESC,"""
+    
+    talent_query = f"""
+    SELECT t.*, p.first_name, p.last_name, p.email,
+           t.skills, t.total_experience_years, t.current_location,
+           t.salary_expectation_min, t.salary_expectation_max,
+           t.availability_status, t.remote_work_preference
+    FROM users.talents t
+    JOIN users.profiles p ON t.profile_id = p.id
+    WHERE {" AND ".join(conditions)}
+    ORDER BY {overlap_order} t.updated_at DESC
+    LIMIT :limit
+    """
+    return await db_manager.execute_query(talent_query, params)
+
+
+def salary_currency(candidate_data: Dict) -> Optional[str]:
+    """Currency of a candidate's salary expectations, if stated"""
+    expectations = candidate_data.get('salary_expectations') or {}
+    if isinstance(expectations, str):
+        try:
+            expectations = json.loads(expectations)
+        except ValueError:
+            return None
+    return expectations.get('currency') if isinstance(expectations, dict) else None
+
+
 async def calculate_match_scores(job_analysis: Dict, candidate_data: Dict, 
                                ai_manager: AIManager) -> Dict[str, float]:
     """Calculate comprehensive match scores"""
@@ -392,14 +464,19 @@ async def calculate_match_scores(job_analysis: Dict, candidate_data: Dict,
         else:
             scores['availability_score'] = 0.3
         
-        # Salary matching (10% weight)
+        # Salary matching (10% weight), in the job's currency
         job_salary = job_analysis.get('salary_range', {})
-        candidate_min = candidate_data.get('salary_expectation_min', 0)
-        candidate_max = candidate_data.get('salary_expectation_max', 0)
-        
-        if job_salary.get('max', 0) > 0 and candidate_min > 0:
-            if candidate_min <= job_salary.get('max', 0):
-                if candidate_max <= job_salary.get('max', 0):
+        job_max = float(job_salary.get('max') or 0)
+        rates = get_currency_service().snapshot
+        candidate_currency = salary_currency(candidate_data)
+        candidate_min = rates.convert(candidate_data.get('salary_expectation_min') or 0,
+                                      candidate_currency, job_salary.get('currency'))
+        candidate_max = rates.convert(candidate_data.get('salary_expectation_max') or 0,
+                                      candidate_currency, job_salary.get('currency'))
+        
+        if job_max > 0 and candidate_min > 0:
+            if candidate_min <= job_max:
+                if candidate_max <= job_max:
                     scores['salary_score'] = 1.0
                 else:
                     scores['salary_score'] = 0.7
@@ -503,13 +580,89 @@ def calculate_skill_match_score(job_skill: str, candidate_skills: List[str]) ->
     return 0.0
 
 
-async def save_match_to_db(db_manager: DatabaseManager, job_id: str, 
-                          talent_id: str, scores: Dict[str, float]):
-    """Save matching result to database"""
+def top_k_entry(match: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the stored top-K row for a match, shaped like the /matches response"""
+    return {
+        "talent_id": str(match['talent_id']),
+        "talent_name": match['talent_name'],
+        "overall_score": float(match['overall_score'] or 0),
+        "skills_score": float(match['skills_score'] or 0),
+        "experience_score": float(match['experience_score'] or 0),
+        "location_score": float(match['location_score'] or 0),
+        "availability_score": float(match['availability_score'] or 0),
+        "salary_score": float(match['salary_score'] or 0),
+        "confidence_level": float(match['confidence_level'] or 0),
+        "explanation": match.get('explanation')
+    }
+
+
+async def save_matches_to_db(db_manager: DatabaseManager, redis_manager: RedisManager,
+                             job_id: str, match_results: List[MatchResult]):
+    """Bulk-save matching results to database and fold them into the job's top-K list"""
     try:
-        await db_manager.save_matching_score(job_id, talent_id, scores)
+        await db_manager.save_matching_scores(job_id, [
+            (match.talent_id, {
+                "overall_score": match.overall_score,
+                "skills_score": match.skills_score,
+                "experience_score": match.experience_score,
+                "location_score": match.location_score,
+                "availability_score": match.availability_score,
+                "salary_score": match.salary_score,
+                "confidence": match.confidence_level,
+                "explanation": match.explanation or ""
+            })
+            for match in match_results
+        ])
     except Exception as e:
-        logger.error(f"Failed to save match to database: {e}")
+        logger.error(f"Failed to save matches to database: {e}")
+        return
+    
+    await redis_manager.update_top_matches(
+        job_id, [top_k_entry(match.dict()) for match in match_results]
+    )
+
+
+TOP_MATCHES_QUERY = """
+SELECT jts.talent_id, jts.overall_score, jts.skills_score, 
+       jts.experience_score, jts.location_score, jts.availability_score,
+       jts.salary_score, jts.ai_explanation, jts.confidence_level,
+       p.first_name, p.last_name, p.email
+FROM matching.job_talent_scores jts
+JOIN users.talents t ON jts.talent_id = t.id
+JOIN users.profiles p ON t.profile_id = p.id
+WHERE jts.job_id = :job_id 
+AND jts.overall_score >= :min_score
+ORDER BY jts.overall_score DESC
+LIMIT :limit
+"""
+
+
+async def fetch_top_matches(db_manager: DatabaseManager, job_id: str,
+                            min_score: float, limit: int) -> List[Dict[str, Any]]:
+    """Fetch a job's best stored matches from SQL as top-K rows"""
+    results = await db_manager.execute_query(TOP_MATCHES_QUERY, {
+        "job_id": job_id,
+        "min_score": min_score,
+        "limit": limit
+    })
+    
+    matches = []
+    for row in results:
+        row_dict = dict(row)
+        matches.append(top_k_entry({
+            **row_dict,
+            "talent_name": f"{row_dict['first_name']} {row_dict['last_name']}",
+            "explanation": row_dict['ai_explanation']
+        }))
+    return matches
+
+
+async def rebuild_top_matches(db_manager: DatabaseManager, redis_manager: RedisManager,
+                              job_id: str) -> List[Dict[str, Any]]:
+    """Reload a job's top K matches from SQL and rebuild its top-K list"""
+    matches = await fetch_top_matches(db_manager, job_id, 0.0, get_settings().match_top_k)
+    await redis_manager.set_top_matches(job_id, matches)
+    return matches
 
 
 # Additional endpoints for match management
@@ -519,52 +672,30 @@ async def get_cached_matches(
     limit: int = Query(default=50, le=100),
     min_score: float = Query(default=0.3, ge=0.0, le=1.0)
 ):
-    """Get cached matching results for a job"""
+    """Get cached matching results for a job, served from its top-K list when possible"""
     try:
         db_manager = DatabaseManager()
+        redis_manager = RedisManager()
         
-        query = """
-        SELECT jts.talent_id, jts.overall_score, jts.skills_score, 
-               jts.experience_score, jts.location_score, jts.availability_score,
-               jts.salary_score, jts.ai_explanation, jts.confidence_level,
-               p.first_name, p.last_name, p.email
-        FROM matching.job_talent_scores jts
-        JOIN users.talents t ON jts.talent_id = t.id
-        JOIN users.profiles p ON t.profile_id = p.id
-        WHERE jts.job_id = :job_id 
-        AND jts.overall_score >= :min_score
-        ORDER BY jts.overall_score DESC
-        LIMIT :limit
-        """
-        
-        results = await db_manager.execute_query(query, {
-            "job_id": job_id,
-            "min_score": min_score,
-            "limit": limit
-        })
-        
-        matches = []
-        for row in results:
-            row_dict = dict(row)
-            matches.append({
-                "talent_id": row_dict['talent_id'],
-                "talent_name": f"{row_dict['first_name']} {row_dict['last_name']}",
-                "overall_score": row_dict['overall_score'],
-                "skills_score": row_dict['skills_score'],
-                "experience_score": row_dict['experience_score'],
-                "location_score": row_dict['location_score'],
-                "availability_score": row_dict['availability_score'],
-                "salary_score": row_dict['salary_score'],
-                "confidence_level": row_dict['confidence_level'],
-                "explanation": row_dict['ai_explanation']
-            })
+        # The top-K list answers any request that fits inside it
+        if limit <= get_settings().match_top_k:
+            matches = await redis_manager.get_top_matches(job_id, limit, min_score)
+            cached = matches is not None
+            
+            if not cached:
+                matches = await rebuild_top_matches(db_manager, redis_manager, job_id)
+                matches = [m for m in matches if m['overall_score'] >= min_score][:limit]
+        else:
+            matches = await fetch_top_matches(db_manager, job_id, min_score, limit)
+            cached = False
         
         return {
             "job_id": job_id,
             "total_matches": len(matches),
-            "matches": matches
+            "matches": matches,
+            "cached": cached
         }
         
     except Exception as e:
         logger.error(f"Failed to get cached matches: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,217 @@
+"""
+Cache Warmer - Precomputes job analyses, embeddings and top matches for active jobs
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from src.config.database import DatabaseManager
+from src.config.redis_client import RedisManager
+from src.config.settings import get_settings
+from src.routers.matching import (
+    calculate_match_scores,
+    rebuild_top_matches,
+    retrieve_candidates,
+)
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+settings = get_settings()
+
+
+class CacheWarmer:
+    """Background warm-up of the caches the first recruiter on a job would otherwise pay for"""
+    
+    def __init__(self, ai_manager: Any, load_probe: Optional[Callable[[], int]] = None):
+        self.ai_manager = ai_manager
+        self.db_manager = DatabaseManager()
+        self.redis_manager = RedisManager()
+        
+        # Returns the number of in-flight interactive requests
+        self.load_probe = load_probe or (lambda: 0)
+        self.max_yield_seconds = 5.0
+        
+        self._task: Optional[asyncio.Task] = None
+        self.progress = {
+            "state": "disabled" if not settings.enable_cache_warming else "idle",
+            "cycles_completed": 0,
+            "last_cycle_started_at": None,
+            "last_cycle_duration_ms": None,
+            "jobs_selected": 0,
+            "jobs_warmed": 0,
+            "jobs_already_warm": 0,
+            "jobs_failed": 0,
+            "budget_exhausted": False,
+            "current_job": None,
+            "last_error": None
+        }
+    
+    def start(self):
+        """Start the periodic warm-up loop"""
+        if not settings.enable_cache_warming or self._task:
+            return
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the warm-up loop"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def status(self) -> Dict[str, Any]:
+        """Warm-up progress for /health/detailed"""
+        return {
+            "status": "healthy",
+            **self.progress,
+            "budget": {
+                "max_jobs": settings.cache_warm_max_jobs,
+                "time_budget_seconds": settings.cache_warm_time_budget,
+                "candidates_per_job": settings.cache_warm_candidates_per_job,
+                "interval_seconds": settings.cache_warm_interval
+            }
+        }
+    
+    async def _run(self):
+        """Warm once shortly after startup, then on every interval"""
+        await asyncio.sleep(settings.cache_warm_startup_delay)
+        
+        while True:
+            try:
+                await self.warm_cycle()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Cache warm-up cycle failed: {e}")
+                self.progress["last_error"] = str(e)
+                self.progress["state"] = "idle"
+            
+            await asyncio.sleep(settings.cache_warm_interval)
+    
+    async def warm_cycle(self):
+        """Warm the caches of the most recently viewed and newest active jobs"""
+        cycle_start = time.monotonic()
+        self.progress.update({
+            "state": "running",
+            "last_cycle_started_at": datetime.utcnow().isoformat() + "Z",
+            "jobs_selected": 0,
+            "jobs_warmed": 0,
+            "jobs_already_warm": 0,
+            "jobs_failed": 0,
+            "budget_exhausted": False,
+            "last_error": None
+        })
+        
+        jobs = await self._select_jobs(settings.cache_warm_max_jobs)
+        self.progress["jobs_selected"] = len(jobs)
+        
+        for job in jobs:
+            if time.monotonic() - cycle_start > settings.cache_warm_time_budget:
+                self.progress["budget_exhausted"] = True
+                break
+            
+            await self._yield_to_interactive()
+            self.progress["current_job"] = str(job['id'])
+            
+            try:
+                warmed = await self._warm_job(job)
+                key = "jobs_warmed" if warmed else "jobs_already_warm"
+                self.progress[key] += 1
+            except Exception as e:
+                logger.error(f"Cache warm-up failed for job {job['id']}: {e}")
+                self.progress["jobs_failed"] += 1
+                self.progress["last_error"] = str(e)
+        
+        self.progress.update({
+            "state": "idle",
+            "current_job": None,
+            "last_cycle_duration_ms": round((time.monotonic() - cycle_start) * 1000, 1)
+        })
+        self.progress["cycles_completed"] += 1
+        
+        logger.info(
+            f"Cache warm-up cycle completed: {self.progress['jobs_warmed']} warmed, "
+            f"{self.progress['jobs_already_warm']} already warm, {self.progress['jobs_failed']} failed"
+        )
+    
+    async def _select_jobs(self, limit: int) -> List[Dict[str, Any]]:
+        """Select active jobs by recent views, then by posting date"""
+        query = """
+        SELECT j.id, j.employer_id, j.description, j.skills_required,
+               COALESCE(SUM(m.views_count), 0) AS recent_views
+        FROM jobs.postings j
+        LEFT JOIN analytics.job_metrics m
+          ON m.job_id = j.id AND m.metric_date >= CURRENT_DATE - 1
+        WHERE j.status = 'active'
+        GROUP BY j.id
+        ORDER BY recent_views DESC, j.created_at DESC
+        LIMIT :limit
+        """
+        rows = await self.db_manager.execute_query(query, {"limit": limit})
+        return [dict(row) for row in rows]
+    
+    async def _warm_job(self, job: Dict[str, Any]) -> bool:
+        """Warm one job's analysis, skill embedding and top-K list; False if already warm"""
+        job_id = str(job['id'])
+        warmed = False
+        
+        job_analysis_key = f"job_analysis:{job_id}"
+        job_analysis = await self.redis_manager.get(job_analysis_key)
+        if not job_analysis:
+            job_analysis = await self.ai_manager.analyze_job_description(
+                job['description'],
+                user_id=str(job.get('employer_id'))
+            )
+            await self.redis_manager.set(job_analysis_key, job_analysis, ttl=settings.job_analysis_cache_ttl)
+            warmed = True
+        
+        # Same text calculate_skills_similarity embeds, so the embedding cache hits
+        job_skills = job_analysis.get('required_skills', []) + job_analysis.get('preferred_skills', [])
+        if job_skills:
+            await self.ai_manager.generate_embedding(", ".join(job_skills), use_local=True)
+        
+        if await self.redis_manager.get_top_matches(job_id, 1) is None:
+            await self._score_new_candidates(job_id, job, job_analysis)
+            await rebuild_top_matches(self.db_manager, self.redis_manager, job_id)
+            warmed = True
+        
+        return warmed
+    
+    async def _score_new_candidates(self, job_id: str, job: Dict[str, Any],
+                                    job_analysis: Dict[str, Any]):
+        """Score retrieved candidates that have no stored score for the job yet"""
+        scored_rows = await self.db_manager.execute_query(
+            "SELECT talent_id FROM matching.job_talent_scores WHERE job_id = :job_id",
+            {"job_id": job_id}
+        )
+        already_scored = {str(row[0]) for row in scored_rows}
+        
+        candidates = await retrieve_candidates(self.db_manager, job_analysis, job)
+        
+        new_scores = []
+        for candidate in candidates[:settings.cache_warm_candidates_per_job]:
+            candidate_dict = dict(candidate)
+            if str(candidate_dict['id']) in already_scored:
+                continue
+            
+            await self._yield_to_interactive()
+            match_scores = await calculate_match_scores(
+                job_analysis, candidate_dict, self.ai_manager
+            )
+            if match_scores['overall_score'] >= settings.min_match_score:
+                new_scores.append((candidate_dict['id'], match_scores))
+        
+        await self.db_manager.save_matching_scores(job_id, new_scores)
+    
+    async def _yield_to_interactive(self):
+        """Hold off while interactive requests are in flight, up to max_yield_seconds"""
+        waited = 0.0
+        while self.load_probe() > 0 and waited < self.max_yield_seconds:
+            await asyncio.sleep(0.05)
+            waited += 0.05
+        await asyncio.sleep(0)
@@ -0,0 +1,345 @@
+"""
+Change Listener - Invalidates and rescores cached entities when their rows change
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Set
+
+import asyncpg
+
+from src.config.database import DatabaseManager, compliance_rule_cache
+from src.config.redis_client import RedisManager
+from src.config.settings import get_settings
+from src.routers.matching import (
+    calculate_match_scores,
+    fetch_candidates,
+    rebuild_top_matches,
+    top_k_entry,
+)
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+settings = get_settings()
+
+CHANNEL = "entity_changes"
+
+# Watched tables and the columns whose changes never affect cached results.
+# Must match the trigger arguments in db-postgres/init/08_change_notifications.sql.
+WATCHED_TABLES = {
+    "jobs.postings": ("updated_at", "view_count", "application_count"),
+    "users.talents": ("updated_at",),
+    "users.profiles": ("updated_at", "last_login"),
+}
+
+# Rule edits drop the in-process rule sets; in poll mode their version probe catches up instead
+RULES_TABLE = "compliance.regulatory_rules"
+
+# Bound on remembered row fingerprints in poll mode
+MAX_FINGERPRINTS = 100000
+
+
+class ChangeListener:
+    """Targeted invalidation of job analyses, match results and top-K lists"""
+    
+    def __init__(self, ai_manager: Any):
+        self.ai_manager = ai_manager
+        self.db_manager = DatabaseManager()
+        self.redis_manager = RedisManager()
+        self.mode = settings.change_invalidation_mode
+        
+        self._task: Optional[asyncio.Task] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._pending: Dict[str, Set[str]] = {table: set() for table in WATCHED_TABLES}
+        
+        # Poll mode state: per-table updated_at watermark and row fingerprints
+        self._watermarks: Dict[str, Optional[datetime]] = {table: None for table in WATCHED_TABLES}
+        self._fingerprints: Dict[tuple, str] = {}
+        
+        self.progress = {
+            "state": "disabled" if not settings.enable_change_invalidation else "idle",
+            "events_received": 0,
+            "jobs_refreshed": 0,
+            "talents_refreshed": 0,
+            "last_event_at": None,
+            "last_error": None
+        }
+    
+    def start(self):
+        """Start listening for changes and the invalidation worker"""
+        if not settings.enable_change_invalidation or self._task:
+            return
+        self._worker = asyncio.create_task(self._process_loop())
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the listener and the invalidation worker"""
+        for task in (self._task, self._worker):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._worker = None
+    
+    def status(self) -> Dict[str, Any]:
+        """Listener progress for /health/detailed"""
+        return {
+            "status": "healthy",
+            "mode": self.mode,
+            **self.progress,
+            "pending": sum(len(ids) for ids in self._pending.values())
+        }
+    
+    async def _run(self):
+        """Listen for notifications, polling while the listen connection is down"""
+        while True:
+            try:
+                if self.mode == "listen":
+                    await self._listen()
+                else:
+                    self.progress["state"] = "polling"
+                    await self._poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Change listener error, polling until reconnected: {e}")
+                self.progress["last_error"] = str(e)
+                self.progress["state"] = "polling"
+                try:
+                    await self._poll_once()
+                except Exception as poll_error:
+                    logger.error(f"Change poll failed: {poll_error}")
+            
+            await asyncio.sleep(settings.change_poll_interval)
+    
+    async def _listen(self):
+        """Hold a LISTEN connection until it terminates"""
+        dsn = settings.database_url.replace("+asyncpg", "")
+        connection = await asyncpg.connect(dsn)
+        terminated = asyncio.Event()
+        
+        try:
+            connection.add_termination_listener(lambda _: terminated.set())
+            await connection.add_listener(CHANNEL, self._on_notification)
+            listening_since = await connection.fetchval("SELECT NOW()")
+            
+            # Catch up on anything missed while the previous connection was down
+            if any(self._watermarks.values()):
+                compliance_rule_cache.invalidate()
+                await self._poll_once()
+            for table in WATCHED_TABLES:
+                self._watermarks[table] = listening_since
+            
+            self.progress["state"] = "listening"
+            logger.info(f"Listening for entity changes on '{CHANNEL}'")
+            await terminated.wait()
+            raise ConnectionError("LISTEN connection terminated")
+        finally:
+            if not connection.is_closed():
+                await connection.close()
+    
+    def _on_notification(self, connection, pid, channel, payload):
+        """Queue the entity named in a notification payload"""
+        try:
+            change = json.loads(payload)
+            if change["table"] == RULES_TABLE:
+                compliance_rule_cache.invalidate()
+                logger.info(f"Compliance rules changed ({change.get('op')}), dropped cached rule sets")
+                return
+            self._enqueue(change["table"], change["id"])
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Ignoring malformed change notification {payload!r}: {e}")
+    
+    async def _poll_once(self):
+        """Queue rows whose updated_at moved and whose relevant columns changed"""
+        for table, ignored_columns in WATCHED_TABLES.items():
+            since = self._watermarks[table]
+            if since is None:
+                # First poll only establishes the watermark
+                self._watermarks[table] = await self.db_manager.execute_scalar("SELECT NOW()")
+                continue
+            
+            query = f"""
+            SELECT t.id, t.updated_at,
+                   md5((to_jsonb(t) - CAST(:ignored AS text[]))::text) AS fingerprint
+            FROM {table} t
+            WHERE t.updated_at >= :since
+            ORDER BY t.updated_at
+            """
+            rows = await self.db_manager.execute_query(query, {
+                "ignored": list(ignored_columns),
+                "since": since
+            })
+            
+            if len(self._fingerprints) > MAX_FINGERPRINTS:
+                self._fingerprints.clear()
+            
+            for row in rows:
+                key = (table, str(row[0]))
+                if self._fingerprints.get(key) == row[2]:
+                    continue
+                self._fingerprints[key] = row[2]
+                self._enqueue(table, row[0])
+            
+            if rows:
+                self._watermarks[table] = rows[-1][1]
+    
+    def _enqueue(self, table: str, entity_id: Any):
+        if table not in self._pending:
+            return
+        self._pending[table].add(str(entity_id))
+        self.progress["events_received"] += 1
+        self.progress["last_event_at"] = datetime.utcnow().isoformat() + "Z"
+        self._wakeup.set()
+    
+    async def _process_loop(self):
+        """Process queued changes, debounced so bursts of edits refresh once"""
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(settings.change_debounce_seconds)
+            self._wakeup.clear()
+            
+            pending = self._pending
+            self._pending = {table: set() for table in WATCHED_TABLES}
+            
+            try:
+                await self._process(pending)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Change invalidation failed: {e}")
+                self.progress["last_error"] = str(e)
+    
+    async def _process(self, pending: Dict[str, Set[str]]):
+        job_ids = pending["jobs.postings"]
+        talent_ids = set(pending["users.talents"])
+        
+        if pending["users.profiles"]:
+            rows = await self.db_manager.execute_query(
+                "SELECT id FROM users.talents WHERE profile_id = ANY(CAST(:profile_ids AS uuid[]))",
+                {"profile_ids": list(pending["users.profiles"])}
+            )
+            talent_ids.update(str(row[0]) for row in rows)
+        
+        for job_id in job_ids:
+            await self._refresh_job(job_id)
+            self.progress["jobs_refreshed"] += 1
+        
+        # A refreshed job has already rescored every talent stored against it
+        for talent_id in talent_ids:
+            await self._refresh_talent(talent_id, skip_jobs=job_ids)
+            self.progress["talents_refreshed"] += 1
+    
+    async def _refresh_job(self, job_id: str):
+        """Re-analyze a changed job and rescore its stored matches"""
+        stored = await self.db_manager.execute_query(
+            "SELECT talent_id, ai_explanation FROM matching.job_talent_scores WHERE job_id = :job_id",
+            {"job_id": job_id}
+        )
+        explanations = {str(row[0]): row[1] or "" for row in stored}
+        
+        await self.redis_manager.delete_many(
+            [f"job_analysis:{job_id}"] + [f"match:{job_id}:{talent_id}" for talent_id in explanations]
+        )
+        
+        job = await self.db_manager.get_job_posting(job_id)
+        if not job:
+            # Deleted; its stored scores went with it
+            await self.redis_manager.delete_pattern(f"match:{job_id}:*")
+            await self.redis_manager.drop_top_matches(job_id)
+            return
+        
+        if job.get('status') != 'active':
+            await self.redis_manager.drop_top_matches(job_id)
+            return
+        
+        job_analysis = await self.ai_manager.analyze_job_description(
+            job['description'],
+            user_id=str(job.get('employer_id'))
+        )
+        await self.redis_manager.set(
+            f"job_analysis:{job_id}", job_analysis, ttl=settings.job_analysis_cache_ttl
+        )
+        
+        if explanations:
+            candidates = await fetch_candidates(self.db_manager, list(explanations))
+            talent_scores = []
+            for candidate in candidates:
+                candidate_dict = dict(candidate)
+                match_scores = await calculate_match_scores(
+                    job_analysis, candidate_dict, self.ai_manager
+                )
+                match_scores["explanation"] = explanations.get(str(candidate_dict['id']), "")
+                talent_scores.append((candidate_dict['id'], match_scores))
+            
+            await self.db_manager.save_matching_scores(job_id, talent_scores)
+        
+        await rebuild_top_matches(self.db_manager, self.redis_manager, job_id)
+    
+    async def _refresh_talent(self, talent_id: str, skip_jobs: Iterable[str] = ()):
+        """Rescore a changed talent against the jobs it has stored matches for"""
+        stored = await self.db_manager.execute_query(
+            "SELECT job_id, ai_explanation FROM matching.job_talent_scores WHERE talent_id = :talent_id",
+            {"talent_id": talent_id}
+        )
+        explanations = {
+            str(row[0]): row[1] or "" for row in stored if str(row[0]) not in skip_jobs
+        }
+        
+        await self.redis_manager.delete_many(
+            [f"match:{job_id}:{talent_id}" for job_id in explanations]
+        )
+        
+        candidates = await fetch_candidates(self.db_manager, [talent_id])
+        if not candidates:
+            # Deleted or deactivated; drop every cached result that includes it
+            await self.redis_manager.delete_pattern(f"match:*:{talent_id}")
+            listed_jobs = await self.redis_manager.find_top_match_jobs(talent_id)
+            for job_id in set(explanations) | set(listed_jobs):
+                await self.redis_manager.drop_top_matches(job_id)
+            return
+        
+        candidate_dict = dict(candidates[0])
+        talent_name = f"{candidate_dict.get('first_name', '')} {candidate_dict.get('last_name', '')}".strip()
+        
+        for job_id, explanation in explanations.items():
+            job_analysis = await self._get_job_analysis(job_id)
+            if not job_analysis:
+                await self.redis_manager.drop_top_matches(job_id)
+                continue
+            
+            match_scores = await calculate_match_scores(
+                job_analysis, candidate_dict, self.ai_manager
+            )
+            match_scores["explanation"] = explanation
+            await self.db_manager.save_matching_scores(job_id, [(talent_id, match_scores)])
+            
+            await self.redis_manager.update_top_matches(job_id, [top_k_entry({
+                **match_scores,
+                "talent_id": talent_id,
+                "talent_name": talent_name,
+                "confidence_level": match_scores.get('confidence', 0.8)
+            })])
+    
+    async def _get_job_analysis(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Cached job analysis, analyzing the job if it is not cached"""
+        job_analysis_key = f"job_analysis:{job_id}"
+        job_analysis = await self.redis_manager.get(job_analysis_key)
+        if job_analysis:
+            return job_analysis
+        
+        job = await self.db_manager.get_job_posting(job_id)
+        if not job:
+            return None
+        
+        job_analysis = await self.ai_manager.analyze_job_description(
+            job['description'],
+            user_id=str(job.get('employer_id'))
+        )
+        await self.redis_manager.set(job_analysis_key, job_analysis, ttl=settings.job_analysis_cache_ttl)
+        return job_analysis
@@ -0,0 +1,278 @@
+"""
+Compliance Engine Client - Deterministic rule checks delegated to the compliance engine
+
+Rule parameters the engine checks with the same threshold and unit (weekly hours,
+hourly minimum wage, data processing consent) are answered by the compliance
+engine's rule evaluation instead of the LLM. Checks issued concurrently are
+coalesced into one /api/v1/bulk-check call over a pooled keep-alive connection.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+from src.config.settings import get_settings
+from src.services.rule_evaluator import INFORMATIONAL_PARAMETERS, field_value, rule_parameters
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class EngineParameter:
+    """The engine check that answers an agent rule parameter"""
+    compliance_type: str
+    field: str
+    operator: str  # max | min | required
+    currency: Optional[str] = None
+
+
+# Agent rule parameter -> engine check comparing the same quantity in the same unit
+ENGINE_PARAMETERS: Dict[str, EngineParameter] = {
+    "max_hours_per_week": EngineParameter("employment", "working_hours", "max"),
+    "minimum_wage_euro": EngineParameter("employment", "salary_min", "min", currency="EUR"),
+    "consent_required": EngineParameter("data_protection", "data_processing_consent", "required"),
+}
+
+# Parameters that do not change what a rule checks; exceptions do, and the engine knows none
+DESCRIPTIVE_PARAMETERS = INFORMATIONAL_PARAMETERS - {"exceptions"}
+
+# The engine groups EU member states under one jurisdiction
+ENGINE_JURISDICTIONS = {
+    "UK": "UK", "DE": "EU", "FR": "EU", "NL": "EU",
+    "US": "US", "CA": "CA", "AU": "AU", "SG": "SG", "JP": "JP"
+}
+
+ENGINE_ENTITY_TYPES = {
+    "job_posting": "job_posting",
+    "contract": "employment_contract",
+    "talent": "candidate_data"
+}
+
+# Engine field -> agent entity fields it is read from, first present wins. The
+# engine's minimum wage is hourly, so salary_min is only read from hourly rates.
+ENGINE_FIELDS = {
+    "salary_min": ("hourly_rate", "salary_range.hourly_min"),
+    "currency": ("salary_range.currency", "currency"),
+    "working_hours": ("hours_per_week", "working_hours.per_week", "weekly_hours", "working_hours"),
+    "data_processing_consent": ("data_processing_consent", "data_consent", "gdpr_consent", "consent_given"),
+}
+
+
+def engine_parameters(rule: Dict) -> Optional[Dict[str, EngineParameter]]:
+    """Engine checks answering each of a rule's parameters, or None if the engine cannot settle the rule"""
+    parameters = rule_parameters(rule)
+    delegated = {name: ENGINE_PARAMETERS[name] for name in parameters if name in ENGINE_PARAMETERS}
+    if not delegated or set(parameters) - set(delegated) - DESCRIPTIVE_PARAMETERS:
+        return None
+    if len({parameter.compliance_type for parameter in delegated.values()}) > 1:
+        return None
+    return delegated
+
+
+def engine_compliance_type(rule: Dict) -> Optional[str]:
+    """Engine compliance type a rule is delegated to, None if it is not delegated"""
+    delegated = engine_parameters(rule)
+    return next(iter(delegated.values())).compliance_type if delegated else None
+
+
+def engine_data(entity_data: Dict[str, Any]) -> Dict[str, Any]:
+    """The flat fields the engine's checks read, taken from the entity row"""
+    data = {}
+    for engine_field, paths in ENGINE_FIELDS.items():
+        for path in paths:
+            value = field_value(entity_data, path)
+            if value is not None and not isinstance(value, (dict, list)):
+                data[engine_field] = value
+                break
+    return data
+
+
+def _engine_answers(parameter: EngineParameter, expected: Any, field_checks: List[Dict[str, Any]],
+                    value: Any) -> bool:
+    """Whether the engine compared the field the way the rule parameter asks"""
+    described = [check for check in field_checks if check.get('field') == parameter.field]
+    if not described:
+        return False
+    for check in described:
+        if check.get('operator') != parameter.operator or check.get('when'):
+            return False
+        if parameter.operator == "required":
+            if expected is not True:
+                return False
+        elif check.get('required') != expected or check.get('currency') != parameter.currency:
+            return False
+    
+    # The engine's min and max pass missing and zero values without comparing them
+    if parameter.operator in ("min", "max"):
+        return not isinstance(value, bool) and isinstance(value, (int, float)) and value != 0
+    return True
+
+
+def engine_verdicts(rules: List[Dict], results: Dict[str, Optional[Dict[str, Any]]],
+                    entity_data: Dict[str, Any]) -> List[Optional[Dict[str, Any]]]:
+    """Verdicts for delegated rules from engine results by compliance type; None where the engine could not settle one"""
+    data = engine_data(entity_data)
+    verdicts = []
+    for rule in rules:
+        delegated = engine_parameters(rule) or {}
+        parameters = rule_parameters(rule)
+        compliance_type = engine_compliance_type(rule)
+        result = results.get(compliance_type) if compliance_type else None
+        metadata = (result or {}).get('metadata') or {}
+        field_checks = metadata.get('field_checks') or []
+        
+        if not result or metadata.get('rules_not_evaluated') or not all(
+            _engine_answers(parameter, parameters[name], field_checks, data.get(parameter.field))
+            for name, parameter in delegated.items()
+        ):
+            verdicts.append(None)
+            continue
+        
+        # Violations of other engine rules say nothing about this one
+        fields = {parameter.field for parameter in delegated.values()}
+        violations = [violation for violation in result['violations'] if violation.get('field_name') in fields]
+        verdicts.append({
+            'compliant': not violations,
+            'compliance_score': 0.0 if violations else 1.0,
+            'issue_description': "; ".join(violation['description'] for violation in violations),
+            'recommendation': next(
+                (step for violation in violations for step in violation.get('remediation_steps', [])), ""
+            ),
+            'affected_fields': sorted(fields) if violations else [],
+            'explanation': f"Checked by the compliance engine ({', '.join(sorted(fields))})",
+            'resolved_by_engine': True
+        })
+    return verdicts
+
+
+class ComplianceEngineClient:
+    """Pooled client that coalesces concurrent checks into bulk requests"""
+    
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._queue: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._window: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.stats = {"checks": 0, "requests": 0, "errors": 0}
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=settings.compliance_engine_url,
+                transport=self.transport,
+                timeout=settings.compliance_engine_timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.compliance_engine_max_connections,
+                    max_keepalive_connections=settings.compliance_engine_max_connections
+                )
+            )
+        return self._client
+    
+    async def close(self):
+        """Send anything still queued, then close the connection pool"""
+        if self._window:
+            await self._window
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+    
+    def status(self) -> Dict[str, Any]:
+        """Delegation counters for /health/detailed"""
+        return {
+            "status": "healthy",
+            "url": "local stand-in" if self.transport else settings.compliance_engine_url,
+            **self.stats
+        }
+    
+    async def check(self, jurisdiction: str, entity_type: str, entity_data: Dict[str, Any],
+                    compliance_types: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Engine results by compliance type; a type the engine failed to check maps to None"""
+        engine_jurisdiction = ENGINE_JURISDICTIONS.get(jurisdiction.upper())
+        engine_entity_type = ENGINE_ENTITY_TYPES.get(entity_type)
+        if not engine_jurisdiction or not engine_entity_type:
+            return {}
+        
+        data = engine_data(entity_data)
+        futures = {}
+        for compliance_type in compliance_types:
+            futures[compliance_type] = asyncio.get_running_loop().create_future()
+            self._queue.append(({
+                "jurisdiction": engine_jurisdiction,
+                "compliance_type": compliance_type,
+                "entity_type": engine_entity_type,
+                "data": data
+            }, futures[compliance_type]))
+        
+        if len(self._queue) >= settings.compliance_engine_batch_size:
+            self._spawn(self._send(self._take()))
+        elif self._window is None:
+            # Whatever else arrives within the window joins the same request
+            self._window = self._spawn(self._flush_window())
+        
+        return {compliance_type: await future for compliance_type, future in futures.items()}
+    
+    def _take(self) -> List[Tuple[Dict[str, Any], asyncio.Future]]:
+        batch = self._queue[:settings.compliance_engine_batch_size]
+        self._queue = self._queue[settings.compliance_engine_batch_size:]
+        return batch
+    
+    def _spawn(self, coroutine) -> asyncio.Task:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+    
+    async def _flush_window(self):
+        await asyncio.sleep(settings.compliance_engine_batch_window_ms / 1000)
+        self._window = None
+        while self._queue:
+            self._spawn(self._send(self._take()))
+    
+    async def _send(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        results: Dict[int, Dict[str, Any]] = {}
+        try:
+            requests = [{**request, "additional_context": {"ref": ref}} for ref, (request, _) in enumerate(batch)]
+            response = await self.client.post(
+                "/api/v1/bulk-check",
+                content=json.dumps({"requests": requests}, default=str),
+                headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+            self.stats["requests"] += 1
+            self.stats["checks"] += len(batch)
+            # Failed items are left out of the results, so match them back by ref
+            for result in response.json().get("results", []):
+                ref = ((result.get("metadata") or {}).get("additional_context") or {}).get("ref")
+                if ref is not None:
+                    results[ref] = result
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"Compliance engine check of {len(batch)} items failed: {e}")
+        
+        for ref, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(results.get(ref))
+
+
+_compliance_engine_client: Optional[ComplianceEngineClient] = None
+
+
+def get_compliance_engine_client() -> ComplianceEngineClient:
+    """Process-wide engine client, or the local stand-in when the engine is mocked"""
+    global _compliance_engine_client
+    if _compliance_engine_client is None:
+        if settings.use_mock_compliance_engine:
+            from src.services.mock_compliance_engine import mock_compliance_engine_transport
+            _compliance_engine_client = ComplianceEngineClient(transport=mock_compliance_engine_transport())
+        else:
+            _compliance_engine_client = ComplianceEngineClient()
+    return _compliance_engine_client
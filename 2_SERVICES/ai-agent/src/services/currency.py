@@ -0,0 +1,187 @@
+"""
+Currency - Exchange rate snapshots shared by salary scoring
+
+Same snapshot model and rates file format as the compliance engine's currency
+service, so both services convert salaries at the same rates.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+
+from src.config.settings import get_settings
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+settings = get_settings()
+
+# Simplified units per USD, used until a rates file is loaded
+DEFAULT_RATES = {
+    "USD": 1.0,
+    "GBP": 0.79,
+    "EUR": 0.85,
+    "AUD": 1.35,
+    "CAD": 1.25,
+    "JPY": 110.0,
+    "SGD": 1.35,
+    "KRW": 1200.0
+}
+
+
+@dataclass(frozen=True)
+class RateSnapshot:
+    """Immutable exchange rates with a precomputed cross-rate matrix"""
+    version: str
+    base: str
+    currencies: Tuple[str, ...]
+    index: Mapping[str, int]
+    # matrix[i, j]: units of currencies[j] per unit of currencies[i]
+    matrix: np.ndarray = field(repr=False, compare=False)
+    loaded_at: datetime = field(default_factory=datetime.utcnow, compare=False)
+    
+    @classmethod
+    def from_rates(cls, rates: Mapping[str, float], version: str, base: str = "USD") -> "RateSnapshot":
+        """Build a snapshot from units-per-base rates"""
+        if base not in rates:
+            raise ValueError(f"Rates must include the base currency {base}")
+        invalid = [code for code, rate in rates.items() if not isinstance(rate, (int, float)) or rate <= 0]
+        if invalid:
+            raise ValueError(f"Invalid rates for {', '.join(invalid)}")
+        
+        currencies = tuple(rates)
+        per_base = np.array([rates[code] for code in currencies], dtype=float)
+        matrix = per_base[np.newaxis, :] / per_base[:, np.newaxis]
+        matrix.flags.writeable = False
+        return cls(
+            version=version,
+            base=base,
+            currencies=currencies,
+            index=MappingProxyType({code: i for i, code in enumerate(currencies)}),
+            matrix=matrix
+        )
+    
+    def _position(self, currency: Optional[str]) -> int:
+        # Unknown currencies are treated as the base currency
+        return self.index.get(currency, self.index[self.base])
+    
+    def rate(self, from_currency: str, to_currency: str) -> float:
+        """Units of to_currency per unit of from_currency"""
+        return float(self.matrix[self._position(from_currency), self._position(to_currency)])
+    
+    def convert(self, amount: float, from_currency: Optional[str], to_currency: Optional[str]) -> float:
+        """Convert an amount; a missing currency on either side leaves it unconverted"""
+        if not from_currency or not to_currency or from_currency == to_currency:
+            return float(amount)
+        return float(amount) * self.rate(from_currency, to_currency)
+    
+    def convert_many(
+        self,
+        amounts: np.ndarray,
+        from_currencies: Iterable[Optional[str]],
+        to_currency: str
+    ) -> np.ndarray:
+        """Convert an array of amounts, each in its own currency, into to_currency"""
+        amounts = np.asarray(amounts, dtype=float)
+        target = self._position(to_currency)
+        positions = np.fromiter(
+            (self._position(code) if code else target for code in from_currencies),
+            np.intp,
+            len(amounts)
+        )
+        return amounts * self.matrix[positions, target]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "base": self.base,
+            "rates": {code: float(self.matrix[self.index[self.base], i]) for code, i in self.index.items()},
+            "loaded_at": self.loaded_at.isoformat() + "Z"
+        }
+
+
+class CurrencyService:
+    """Current rate snapshot, hot-swapped when the rates file changes"""
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.currency_rates_path
+        self._snapshot = RateSnapshot.from_rates(DEFAULT_RATES, version="builtin")
+        self._mtime: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self.reload_if_changed()
+    
+    @property
+    def snapshot(self) -> RateSnapshot:
+        """Take once per operation; a reload swaps in a new snapshot, never mutates this one"""
+        return self._snapshot
+    
+    def load(self) -> RateSnapshot:
+        """Load the rates file and swap it in as the current snapshot"""
+        with open(self.path, "rb") as f:
+            content = f.read()
+        payload = json.loads(content)
+        snapshot = RateSnapshot.from_rates(
+            payload["rates"],
+            version=payload.get("version") or hashlib.sha256(content).hexdigest()[:12],
+            base=payload.get("base", "USD")
+        )
+        self._snapshot = snapshot
+        logger.info(f"Loaded currency rates {snapshot.version} ({len(snapshot.currencies)} currencies)")
+        return snapshot
+    
+    def reload_if_changed(self) -> bool:
+        """Reload when the rates file's mtime moved; a bad file keeps the current snapshot"""
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            return False
+        if mtime == self._mtime:
+            return False
+        
+        self._mtime = mtime
+        try:
+            self.load()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error(f"Ignoring invalid currency rates file {self.path}: {e}")
+            return False
+        return True
+    
+    def start(self):
+        """Watch the rates file for changes"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._watch())
+    
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def status(self) -> Dict[str, Any]:
+        """Loaded rates for /health/detailed"""
+        return {"status": "healthy", "path": self.path, **self.snapshot.to_dict()}
+    
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(settings.currency_refresh_seconds)
+            self.reload_if_changed()
+
+
+_currency_service: Optional[CurrencyService] = None
+
+
+def get_currency_service() -> CurrencyService:
+    """Process-wide currency service"""
+    global _currency_service
+    if _currency_service is None:
+        _currency_service = CurrencyService()
+    return _currency_service
@@ -7,6 +7,7 @@ import asyncio
 import time
 import random
 import json
+import re
 from typing import Dict, List, Optional, Any, Union
 import hashlib
 
@@ -162,6 +163,8 @@ class MockAIManager:
             content = self._generate_mock_job_analysis(prompt)
         elif system_prompt and "match explanation" in system_prompt.lower():
             content = self._generate_mock_match_explanation(prompt)
+        elif system_prompt and "compliance expert" in system_prompt.lower():
+            content = self._generate_mock_compliance_analysis(prompt)
         else:
             content = self._generate_mock_chat_response(prompt)
         
@@ -417,6 +420,24 @@ class MockAIManager:
         }
         return json.dumps(analysis, indent=2)
     
+    def _generate_mock_compliance_analysis(self, prompt: str) -> str:
+        """Generate mock rule verdict JSON; a numbered rule list gets a verdict array"""
+        def verdict() -> Dict[str, Any]:
+            compliant = random.random() > 0.2
+            return {
+                "compliant": compliant,
+                "compliance_score": round(random.uniform(0.8, 1.0) if compliant else random.uniform(0.3, 0.6), 2),
+                "issue_description": "" if compliant else "Required information is missing or below the threshold",
+                "recommendation": "" if compliant else "Update the affected fields to meet the requirement",
+                "affected_fields": [],
+                "explanation": "Mock assessment"
+            }
+        
+        rule_numbers = re.findall(r"^\s*\[(\d+)\]", prompt, re.MULTILINE)
+        if rule_numbers:
+            return json.dumps([{"rule": int(number), **verdict()} for number in rule_numbers], indent=2)
+        return json.dumps(verdict(), indent=2)
+    
     def _generate_mock_chat_response(self, prompt: str) -> str:
         """Generate mock general chat response"""
         responses = [
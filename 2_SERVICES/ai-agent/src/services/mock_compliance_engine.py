@@ -0,0 +1,106 @@
+"""
+Mock Compliance Engine - In-process stand-in for the compliance engine's bulk-check API
+Answers the same request and response shapes with a few representative thresholds,
+so delegation can be exercised without running the engine
+"""
+
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+# (jurisdiction or "*", compliance type, entity type) -> [(rule id, field, operator, required, severity, description)]
+MOCK_CHECKS: Dict[Tuple[str, str, str], List[Tuple[str, str, str, Any, str, str]]] = {
+    ("*", "employment", "job_posting"): [
+        ("mock_working_time", "working_hours", "max", 48, "medium", "Working hours exceed legal maximum of 48 hours per week"),
+    ],
+    ("*", "employment", "employment_contract"): [
+        ("mock_working_time", "working_hours", "max", 48, "medium", "Working hours exceed legal maximum of 48 hours per week"),
+        ("mock_holiday_entitlement", "holiday_entitlement", "min", 20, "high", "Holiday entitlement below legal minimum of 20 days"),
+    ],
+    ("*", "data_protection", "candidate_data"): [
+        ("mock_data_consent", "data_processing_consent", "required", True, "critical", "Missing explicit consent for data processing"),
+    ],
+    ("US", "employment", "job_posting"): [
+        ("mock_working_time", "working_hours", "max", 40, "medium", "Working hours exceed legal maximum of 40 hours per week"),
+    ],
+}
+
+
+def _violation(check: Tuple[str, str, str, Any, str, str], value: Any) -> Optional[Dict[str, Any]]:
+    rule_id, field, operator, required, severity, description = check
+    if operator == "required":
+        failed = not value
+    elif not isinstance(value, (int, float)) or isinstance(value, bool) or value == 0:
+        failed = False
+    else:
+        failed = value > required if operator == "max" else value < required
+    if not failed:
+        return None
+    return {
+        "rule_id": rule_id,
+        "rule_name": rule_id.replace("_", " ").title(),
+        "severity": severity,
+        "description": description,
+        "field_name": field,
+        "current_value": None if value is None else str(value),
+        "required_value": str(required),
+        "remediation_steps": [f"Update {field} to meet the requirement"]
+    }
+
+
+def mock_check(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Engine-shaped check result for one request"""
+    key = (request["jurisdiction"], request["compliance_type"], request["entity_type"])
+    checks = MOCK_CHECKS.get(key) or MOCK_CHECKS.get(("*",) + key[1:], [])
+    data = request.get("data") or {}
+    violations = [
+        violation for violation in (_violation(check, data.get(check[1])) for check in checks) if violation
+    ]
+    return {
+        "check_id": str(uuid.uuid4()),
+        "status": "completed",
+        "compliant": not violations,
+        "jurisdiction": request["jurisdiction"],
+        "compliance_type": request["compliance_type"],
+        "entity_type": request["entity_type"],
+        "checks_performed": sorted({check[0] for check in checks}),
+        "violations": violations,
+        "recommendations": [],
+        "confidence_score": 0.95,
+        "risk_score": min(1.0, 0.3 * len(violations)),
+        "processing_time_ms": 0,
+        "checked_at": datetime.now().isoformat(),
+        "metadata": {
+            "total_rules_checked": len({check[0] for check in checks}),
+            "rules_not_evaluated": [],
+            "field_checks": [
+                {"rule_id": rule_id, "field": field, "operator": operator,
+                 "required": None if operator == "required" else required, "currency": None, "when": None}
+                for rule_id, field, operator, required, _, _ in checks
+            ],
+            "rule_set_version": "mock",
+            "additional_context": request.get("additional_context")
+        }
+    }
+
+
+def mock_compliance_engine_transport() -> httpx.MockTransport:
+    """Transport that serves /api/v1/bulk-check in process"""
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.method != "POST" or request.url.path != "/api/v1/bulk-check":
+            return httpx.Response(404, json={"detail": "Not Found"})
+        requests = json.loads(request.content).get("requests", [])
+        results = [mock_check(item) for item in requests]
+        return httpx.Response(200, json={
+            "batch_id": str(uuid.uuid4()),
+            "status": "completed",
+            "total_requests": len(requests),
+            "completed": len(results),
+            "failed": 0,
+            "results": results
+        })
+    
+    return httpx.MockTransport(handle)
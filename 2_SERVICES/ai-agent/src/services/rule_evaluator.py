@@ -0,0 +1,205 @@
+"""
+Rule Evaluator - Deterministic pre-screen of compliance rules
+
+Interprets the machine-checkable rule_parameters of compliance.regulatory_rules
+against entity fields. Clear passes and failures are resolved locally; anything
+ambiguous (missing fields, free-text requirements, exceptions in play) is left
+for AI analysis.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.services.currency import get_currency_service
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ParameterCheck:
+    """How one rule parameter is checked against an entity"""
+    kind: str  # max | min | required | allowed | any_of | prohibited_terms
+    fields: Tuple[str, ...]
+    currency: Optional[str] = None
+
+
+# Entity fields are tried in order; dotted paths reach into JSON columns
+PARAMETER_CHECKS: Dict[str, ParameterCheck] = {
+    "max_hours_per_week": ParameterCheck("max", ("hours_per_week", "working_hours.per_week", "weekly_hours")),
+    "max_hours_per_day": ParameterCheck("max", ("hours_per_day", "working_hours.per_day", "daily_hours")),
+    "minimum_wage_euro": ParameterCheck("min", ("hourly_rate", "salary_range.hourly_min"), currency="EUR"),
+    "min_contribution_rate": ParameterCheck("min", ("superannuation_rate", "pension_contribution_rate")),
+    "consent_required": ParameterCheck("required", ("data_consent", "gdpr_consent", "consent_given")),
+    "visa_types": ParameterCheck("allowed", ("visa_status", "work_authorization", "visa_type")),
+    "required_documents": ParameterCheck("any_of", ("documents", "verified_documents", "right_to_work_documents")),
+    "prohibited_terms": ParameterCheck("prohibited_terms", ("title", "description", "requirements")),
+}
+
+# Parameters that describe when or how a check happens rather than what must hold
+INFORMATIONAL_PARAMETERS = {"check_frequency", "check_timing", "applies_to", "exceptions"}
+
+# Fields a currency-converted check also reads
+CURRENCY_FIELDS = ("salary_range.currency", "currency")
+
+
+def _parse(value: Any) -> Any:
+    if isinstance(value, str) and value[:1] in ("{", "["):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+def rule_parameters(rule: Dict) -> Dict[str, Any]:
+    """A rule's parameters, whether the driver returned JSONB decoded or as text"""
+    parameters = _parse(rule.get("rule_parameters")) or {}
+    return parameters if isinstance(parameters, dict) else {}
+
+
+def converts_currency(rule: Dict) -> bool:
+    """Whether a rule's checks compare amounts converted at current exchange rates"""
+    return any(PARAMETER_CHECKS[name].currency for name in rule_parameters(rule) if name in PARAMETER_CHECKS)
+
+
+def field_value(entity_data: Dict[str, Any], path: str) -> Any:
+    """Value at a dotted path, parsing JSON-encoded columns on the way"""
+    value: Any = entity_data
+    for part in path.split("."):
+        value = _parse(value)
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return _parse(value)
+
+
+def _first_field(entity_data: Dict[str, Any], fields: Tuple[str, ...]) -> Tuple[Optional[str], Any]:
+    for path in fields:
+        value = field_value(entity_data, path)
+        if value is not None and value != "":
+            return path, value
+    return None, None
+
+
+def _entity_currency(entity_data: Dict[str, Any]) -> Optional[str]:
+    return field_value(entity_data, "salary_range.currency") or entity_data.get("currency")
+
+
+def _check_parameter(entity_data: Dict[str, Any], name: str, check: ParameterCheck,
+                     expected: Any) -> Optional[Tuple[bool, str, List[str]]]:
+    """(passed, issue, affected fields), or None when the entity does not settle it"""
+    if check.kind == "prohibited_terms":
+        texts = {
+            path: (json.dumps(value) if isinstance(value, (list, dict)) else str(value)).lower()
+            for path, value in ((path, field_value(entity_data, path)) for path in check.fields) if value
+        }
+        if not texts:
+            return None
+        found = [term for term in expected if any(term.lower() in text for text in texts.values())]
+        if found:
+            affected = [path for path, text in texts.items() if any(term.lower() in text for term in found)]
+            return False, f"Contains prohibited terms: {', '.join(found)}", affected
+        # Absence of listed terms does not rule out other discriminatory wording
+        return None
+    
+    path, value = _first_field(entity_data, check.fields)
+    if path is None:
+        return None
+    
+    if check.kind in ("max", "min"):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        if check.currency:
+            value = get_currency_service().snapshot.convert(value, _entity_currency(entity_data), check.currency)
+        if check.kind == "max" and value > expected:
+            return False, f"{path} is {value:g}, above the maximum of {expected:g}", [path]
+        if check.kind == "min" and value < expected:
+            return False, f"{path} is {value:g}, below the minimum of {expected:g}", [path]
+        return True, "", []
+    
+    if check.kind == "required":
+        if not expected:
+            return True, "", []
+        if value is False:
+            return False, f"{name.replace('_', ' ')} but {path} is not set", [path]
+        return True, "", []
+    
+    if check.kind == "allowed":
+        if str(value).lower() in {str(option).lower() for option in expected}:
+            return True, "", []
+        return False, f"{path} '{value}' is not one of {', '.join(map(str, expected))}", [path]
+    
+    if check.kind == "any_of":
+        provided = {str(item).lower() for item in value} if isinstance(value, list) else {str(value).lower()}
+        if provided & {str(option).lower() for option in expected}:
+            return True, "", []
+        # Documents may exist outside this record
+        return None
+    
+    return None
+
+
+def relevant_fields(rule: Dict) -> Optional[List[str]]:
+    """Entity fields a rule's verdict depends on, or None when it may depend on any field"""
+    parameters = rule_parameters(rule)
+    if not parameters:
+        return None
+    if set(parameters) - set(PARAMETER_CHECKS) - INFORMATIONAL_PARAMETERS:
+        return None
+    
+    fields = set(parameters.get("exceptions") or [])
+    for name in parameters:
+        check = PARAMETER_CHECKS.get(name)
+        if check:
+            fields.update(check.fields)
+            if check.currency:
+                fields.update(CURRENCY_FIELDS)
+    return sorted(fields)
+
+
+def prescreen_rule(entity_data: Dict[str, Any], rule: Dict) -> Optional[Dict[str, Any]]:
+    """Rule analysis resolved from rule_parameters alone, or None if the rule needs AI analysis"""
+    parameters = rule_parameters(rule)
+    checked = [name for name in parameters if name in PARAMETER_CHECKS]
+    if not checked:
+        return None
+    
+    uninterpreted = set(parameters) - set(checked) - INFORMATIONAL_PARAMETERS
+    failures = []
+    undetermined = False
+    for name in checked:
+        outcome = _check_parameter(entity_data, name, PARAMETER_CHECKS[name], parameters[name])
+        if outcome is None:
+            undetermined = True
+        elif not outcome[0]:
+            failures.append(outcome)
+    
+    if failures:
+        # An exception the entity claims could still excuse the failure
+        exceptions = parameters.get("exceptions") or []
+        if any(field_value(entity_data, exception) for exception in exceptions):
+            return None
+        return {
+            "compliant": False,
+            "compliance_score": 0.0,
+            "issue_description": "; ".join(issue for _, issue, _ in failures),
+            "recommendation": f"Bring the entity in line with {rule['rule_name']}",
+            "affected_fields": sorted({path for _, _, paths in failures for path in paths}),
+            "explanation": "Resolved from rule parameters",
+            "resolved_locally": True
+        }
+    
+    # A pass is only clear when every parameter was interpreted and settled
+    if undetermined or uninterpreted:
+        return None
+    return {
+        "compliant": True,
+        "compliance_score": 1.0,
+        "issue_description": "",
+        "recommendation": "",
+        "affected_fields": [],
+        "explanation": "Resolved from rule parameters",
+        "resolved_locally": True
+    }
@@ -0,0 +1,62 @@
+"""
+Verdict Cache - Per-rule compliance verdicts keyed by what they depend on
+
+A verdict is stored under (rule id, rule version, hash of the entity fields the
+rule reads), so an entity edit only invalidates the verdicts of rules that read
+the edited fields, and a rule edit only invalidates that rule's verdicts.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from src.config.redis_client import RedisManager
+from src.config.settings import get_settings
+from src.services.currency import get_currency_service
+from src.services.rule_evaluator import converts_currency, field_value, relevant_fields
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+settings = get_settings()
+
+# Columns that change without changing what a rule would conclude
+VOLATILE_FIELDS = {
+    "id", "profile_id", "created_at", "updated_at", "view_count", "application_count",
+    "compliance_checked", "compliance_results"
+}
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def rule_version(rule: Dict) -> str:
+    """Content hash of everything in a rule that can change its verdicts"""
+    return _digest([
+        rule.get("rule_category"), rule.get("rule_name"), rule.get("rule_description"),
+        rule.get("rule_parameters"), rule.get("severity")
+    ])[:12]
+
+
+class VerdictCache:
+    """Per-rule verdicts in Redis, read and written in one round trip per check"""
+    
+    def __init__(self, redis_manager: Optional[RedisManager] = None):
+        self.redis_manager = redis_manager or RedisManager()
+    
+    def key(self, entity_data: Dict[str, Any], rule: Dict) -> str:
+        fields = relevant_fields(rule)
+        if fields is None:
+            inputs = {name: value for name, value in entity_data.items() if name not in VOLATILE_FIELDS}
+        else:
+            inputs = {name: field_value(entity_data, name) for name in fields}
+            if converts_currency(rule):
+                # A converted amount's verdict also depends on the rates it was converted at
+                inputs["_currency_rates"] = get_currency_service().snapshot.version
+        return f"compliance:verdict:{rule.get('id', rule['rule_name'])}:{rule_version(rule)}:{_digest(inputs)[:16]}"
+    
+    async def get_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        return await self.redis_manager.get_many_json(keys)
+    
+    async def set_many(self, verdicts: Dict[str, Dict[str, Any]]) -> bool:
+        return await self.redis_manager.set_many_json(verdicts, ttl=settings.compliance_verdict_cache_ttl)
@@ -0,0 +1,72 @@
+import asyncio
+
+from src.services.compliance_engine_client import ComplianceEngineClient, engine_compliance_type, engine_verdicts
+from src.services.mock_compliance_engine import mock_compliance_engine_transport
+
+
+def rule(jurisdiction, parameters, category="employment_law"):
+    return {
+        "jurisdiction": jurisdiction,
+        "rule_category": category,
+        "rule_name": f"{jurisdiction} {category}",
+        "rule_parameters": parameters
+    }
+
+
+def verdict(rule, entity_type, entity_data):
+    """Delegate one rule to the mock engine, as analyze_compliance_rules does"""
+    async def run():
+        client = ComplianceEngineClient(transport=mock_compliance_engine_transport())
+        try:
+            results = await client.check(rule["jurisdiction"], entity_type, entity_data, [engine_compliance_type(rule)])
+        finally:
+            await client.close()
+        return engine_verdicts([rule], results, entity_data)[0]
+    
+    return asyncio.run(run())
+
+
+def test_weekly_hours_are_settled_by_the_engine():
+    hours = rule("DE", {"max_hours_per_week": 48})
+    
+    assert verdict(hours, "job_posting", {"hours_per_week": 50})["compliant"] is False
+    assert verdict(hours, "job_posting", {"hours_per_week": 40})["compliant"] is True
+
+
+def test_unrelated_engine_violations_do_not_count_against_a_rule():
+    # The mock engine also flags the contract's holiday entitlement
+    hours = rule("DE", {"max_hours_per_week": 48})
+    
+    result = verdict(hours, "contract", {"hours_per_week": 40, "holiday_entitlement": 5})
+    
+    assert result["compliant"] is True
+    assert result["affected_fields"] == []
+
+
+def test_fields_the_engine_never_compared_are_not_a_pass():
+    hours = rule("DE", {"max_hours_per_week": 48})
+    wage = rule("DE", {"minimum_wage_euro": 12.0}, category="minimum_wage")
+    
+    assert verdict(hours, "job_posting", {"title": "Developer"}) is None
+    # An annual salary is not compared against an hourly minimum
+    assert verdict(wage, "job_posting", {"salary_range": {"min_annual": 9000, "currency": "EUR"}}) is None
+
+
+def test_thresholds_that_differ_from_the_engine_are_not_delegated_to_it():
+    # The mock engine's limit is 48 hours
+    assert verdict(rule("AU", {"max_hours_per_week": 38}), "job_posting", {"hours_per_week": 45}) is None
+
+
+def test_rules_the_engine_cannot_express_stay_with_the_agent():
+    assert engine_compliance_type(rule("UK", {"max_hours_per_week": 48, "exceptions": ["opt_out_agreement"]})) is None
+    assert engine_compliance_type(rule("DE", {"max_hours_per_day": 10, "max_hours_per_week": 48})) is None
+    assert engine_compliance_type(rule("DE", {"consent_required": True}, "data_protection")) == "data_protection"
+
+
+def test_consent_is_required_by_the_engine():
+    consent = rule("DE", {"consent_required": True, "data_retention_months": 6}, "data_protection")
+    assert engine_compliance_type(consent) is None
+    
+    consent = rule("DE", {"consent_required": True}, "data_protection")
+    assert verdict(consent, "talent", {"first_name": "Bob"})["compliant"] is False
+    assert verdict(consent, "talent", {"gdpr_consent": True})["compliant"] is True
@@ -0,0 +1,234 @@
+"""
+Compliance check throughput benchmark
+
+Run from the compliance-engine directory:
+    python -m src.benchmark --iterations 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+
+from .models import ComplianceCheckRequest, ComplianceJurisdiction, ComplianceType
+from .services.bulk_engine import BulkComplianceEngine
+from .services.columnar_validation import ColumnarValidator
+from .services.compliance_service import ComplianceService
+from .services.result_cache import ComplianceResultCache
+from .services.scheduler import PriorityScheduler, lane_for
+
+# Entities that trip most of the built-in checks, so every rule does real work
+SAMPLE_DATA = {
+    "job_posting": {
+        "title": "Warehouse Operative",
+        "salary_min": 5.0,
+        "salary_max": 9.0,
+        "working_hours": 60,
+        "visa_sponsorship": True
+    },
+    "employment_contract": {
+        "employee_name": "Alex Smith",
+        "salary": 6.0,
+        "working_hours": 60,
+        "probation_period": 365,
+        "notice_period": 1,
+        "holiday_entitlement": 5
+    },
+    "candidate_data": {
+        "name": "Alex Smith",
+        "email": "alex@example.com",
+        "date_of_birth": "2014-06-01",
+        "data_processing_consent": False
+    }
+}
+
+# Entities that pass every built-in check
+COMPLIANT_DATA = {
+    "job_posting": {
+        "title": "Software Engineer",
+        "salary_min": 60000,
+        "working_hours": 35,
+        "equal_opportunity_statement": "We are an equal opportunity employer"
+    },
+    "employment_contract": {
+        "employee_name": "Alex Smith",
+        "salary": 60000,
+        "notice_period": 30,
+        "holiday_entitlement": 30
+    },
+    "candidate_data": {
+        "name": "Alex Smith",
+        "email": "alex@example.com",
+        "data_processing_consent": True
+    }
+}
+
+CHECK_TYPES = [
+    ("job_posting", ComplianceType.EMPLOYMENT),
+    ("employment_contract", ComplianceType.EMPLOYMENT),
+    ("candidate_data", ComplianceType.EMPLOYMENT),
+    ("candidate_data", ComplianceType.DATA_PROTECTION)
+]
+
+
+def build_requests(sample_data):
+    """One request per jurisdiction and check type"""
+    return [
+        ComplianceCheckRequest(
+            jurisdiction=jurisdiction,
+            compliance_type=compliance_type,
+            entity_type=entity_type,
+            data=dict(sample_data[entity_type])
+        )
+        for jurisdiction in ComplianceJurisdiction
+        for entity_type, compliance_type in CHECK_TYPES
+    ]
+
+
+async def run(iterations: int, compliant: bool, cache: bool):
+    # Repeated identical requests would otherwise measure cache hits only
+    service = ComplianceService(result_cache=ComplianceResultCache(enabled=cache))
+    requests = build_requests(COMPLIANT_DATA if compliant else SAMPLE_DATA)
+    
+    pairs = []
+    for request in requests:
+        rules = await service.rules_engine.get_applicable_rules(
+            request.jurisdiction, request.compliance_type, request.entity_type
+        )
+        data = service._entity_data(request.data)
+        pairs.extend((rule, request, data) for rule in rules)
+    
+    # Rule evaluation only
+    violations = 0
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for rule, request, data in pairs:
+            found = await service._check_rule_compliance(
+                rule, data, request.jurisdiction, request.entity_type
+            )
+            violations += len(found or ())
+    rule_elapsed = time.perf_counter() - start
+    
+    # Full checks, including scoring and recommendations
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for request in requests:
+            await service.perform_compliance_check(request)
+    check_elapsed = time.perf_counter() - start
+    
+    rule_evaluations = iterations * len(pairs)
+    checks = iterations * len(requests)
+    print(f"Rule evaluations: {rule_evaluations} in {rule_elapsed:.3f}s "
+          f"({rule_evaluations / rule_elapsed:,.0f}/s, "
+          f"{violations / iterations:.0f} violations per pass)")
+    print(f"Compliance checks: {checks} in {check_elapsed:.3f}s "
+          f"({checks / check_elapsed:,.0f}/s)")
+    if cache:
+        print(f"Result cache: {service.result_cache.stats()}")
+
+
+def build_catalogue(size: int):
+    """Job postings spread over every jurisdiction, a mix of compliant and not"""
+    generator = random.Random(42)
+    jurisdictions = list(ComplianceJurisdiction)
+    catalogue = []
+    for index in range(size):
+        posting = dict(SAMPLE_DATA["job_posting"] if index % 3 == 0 else COMPLIANT_DATA["job_posting"])
+        posting["salary_min"] = generator.choice([0, 5.0, 12.5, 25.0, 60000])
+        posting["working_hours"] = generator.choice([None, 35, 45, 60])
+        catalogue.append((jurisdictions[index % len(jurisdictions)], posting))
+    return catalogue
+
+
+async def run_catalogue(size: int):
+    service = ComplianceService(result_cache=ComplianceResultCache(enabled=False))
+    validator = ColumnarValidator(service.rules_engine)
+    catalogue = build_catalogue(size)
+    
+    start = time.perf_counter()
+    per_item = 0
+    for jurisdiction, posting in catalogue:
+        result = await service.perform_compliance_check(ComplianceCheckRequest(
+            jurisdiction=jurisdiction,
+            compliance_type=ComplianceType.EMPLOYMENT,
+            entity_type="job_posting",
+            data=posting
+        ))
+        per_item += not result.compliant
+    per_item_elapsed = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    violations = await validator.validate(catalogue, ComplianceType.EMPLOYMENT, "job_posting")
+    columnar_elapsed = time.perf_counter() - start
+    
+    print(f"Per-item checks: {size} postings in {per_item_elapsed:.3f}s "
+          f"({size / per_item_elapsed:,.0f}/s, {per_item} non-compliant)")
+    print(f"Columnar validation: {size} postings in {columnar_elapsed:.3f}s "
+          f"({size / columnar_elapsed:,.0f}/s, {len(violations)} non-compliant)")
+
+
+async def run_contention(size: int, interactive_checks: int = 200):
+    service = ComplianceService(result_cache=ComplianceResultCache(enabled=False))
+    scheduler = PriorityScheduler()
+    bulk_engine = BulkComplianceEngine(service, backend="asyncio", scheduler=scheduler)
+    catalogue = [
+        ComplianceCheckRequest(
+            jurisdiction=jurisdiction,
+            compliance_type=ComplianceType.EMPLOYMENT,
+            entity_type="job_posting",
+            data=posting
+        )
+        for jurisdiction, posting in build_catalogue(size)
+    ]
+    interactive = build_requests(SAMPLE_DATA)
+    
+    async def audit():
+        async for _ in bulk_engine.run(enumerate(catalogue), priority="normal"):
+            pass
+    
+    async def recruiter():
+        latencies = []
+        for index in range(interactive_checks):
+            request = interactive[index % len(interactive)]
+            start = time.perf_counter()
+            async with scheduler.slot(lane_for(request.urgency, interactive=True)):
+                await service.perform_compliance_check(request)
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0)
+        return latencies
+    
+    idle = sorted(await recruiter())
+    audit_task = asyncio.create_task(audit())
+    loaded = sorted(await recruiter())
+    await audit_task
+    
+    def percentiles(latencies):
+        return (f"p50 {1000 * latencies[len(latencies) // 2]:.2f}ms, "
+                f"p99 {1000 * latencies[int(0.99 * len(latencies))]:.2f}ms")
+    
+    print(f"Interactive checks, idle: {percentiles(idle)}")
+    print(f"Interactive checks, during a {size}-item audit: {percentiles(loaded)}")
+    print(f"Scheduler: {scheduler.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compliance check throughput")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--compliant", action="store_true", help="use entities that pass every check")
+    parser.add_argument("--cache", action="store_true", help="serve repeated checks from the result cache")
+    parser.add_argument("--catalogue", type=int, help="compare per-item and columnar validation of this many job postings")
+    parser.add_argument("--contention", type=int, help="measure interactive check latency while a batch of this many checks runs")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    if args.contention:
+        asyncio.run(run_contention(args.contention))
+    elif args.catalogue:
+        asyncio.run(run_catalogue(args.catalogue))
+    else:
+        asyncio.run(run(args.iterations, args.compliant, args.cache))
+
+
+if __name__ == "__main__":
+    main()
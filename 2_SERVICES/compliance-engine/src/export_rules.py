@@ -0,0 +1,39 @@
+"""
+Export the built-in rules and jurisdiction parameters as a rule data file
+
+Run from the compliance-engine directory:
+    python -m src.export_rules --label 2026.10 > config/compliance_rules.json
+
+Edit the file and the running service picks it up (RULES_DATA_PATH). Either
+section may be dropped: a file with only "jurisdictions" overrides parameters
+of the built-in rules, e.g. {"version": "2026.10", "jurisdictions": {"UK": {"minimum_wage": 12.21}}}
+"""
+
+import argparse
+import json
+import logging
+
+from .services.jurisdiction_service import JurisdictionService
+from .services.rules_engine import RulesEngine, rule_to_dict
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export built-in compliance rules as a rule data file")
+    parser.add_argument("--label", help="version label recorded in the file")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    # Export the built-in data even if a rule data file is already in place
+    snapshot = RulesEngine(JurisdictionService(), data_path="/nonexistent").snapshot
+    payload = {
+        "version": args.label,
+        "jurisdictions": {
+            jurisdiction.value: dict(data) for jurisdiction, data in snapshot.jurisdiction_data.items()
+        },
+        "rules": [rule_to_dict(rule) for rule in snapshot.rules]
+    }
+    print(json.dumps(payload, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from typing import Dict, List, Optional
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import ValidationError
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+from typing import AsyncIterator, Dict, List, Optional
 import os
 import json
 import uuid
+import asyncio
 import logging
 from datetime import datetime
 
@@ -13,6 +17,10 @@ from .models import (
     ComplianceCheckResult,
     BulkComplianceRequest,
     BulkComplianceResult,
+    BulkValidationRequest,
+    DifferentialAuditRequest,
+    PortfolioRiskRequest,
+    ResultDetail,
     ComplianceJurisdiction,
     ComplianceType,
     ComplianceStatus,
@@ -20,7 +28,16 @@ from .models import (
 )
 from .services.compliance_service import ComplianceService
 from .services.jurisdiction_service import JurisdictionService
-from .services.rules_engine import RulesEngine
+from .services.bulk_engine import BulkComplianceEngine
+from .services.scheduler import PriorityScheduler, lane_for
+from .services.batch_store import BatchJobStore
+from .services.webhooks import WebhookNotifier, valid_webhook_url
+from .services.differential_audit import DifferentialAuditor
+from .services.portfolio_risk import PortfolioRiskAggregator
+from .services import result_views
+from .services.columnar_validation import ColumnarValidator
+from .services.currency import get_currency_service
+from .services.aggregates import ComplianceAggregates
 
 # Configure logging
 logging.basicConfig(
@@ -47,9 +64,31 @@ app.add_middleware(
 )
 
 # Initialize services
-compliance_service = ComplianceService()
-jurisdiction_service = JurisdictionService()
-rules_engine = RulesEngine()
+batch_store = BatchJobStore()
+# Report aggregates keep their hourly counts in the batch store, which they are rebuilt from
+aggregates = ComplianceAggregates(store=batch_store)
+compliance_service = ComplianceService(aggregates=aggregates)
+# Endpoints share the check service's rules, so a rule reload is seen everywhere at once
+jurisdiction_service = compliance_service.jurisdiction_service
+rules_engine = compliance_service.rules_engine
+# One scheduler for single checks and batches, so bulk audits cannot crowd out interactive checks
+scheduler = PriorityScheduler()
+bulk_engine = BulkComplianceEngine(compliance_service, scheduler=scheduler)
+notifier = WebhookNotifier(batch_store)
+auditor = DifferentialAuditor(compliance_service, batch_store, scheduler)
+# Every rule set results are checked under is recorded, so later changes can be diffed against it
+rules_engine.on_swap(auditor.record_rule_set)
+audit_lock = asyncio.Lock()
+portfolio_risk = PortfolioRiskAggregator(batch_store)
+columnar_validator = ColumnarValidator(compliance_service.rules_engine)
+currency_service = get_currency_service()
+
+# Bulk processing limits
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", 50000))
+BULK_SYNC_LIMIT = int(os.getenv("BULK_SYNC_LIMIT", 100))
+# Longest NDJSON line the streaming endpoint buffers while looking for its end
+STREAM_MAX_LINE_BYTES = int(os.getenv("STREAM_MAX_LINE_BYTES", 1024 * 1024))
+BATCH_RESULTS_FLUSH_SIZE = 200
 
 # Dependency injection
 async def get_compliance_service():
@@ -58,6 +97,29 @@ async def get_compliance_service():
 async def get_jurisdiction_service():
     return jurisdiction_service
 
+@app.on_event("startup")
+async def start_refresh_watchers():
+    currency_service.start()
+    rules_engine.start()
+    aggregates.start()
+    notifier.start()
+
+@app.on_event("startup")
+async def resume_interrupted_batches():
+    """Pick up background batches a previous process accepted but did not finish"""
+    for batch_id in batch_store.incomplete_batches():
+        logger.info(f"Resuming interrupted batch {batch_id}")
+        asyncio.create_task(process_bulk_compliance(batch_id))
+
+@app.on_event("shutdown")
+async def shutdown_bulk_engine():
+    bulk_engine.shutdown()
+    await notifier.stop()
+    batch_store.close()
+    await currency_service.stop()
+    await rules_engine.stop()
+    await aggregates.stop()
+
 # Health and status endpoints
 @app.get("/health")
 async def health_check():
@@ -88,11 +150,21 @@ async def get_status():
             "/status", 
             "/api/v1/check",
             "/api/v1/bulk-check",
+            "/api/v1/bulk-validate",
             "/api/v1/jurisdictions",
             "/api/v1/rules",
+            "/api/v1/audits/differential",
+            "/api/v1/portfolio-risk",
+            "/api/v1/currency/rates",
             "/api/v1/validate",
             "/api/v1/reports/summary"
-        ]
+        ],
+        "rule_set": rules_engine.snapshot.info(),
+        "result_cache": compliance_service.result_cache.stats(),
+        "scheduler": scheduler.stats(),
+        "webhooks": notifier.stats(),
+        "portfolio_risk": portfolio_risk.stats(),
+        "currency_rates_version": currency_service.snapshot.version
     }
 
 # Main compliance endpoints
@@ -104,7 +176,8 @@ async def perform_compliance_check(
     """Perform comprehensive compliance check for given jurisdiction and data"""
     try:
         logger.info(f"Starting compliance check for {request.jurisdiction} - {request.compliance_type}")
-        result = await service.perform_compliance_check(request)
+        async with scheduler.slot(lane_for(request.urgency, interactive=True)):
+            result = await service.perform_compliance_check(request)
         logger.info(f"Compliance check completed: {result.check_id}")
         return result
     except Exception as e:
@@ -114,29 +187,46 @@ async def perform_compliance_check(
 @app.post("/api/v1/bulk-check")
 async def perform_bulk_compliance_check(
     request: BulkComplianceRequest,
-    background_tasks: BackgroundTasks,
-    service: ComplianceService = Depends(get_compliance_service)
+    background_tasks: BackgroundTasks
 ):
     """Perform bulk compliance checks"""
     try:
         batch_id = request.batch_id or str(uuid.uuid4())
         
-        if len(request.requests) > 100:
+        if len(request.requests) > BULK_MAX_ITEMS:
             raise HTTPException(
                 status_code=400, 
-                detail="Bulk requests limited to 100 items per batch"
+                detail=f"Bulk requests limited to {BULK_MAX_ITEMS} items per batch"
             )
+        if request.notification_webhook and not valid_webhook_url(request.notification_webhook):
+            raise HTTPException(status_code=400, detail="notification_webhook must be an http(s) URL")
         
         # Process smaller batches immediately, larger ones in background
-        if len(request.requests) <= 10:
-            results = []
-            for req in request.requests:
-                try:
-                    result = await service.perform_compliance_check(req)
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Individual check failed: {e}")
-                    continue
+        if len(request.requests) <= BULK_SYNC_LIMIT:
+            started_at = datetime.now()
+            full = request.detail == ResultDetail.FULL
+            outcomes = [
+                outcome async for outcome in bulk_engine.run(
+                    enumerate(request.requests), priority=request.priority, interactive=True, full=full
+                )
+            ]
+            outcomes.sort(key=lambda outcome: outcome.index)
+            results = [outcome.result or outcome.verdict for outcome in outcomes if outcome.error is None]
+            
+            if not full:
+                # Columnar arrays built from check verdicts, without full results or the response model
+                return ORJSONResponse({
+                    "batch_id": batch_id,
+                    "status": ComplianceStatus.COMPLETED.value,
+                    "detail": request.detail.value,
+                    "total_requests": len(request.requests),
+                    "completed": len(results),
+                    "failed": len(request.requests) - len(results),
+                    "results": result_views.outcome_columns(outcomes, request.detail),
+                    "started_at": started_at.isoformat(),
+                    "completed_at": datetime.now().isoformat(),
+                    "summary": summarize_results(results)
+                })
             
             return BulkComplianceResult(
                 batch_id=batch_id,
@@ -145,30 +235,177 @@ async def perform_bulk_compliance_check(
                 completed=len(results),
                 failed=len(request.requests) - len(results),
                 results=results,
-                started_at=datetime.now(),
+                started_at=started_at,
                 completed_at=datetime.now(),
-                summary={
-                    "compliant": len([r for r in results if r.compliant]),
-                    "non_compliant": len([r for r in results if not r.compliant]),
-                    "average_confidence": sum(r.confidence_score for r in results) / len(results) if results else 0
-                }
+                summary=summarize_results(results)
             )
         else:
-            # Process in background for larger batches
-            background_tasks.add_task(process_bulk_compliance, batch_id, request.requests, service)
+            # Persist the batch, then process it in background
+            created = batch_store.create_batch(
+                batch_id,
+                ((index, req.model_dump_json()) for index, req in enumerate(request.requests)),
+                total_requests=len(request.requests),
+                priority=request.priority,
+                notification_webhook=request.notification_webhook
+            )
+            if not created:
+                raise HTTPException(status_code=409, detail=f"Batch {batch_id} already exists")
+            
+            background_tasks.add_task(process_bulk_compliance, batch_id)
             
             return {
                 "batch_id": batch_id,
                 "status": "processing",
                 "message": "Bulk compliance check started in background",
                 "total_requests": len(request.requests),
-                "estimated_completion": "5-10 minutes"
+                "status_url": f"/api/v1/bulk-check/{batch_id}",
+                "results_url": f"/api/v1/bulk-check/{batch_id}/results"
             }
-            
+    
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Bulk compliance check failed: {e}")
         raise HTTPException(status_code=500, detail=f"Bulk check failed: {str(e)}")
 
+@app.post("/api/v1/bulk-check/stream")
+async def stream_bulk_compliance_check(
+    request: Request,
+    batch_id: Optional[str] = None,
+    priority: str = "normal",
+    detail: ResultDetail = ResultDetail.FULL
+):
+    """Check an NDJSON stream of compliance requests, streaming NDJSON results as they complete"""
+    batch_id = batch_id or str(uuid.uuid4())
+    parse_errors = []
+    body_read = False
+    
+    # Requests are parsed as their lines arrive, so only the items in flight are held in memory
+    async def indexed_requests():
+        nonlocal body_read
+        index = 0
+        try:
+            async for line in ndjson_lines(request.stream(), STREAM_MAX_LINE_BYTES):
+                if index >= BULK_MAX_ITEMS:
+                    parse_errors.append((index, f"Bulk requests limited to {BULK_MAX_ITEMS} items per batch"))
+                    return
+                try:
+                    yield index, ComplianceCheckRequest.model_validate_json(line)
+                except ValidationError as e:
+                    parse_errors.append((index, f"Invalid request: {e.errors()}"))
+                index += 1
+        except ValueError as e:
+            parse_errors.append((index, str(e)))
+        finally:
+            body_read = True
+    
+    def error_line(index: int, error: str) -> bytes:
+        return result_views.dumps({"index": index, "error": error}) + b"\n"
+    
+    async def results():
+        completed = failed = 0
+        try:
+            async for outcome in bulk_engine.run(indexed_requests(), priority=priority, full=detail == ResultDetail.FULL):
+                while parse_errors:
+                    failed += 1
+                    yield error_line(*parse_errors.pop(0))
+                if outcome.error is None:
+                    completed += 1
+                else:
+                    failed += 1
+                yield result_views.outcome_line(outcome, detail)
+                # Once the body is read, receiving no longer takes request data away from the generator
+                if body_read and await request.is_disconnected():
+                    logger.info(f"Client left streaming batch {batch_id}; stopping")
+                    return
+        except ClientDisconnect:
+            logger.info(f"Client left streaming batch {batch_id} while sending it; stopping")
+            return
+        for index, error in parse_errors:
+            failed += 1
+            yield error_line(index, error)
+        yield result_views.dumps({"batch_id": batch_id, "completed": completed, "failed": failed}) + b"\n"
+    
+    return RequestBodyStreamingResponse(results(), media_type="application/x-ndjson")
+
+@app.post("/api/v1/bulk-validate")
+async def bulk_validate(request: BulkValidationRequest):
+    """Validate a large catalogue against threshold rules, reporting failing items only"""
+    if len(request.items) > BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Bulk validation limited to {BULK_MAX_ITEMS} items per batch"
+        )
+    
+    start_time = datetime.now()
+    try:
+        violations = await columnar_validator.validate(
+            [(item.jurisdiction, item.data) for item in request.items],
+            request.compliance_type,
+            request.entity_type
+        )
+    except Exception as e:
+        logger.error(f"Bulk validation failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Bulk validation failed: {str(e)}")
+    
+    processing_time = (datetime.now() - start_time).total_seconds() * 1000
+    return {
+        "total_items": len(request.items),
+        "compliant": len(request.items) - len(violations),
+        "non_compliant": len(violations),
+        "rule_set_version": rules_engine.version,
+        "processing_time_ms": int(processing_time),
+        "violations": [
+            {"index": index, "violations": violations[index]}
+            for index in sorted(violations)
+        ]
+    }
+
+@app.get("/api/v1/bulk-check/{batch_id}")
+async def get_bulk_compliance_status(batch_id: str):
+    """Get status, progress and summary of a background bulk check"""
+    batch = batch_store.get_batch(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found")
+    return batch
+
+@app.get("/api/v1/bulk-check/{batch_id}/results")
+async def get_bulk_compliance_results(
+    batch_id: str,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+    status: Optional[str] = Query(default=None, pattern="^(completed|failed)$"),
+    detail: ResultDetail = ResultDetail.FULL
+):
+    """Get a page of per-item results of a background bulk check, in request order"""
+    batch = batch_store.get_batch(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found")
+    
+    if detail != ResultDetail.FULL:
+        rows = batch_store.get_result_summaries(
+            batch_id, offset, limit, status, violations=detail == ResultDetail.VIOLATIONS
+        )
+        return ORJSONResponse({
+            "batch_id": batch_id,
+            "status": batch["status"],
+            "detail": detail.value,
+            "offset": offset,
+            "limit": limit,
+            "next_offset": offset + len(rows) if len(rows) == limit else None,
+            "results": result_views.stored_columns(rows, detail)
+        })
+    
+    results = batch_store.get_results(batch_id, offset, limit, status)
+    return {
+        "batch_id": batch_id,
+        "status": batch["status"],
+        "offset": offset,
+        "limit": limit,
+        "next_offset": offset + len(results) if len(results) == limit else None,
+        "results": results
+    }
+
 @app.get("/api/v1/jurisdictions")
 async def get_supported_jurisdictions(
     jurisdiction_service: JurisdictionService = Depends(get_jurisdiction_service)
@@ -194,15 +431,12 @@ async def get_jurisdiction_details(
     """Get detailed information about a specific jurisdiction"""
     try:
         info = await jurisdiction_service.get_jurisdiction_info(jurisdiction)
-        applicable_rules = await rules_engine.get_applicable_rules(jurisdiction, None, None)
+        rules_by_type = rules_engine.count_rules_by_type(jurisdiction)
         
         return {
             **info,
-            "total_rules": len(applicable_rules),
-            "rules_by_type": {
-                comp_type.value: len([r for r in applicable_rules if r.compliance_type == comp_type])
-                for comp_type in ComplianceType
-            }
+            "total_rules": sum(rules_by_type.values()),
+            "rules_by_type": rules_by_type
         }
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Jurisdiction not found: {str(e)}")
@@ -215,7 +449,7 @@ async def get_compliance_rules(
 ):
     """Get compliance rules with optional filtering"""
     try:
-        all_rules = await rules_engine.get_applicable_rules(jurisdiction, compliance_type, entity_type)
+        all_rules = rules_engine.list_rules(jurisdiction, compliance_type, entity_type)
         
         return {
             "total_rules": len(all_rules),
@@ -241,6 +475,85 @@ async def get_compliance_rules(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch rules: {str(e)}")
 
+@app.post("/api/v1/rules/reload")
+async def reload_rules(background_tasks: BackgroundTasks, audit: bool = False):
+    """Reload rules and jurisdiction parameters from the rule data file without waiting for the next refresh"""
+    try:
+        snapshot = await asyncio.to_thread(rules_engine.reload)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Rule data file not found: {rules_engine.data_path}")
+    except (ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid rule data file: {str(e)}")
+    info = snapshot.info()
+    if audit:
+        info["audit"] = start_differential_audit(background_tasks)
+    return info
+
+@app.post("/api/v1/audits/differential")
+async def differential_audit(request: DifferentialAuditRequest, background_tasks: BackgroundTasks):
+    """Re-check stored batch results against only the rules changed since they were checked"""
+    return start_differential_audit(background_tasks, request.from_version)
+
+@app.get("/api/v1/audits/{audit_id}")
+async def get_differential_audit(audit_id: str):
+    """Status and delta report of a differential audit"""
+    audit = batch_store.get_audit(audit_id)
+    if audit is None:
+        raise HTTPException(status_code=404, detail=f"Audit {audit_id} not found")
+    return audit
+
+@app.post("/api/v1/portfolio-risk")
+async def get_portfolio_risk(request: PortfolioRiskRequest):
+    """Aggregate risk distribution, top violated rules and breakdowns over stored batches and/or given entities"""
+    if not request.batch_ids and not request.requests:
+        raise HTTPException(status_code=400, detail="Provide batch_ids, requests or both")
+    if len(request.requests) > BULK_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Portfolio requests limited to {BULK_MAX_ITEMS} entities")
+    
+    frames, missing = [], []
+    for batch_id in dict.fromkeys(request.batch_ids):
+        frame = portfolio_risk.batch_frame(batch_id)
+        if frame is None:
+            missing.append(batch_id)
+        else:
+            frames.append(frame)
+    if missing and len(missing) == len(request.batch_ids) and not request.requests:
+        raise HTTPException(status_code=404, detail=f"Batches not found: {', '.join(missing)}")
+    
+    failed = 0
+    if request.requests:
+        # Repeat entities are answered from the result cache
+        outcomes = [outcome async for outcome in bulk_engine.run(enumerate(request.requests), interactive=True)]
+        outcomes.sort(key=lambda outcome: outcome.index)
+        results = [outcome.result for outcome in outcomes if outcome.result is not None]
+        failed = len(request.requests) - len(results)
+        frames.append(portfolio_risk.results_frame(results))
+    
+    return {
+        **portfolio_risk.summarize(frames, request.top_rules),
+        "batch_ids": [batch_id for batch_id in dict.fromkeys(request.batch_ids) if batch_id not in missing],
+        "missing_batches": missing,
+        "failed_requests": failed,
+        "rule_set_version": rules_engine.snapshot.version,
+        "generated_at": datetime.now().isoformat()
+    }
+
+@app.get("/api/v1/currency/rates")
+async def get_currency_rates():
+    """Get the exchange rate snapshot used by salary checks"""
+    return currency_service.snapshot.to_dict()
+
+@app.post("/api/v1/currency/reload")
+async def reload_currency_rates():
+    """Reload exchange rates from the rates file without waiting for the next refresh"""
+    try:
+        snapshot = currency_service.load()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Rates file not found: {currency_service.path}")
+    except (ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid rates file: {str(e)}")
+    return snapshot.to_dict()
+
 @app.post("/api/v1/validate")
 async def validate_compliance_data(data: Dict):
     """Validate compliance data format and completeness"""
@@ -286,56 +599,121 @@ async def validate_compliance_data(data: Dict):
 @app.get("/api/v1/reports/summary")
 async def get_compliance_summary():
     """Get compliance status summary with enhanced metrics"""
-    # In production, this would query actual compliance data
+    return aggregates.summary()
+
+@app.post("/api/v1/reports/rebuild")
+async def rebuild_compliance_summary():
+    """Recompute the summary aggregates from the check counts kept in the batch store"""
+    try:
+        await aggregates.rebuild_from_store()
+    except Exception as e:
+        logger.error(f"Aggregate rebuild failed: {e}")
+        raise HTTPException(status_code=503, detail=f"Aggregate rebuild failed: {str(e)}")
+    return aggregates.summary()
+
+def summarize_results(results: List[ComplianceCheckResult]) -> Dict:
     return {
-        "summary": {
-            "total_checks": 2847,
-            "compliant_entities": 2456,
-            "non_compliant_entities": 391,
-            "compliance_rate": 86.3,
-            "average_confidence_score": 0.891
-        },
-        "jurisdiction_breakdown": {
-            "UK": {"checks": 542, "compliance_rate": 89.1},
-            "EU": {"checks": 634, "compliance_rate": 87.4},
-            "US": {"checks": 721, "compliance_rate": 83.2},
-            "AU": {"checks": 398, "compliance_rate": 91.2},
-            "CA": {"checks": 287, "compliance_rate": 88.5},
-            "JP": {"checks": 156, "compliance_rate": 94.2},
-            "SG": {"checks": 79, "compliance_rate": 92.4},
-            "KR": {"checks": 30, "compliance_rate": 86.7}
-        },
-        "top_violations": [
-            {"rule": "gdpr_compliance", "count": 67, "severity": "critical"},
-            {"rule": "minimum_wage_compliance", "count": 45, "severity": "high"},
-            {"rule": "working_time_directive", "count": 38, "severity": "medium"},
-            {"rule": "holiday_entitlement", "count": 31, "severity": "high"},
-            {"rule": "equal_opportunity_requirements", "count": 28, "severity": "high"}
-        ],
-        "compliance_trends": {
-            "last_30_days": {"checks": 892, "compliance_rate": 88.1},
-            "last_7_days": {"checks": 234, "compliance_rate": 89.7},
-            "yesterday": {"checks": 41, "compliance_rate": 92.7}
-        },
-        "last_updated": datetime.now().isoformat()
+        "compliant": len([r for r in results if r.compliant]),
+        "non_compliant": len([r for r in results if not r.compliant]),
+        "average_confidence": sum(r.confidence_score for r in results) / len(results) if results else 0
     }
 
+async def ndjson_lines(chunks: AsyncIterator[bytes], max_line_bytes: Optional[int] = None) -> AsyncIterator[bytes]:
+    """Split a byte stream into non-empty lines; ValueError if a line grows past max_line_bytes"""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+        if max_line_bytes and len(buffer) > max_line_bytes:
+            raise ValueError(f"NDJSON line longer than {max_line_bytes} bytes")
+    if buffer.strip():
+        yield buffer
+
+class RequestBodyStreamingResponse(StreamingResponse):
+    """Streaming response whose content is produced while the request body is still being read
+    
+    StreamingResponse watches for disconnects by receiving in parallel with the
+    stream, which would swallow request body messages. Here only the content
+    generator receives: through request.stream(), then request.is_disconnected().
+    """
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
 # Background task for bulk processing
-async def process_bulk_compliance(batch_id: str, requests: List[ComplianceCheckRequest], service: ComplianceService):
-    """Process bulk compliance checks in background"""
+async def process_bulk_compliance(batch_id: str):
+    """Process a stored batch's outstanding requests in background, persisting results as they complete"""
     logger.info(f"Starting background bulk processing for batch {batch_id}")
+    batch_store.mark_started(batch_id)
+    batch = batch_store.get_batch(batch_id)
+    notify = bool(batch["notification_webhook"])
+    
+    def pending_requests():
+        for index, payload in batch_store.pending_items(batch_id):
+            yield index, ComplianceCheckRequest.model_validate_json(payload)
+    
+    try:
+        buffered = []
+        async for outcome in bulk_engine.run(pending_requests(), priority=batch["priority"]):
+            if outcome.result is not None:
+                buffered.append({
+                    "index": outcome.index,
+                    "compliant": outcome.result.compliant,
+                    "confidence_score": outcome.result.confidence_score,
+                    "result": outcome.result.model_dump_json(),
+                    "jurisdiction": outcome.result.jurisdiction.value,
+                    "compliance_type": outcome.result.compliance_type.value,
+                    "entity_type": outcome.result.entity_type,
+                    "rule_set_version": outcome.result.metadata.get("rule_set_version")
+                })
+            else:
+                buffered.append({"index": outcome.index, "error": outcome.error})
+            
+            if len(buffered) >= BATCH_RESULTS_FLUSH_SIZE:
+                batch_store.record_results(batch_id, buffered)
+                buffered = []
+                if notify:
+                    notifier.batch_progress(batch_store.get_batch(batch_id))
+        
+        batch_store.record_results(batch_id, buffered)
+        batch_store.finish_batch(batch_id)
+    except Exception as e:
+        logger.error(f"Background bulk processing failed for batch {batch_id}: {e}")
+        batch_store.finish_batch(batch_id, status="failed", error=str(e))
+        notifier.batch_finished(batch_store.get_batch(batch_id))
+        return
     
-    results = []
-    for i, request in enumerate(requests):
+    batch = batch_store.get_batch(batch_id)
+    notifier.batch_finished(batch)
+    logger.info(f"Completed background bulk processing for batch {batch_id}: "
+                f"{batch['completed']} successful, {batch['failed']} failed")
+
+def start_differential_audit(background_tasks: BackgroundTasks, from_version: Optional[str] = None) -> Dict:
+    audit_id = str(uuid.uuid4())
+    batch_store.create_audit(audit_id, from_version, rules_engine.version)
+    background_tasks.add_task(run_differential_audit, audit_id, from_version)
+    return {
+        "audit_id": audit_id,
+        "status": "processing",
+        "to_version": rules_engine.version,
+        "status_url": f"/api/v1/audits/{audit_id}"
+    }
+
+async def run_differential_audit(audit_id: str, from_version: Optional[str] = None):
+    """Background differential audit; one at a time, so two never re-check the same results"""
+    async with audit_lock:
         try:
-            result = await service.perform_compliance_check(request)
-            results.append(result)
-            logger.info(f"Processed {i+1}/{len(requests)} requests in batch {batch_id}")
+            report = await auditor.run(audit_id, from_version)
         except Exception as e:
-            logger.error(f"Failed to process request {i+1} in batch {batch_id}: {e}")
-            continue
-    
-    logger.info(f"Completed background bulk processing for batch {batch_id}: {len(results)} successful")
+            logger.error(f"Differential audit {audit_id} failed: {e}")
+            batch_store.finish_audit(audit_id, status="failed", error=str(e))
+            return
+        batch_store.finish_audit(audit_id, report)
 
 if __name__ == "__main__":
     import uvicorn
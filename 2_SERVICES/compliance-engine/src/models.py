@@ -33,13 +33,18 @@ class ComplianceStatus(str, Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
+class ResultDetail(str, Enum):
+    SUMMARY = "summary"
+    VIOLATIONS = "violations"
+    FULL = "full"
+
 class JobPosting(BaseModel):
     title: str
     description: str
     requirements: List[str]
     salary_min: Optional[float] = None
     salary_max: Optional[float] = None
-    currency: str = "USD"
+    currency: Optional[str] = None  # None: stated in the jurisdiction's currency
     employment_type: str = "full-time"
     working_hours: Optional[float] = None
     location: str
@@ -57,7 +62,7 @@ class EmploymentContract(BaseModel):
     position: str
     start_date: datetime
     salary: float
-    currency: str = "USD"
+    currency: Optional[str] = None  # None: stated in the jurisdiction's currency
     working_hours: float = 40.0
     overtime_rate: Optional[float] = None
     probation_period: Optional[int] = None
@@ -152,6 +157,24 @@ class BulkComplianceRequest(BaseModel):
     batch_id: Optional[str] = None
     priority: str = Field(default="normal", description="normal, high, critical")
     notification_webhook: Optional[str] = None
+    detail: ResultDetail = Field(default=ResultDetail.FULL, description="summary, violations or full results in the response")
+
+class BulkValidationItem(BaseModel):
+    jurisdiction: ComplianceJurisdiction
+    data: Dict[str, Any]
+
+class BulkValidationRequest(BaseModel):
+    items: List[BulkValidationItem]
+    compliance_type: ComplianceType = ComplianceType.EMPLOYMENT
+    entity_type: str = Field(default="job_posting", description="Entity type shared by every item")
+
+class DifferentialAuditRequest(BaseModel):
+    from_version: Optional[str] = Field(default=None, description="Only re-check results checked under this rule set version")
+
+class PortfolioRiskRequest(BaseModel):
+    batch_ids: List[str] = Field(default_factory=list, description="Stored bulk batches to aggregate")
+    requests: List[ComplianceCheckRequest] = Field(default_factory=list, description="Entities to check and aggregate")
+    top_rules: int = Field(default=10, ge=1, le=100)
 
 class BulkComplianceResult(BaseModel):
     batch_id: str
@@ -0,0 +1,248 @@
+import asyncio
+import heapq
+import json
+import os
+import sqlite3
+import time
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models import ComplianceCheckResult, ComplianceJurisdiction, ComplianceViolation
+from .batch_store import BatchJobStore
+
+logger = logging.getLogger(__name__)
+
+BUCKET_SECONDS = 3600
+WINDOW_DAYS = 30
+WINDOW_BUCKETS = WINDOW_DAYS * 24 * 3600 // BUCKET_SECONDS
+
+def _empty_state() -> Dict[str, Any]:
+    return {
+        # totals/jurisdictions: [checks, compliant, confidence_sum]
+        "totals": [0, 0, 0.0],
+        "jurisdictions": {},
+        # rule_id -> [violation count, severity]
+        "rules": {},
+        # hour bucket (epoch seconds // BUCKET_SECONDS) -> [checks, compliant]
+        "buckets": {},
+        "rebuilt_at": None
+    }
+
+def _rate(checks: int, compliant: int) -> float:
+    return round(compliant / checks * 100, 1) if checks else 0.0
+
+class ComplianceAggregates:
+    """Running compliance totals, updated as each check completes and read without scanning checks
+    
+    Alongside the JSON snapshot of the totals, each flush adds the hourly counts
+    recorded since the last one to the store, so the report can be rebuilt from
+    exactly what was counted.
+    """
+    
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        flush_seconds: Optional[float] = None,
+        store: Optional[BatchJobStore] = None
+    ):
+        self.path = path or os.getenv("AGGREGATES_PATH", "data/compliance_aggregates.json")
+        self.flush_seconds = flush_seconds or float(os.getenv("AGGREGATES_FLUSH_SECONDS", 30))
+        self.store = store
+        self._state = _empty_state()
+        self._dirty = False
+        # Counts recorded since the last flush: (bucket, jurisdiction) and (bucket, rule_id)
+        self._check_counts: Dict[Tuple[int, str], List[Any]] = {}
+        self._violation_counts: Dict[Tuple[int, str], List[Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.load()
+    
+    def record(self, result: ComplianceCheckResult):
+        """Count one completed check"""
+        self.record_verdict(result.jurisdiction, result.compliant, result.confidence_score, result.violations)
+    
+    def record_verdict(
+        self,
+        jurisdiction: ComplianceJurisdiction,
+        compliant: bool,
+        confidence: float,
+        violations: List[ComplianceViolation]
+    ):
+        """Count one completed check from its headline outcome"""
+        state = self._state
+        compliant = int(compliant)
+        now_bucket = int(time.time() // BUCKET_SECONDS)
+        
+        totals = state["totals"]
+        totals[0] += 1
+        totals[1] += compliant
+        totals[2] += confidence
+        
+        counts = state["jurisdictions"].setdefault(jurisdiction.value, [0, 0, 0.0])
+        counts[0] += 1
+        counts[1] += compliant
+        counts[2] += confidence
+        if self.store:
+            counts = self._check_counts.setdefault((now_bucket, jurisdiction.value), [0, 0, 0.0])
+            counts[0] += 1
+            counts[1] += compliant
+            counts[2] += confidence
+        
+        for violation in violations:
+            rule = state["rules"].setdefault(violation.rule_id, [0, violation.severity.value])
+            rule[0] += 1
+            rule[1] = violation.severity.value
+            if self.store:
+                rule = self._violation_counts.setdefault((now_bucket, violation.rule_id), [0, violation.severity.value])
+                rule[0] += 1
+                rule[1] = violation.severity.value
+        
+        buckets = state["buckets"]
+        if now_bucket not in buckets:
+            buckets[now_bucket] = [0, 0]
+            # Only when a bucket opens can an old one fall out of the window
+            for bucket in [bucket for bucket in buckets if bucket <= now_bucket - WINDOW_BUCKETS]:
+                del buckets[bucket]
+        buckets[now_bucket][0] += 1
+        buckets[now_bucket][1] += compliant
+        self._dirty = True
+    
+    def _window(self, buckets: Dict[int, List[int]], start: int, end: int) -> Dict[str, Any]:
+        checks = compliant = 0
+        for bucket, (bucket_checks, bucket_compliant) in buckets.items():
+            if start <= bucket < end:
+                checks += bucket_checks
+                compliant += bucket_compliant
+        return {"checks": checks, "compliance_rate": _rate(checks, compliant)}
+    
+    def summary(self) -> Dict[str, Any]:
+        """Report summary from the running totals; cost is bounded by rules and window buckets, not checks"""
+        state = self._state
+        checks, compliant, confidence_sum = state["totals"]
+        
+        now_bucket = int(time.time() // BUCKET_SECONDS) + 1
+        day = 24 * 3600 // BUCKET_SECONDS
+        midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        today_bucket = int(midnight.timestamp() // BUCKET_SECONDS)
+        
+        # Ties break by rule id, so a rebuilt summary lists the same rules
+        top_violations = heapq.nsmallest(5, state["rules"].items(), key=lambda item: (-item[1][0], item[0]))
+        
+        return {
+            "summary": {
+                "total_checks": checks,
+                "compliant_entities": compliant,
+                "non_compliant_entities": checks - compliant,
+                "compliance_rate": _rate(checks, compliant),
+                "average_confidence_score": round(confidence_sum / checks, 3) if checks else 0.0
+            },
+            "jurisdiction_breakdown": {
+                jurisdiction: {
+                    "checks": counts[0],
+                    "compliance_rate": _rate(counts[0], counts[1]),
+                    "average_confidence_score": round(counts[2] / counts[0], 3) if counts[0] else 0.0
+                }
+                for jurisdiction, counts in state["jurisdictions"].items()
+            },
+            "top_violations": [
+                {"rule": rule_id, "count": count, "severity": severity}
+                for rule_id, (count, severity) in top_violations
+            ],
+            "compliance_trends": {
+                "last_30_days": self._window(state["buckets"], now_bucket - WINDOW_BUCKETS, now_bucket),
+                "last_7_days": self._window(state["buckets"], now_bucket - 7 * day, now_bucket),
+                "last_24_hours": self._window(state["buckets"], now_bucket - day, now_bucket),
+                "yesterday": self._window(state["buckets"], today_bucket - day, today_bucket)
+            },
+            "rebuilt_at": state["rebuilt_at"],
+            "last_updated": datetime.now().isoformat()
+        }
+    
+    def load(self):
+        """Restore the last persisted aggregates, if any"""
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.error(f"Ignoring unreadable aggregates file {self.path}: {e}")
+            return
+        state["buckets"] = {int(bucket): counts for bucket, counts in state.get("buckets", {}).items()}
+        self._state = {**_empty_state(), **state}
+    
+    def flush(self):
+        """Persist the aggregates if they changed since the last flush"""
+        if not self._dirty:
+            return
+        self._dirty = False
+        if self.store and (self._check_counts or self._violation_counts):
+            check_counts, self._check_counts = self._check_counts, {}
+            violation_counts, self._violation_counts = self._violation_counts, {}
+            try:
+                self.store.add_check_counts(check_counts, violation_counts)
+            except Exception:
+                # Keep the counts for the next flush, merged with anything recorded meanwhile
+                for key, counts in check_counts.items():
+                    merged = self._check_counts.setdefault(key, [0, 0, 0.0])
+                    merged[:] = [merged[0] + counts[0], merged[1] + counts[1], merged[2] + counts[2]]
+                for key, (count, severity) in violation_counts.items():
+                    merged = self._violation_counts.setdefault(key, [0, severity])
+                    merged[0] += count
+                raise
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Write-then-rename so a crash never leaves a truncated file
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w") as f:
+            json.dump(self._state, f)
+        os.replace(temporary, self.path)
+    
+    def start(self):
+        """Persist periodically"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+    
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.flush()
+    
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            try:
+                self.flush()
+            except (OSError, sqlite3.Error) as e:
+                logger.error(f"Failed to persist compliance aggregates: {e}")
+                self._dirty = True
+    
+    async def rebuild_from_store(self):
+        """Replace the aggregates with ones recomputed from the hourly counts in the store"""
+        if self.store is None:
+            raise RuntimeError("No store to rebuild the compliance aggregates from")
+        # Counts not yet flushed are part of what the rebuild reads
+        self._dirty = True
+        self.flush()
+        
+        now_bucket = int(time.time() // BUCKET_SECONDS)
+        counts = await asyncio.to_thread(self.store.check_count_totals, now_bucket - WINDOW_BUCKETS + 1)
+        state = _empty_state()
+        state["jurisdictions"] = counts["jurisdictions"]
+        state["rules"] = counts["rules"]
+        state["buckets"] = counts["buckets"]
+        for checks, compliant, confidence_sum in counts["jurisdictions"].values():
+            state["totals"][0] += checks
+            state["totals"][1] += compliant
+            state["totals"][2] += confidence_sum
+        state["rebuilt_at"] = datetime.now().isoformat()
+        
+        self._state = state
+        self._dirty = True
+        self.flush()
+        logger.info(f"Rebuilt compliance aggregates from {state['totals'][0]} counted checks")
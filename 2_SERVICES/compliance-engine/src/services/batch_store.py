@@ -0,0 +1,586 @@
+import json
+import os
+import sqlite3
+import threading
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    batch_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    total_requests INTEGER NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    priority TEXT,
+    notification_webhook TEXT,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    completed_at TEXT,
+    error TEXT
+);
+
+CREATE TABLE IF NOT EXISTS batch_items (
+    batch_id TEXT NOT NULL,
+    item_index INTEGER NOT NULL,
+    request TEXT NOT NULL,
+    PRIMARY KEY (batch_id, item_index)
+);
+
+CREATE TABLE IF NOT EXISTS batch_results (
+    batch_id TEXT NOT NULL,
+    item_index INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    compliant INTEGER,
+    confidence_score REAL,
+    result TEXT,
+    error TEXT,
+    jurisdiction TEXT,
+    compliance_type TEXT,
+    entity_type TEXT,
+    rule_set_version TEXT,
+    -- Store-wide write counter, so readers can fetch only results changed since they last looked
+    revision INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (batch_id, item_index)
+);
+
+CREATE TABLE IF NOT EXISTS rule_set_versions (
+    version TEXT PRIMARY KEY,
+    rules TEXT NOT NULL,
+    recorded_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS audits (
+    audit_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    from_version TEXT,
+    to_version TEXT NOT NULL,
+    report TEXT,
+    error TEXT,
+    started_at TEXT NOT NULL,
+    completed_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS webhook_events (
+    event_id TEXT PRIMARY KEY,
+    batch_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    sequence INTEGER NOT NULL DEFAULT 1,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    created_at TEXT NOT NULL
+);
+
+-- Hourly counts of every check the report aggregates counted, so the report can be rebuilt
+CREATE TABLE IF NOT EXISTS check_counts (
+    bucket INTEGER NOT NULL,
+    jurisdiction TEXT NOT NULL,
+    checks INTEGER NOT NULL,
+    compliant INTEGER NOT NULL,
+    confidence_sum REAL NOT NULL,
+    PRIMARY KEY (bucket, jurisdiction)
+);
+
+CREATE TABLE IF NOT EXISTS rule_violation_counts (
+    bucket INTEGER NOT NULL,
+    rule_id TEXT NOT NULL,
+    violations INTEGER NOT NULL,
+    severity TEXT NOT NULL,
+    PRIMARY KEY (bucket, rule_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_batches_status ON batches(status);
+CREATE INDEX IF NOT EXISTS idx_webhook_events_due ON webhook_events(status, next_attempt_at);
+"""
+
+# Columns added to batch_results after its first release, backfilled from the stored result JSON
+RESULT_COLUMNS = {
+    "jurisdiction": "$.jurisdiction",
+    "compliance_type": "$.compliance_type",
+    "entity_type": "$.entity_type",
+    "rule_set_version": "$.metadata.rule_set_version"
+}
+
+class BatchJobStore:
+    """Durable SQLite record of bulk compliance batches, their requests and per-item results"""
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv("BATCH_STORE_PATH", "data/compliance_batches.db")
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            self._migrate()
+            self._revision = self._conn.execute("SELECT COALESCE(MAX(revision), 0) FROM batch_results").fetchone()[0]
+    
+    def _migrate(self):
+        existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(batch_results)")}
+        for column, path in RESULT_COLUMNS.items():
+            if column not in existing:
+                self._conn.execute(f"ALTER TABLE batch_results ADD COLUMN {column} TEXT")
+                self._conn.execute(
+                    f"UPDATE batch_results SET {column} = json_extract(result, ?) WHERE result IS NOT NULL",
+                    (path,)
+                )
+        if "revision" not in existing:
+            self._conn.execute("ALTER TABLE batch_results ADD COLUMN revision INTEGER NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_batch_results_revision ON batch_results(batch_id, revision)")
+        self._conn.execute(
+            """CREATE INDEX IF NOT EXISTS idx_batch_results_version
+               ON batch_results(rule_set_version, jurisdiction, compliance_type)"""
+        )
+    
+    def _next_revision(self) -> int:
+        # Called with the lock held
+        self._revision += 1
+        return self._revision
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+    
+    def create_batch(
+        self,
+        batch_id: str,
+        requests: Iterable[Tuple[int, str]],
+        total_requests: int,
+        priority: Optional[str] = None,
+        notification_webhook: Optional[str] = None
+    ) -> bool:
+        """Record a new batch and its serialized requests; False if the batch_id is taken"""
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        """INSERT INTO batches (batch_id, status, total_requests, priority,
+                                                notification_webhook, created_at)
+                           VALUES (?, 'pending', ?, ?, ?, ?)""",
+                        (batch_id, total_requests, priority, notification_webhook, datetime.now().isoformat())
+                    )
+                    self._conn.executemany(
+                        "INSERT INTO batch_items (batch_id, item_index, request) VALUES (?, ?, ?)",
+                        ((batch_id, index, request) for index, request in requests)
+                    )
+            except sqlite3.IntegrityError:
+                return False
+        return True
+    
+    def mark_started(self, batch_id: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                """UPDATE batches SET status = 'processing', started_at = COALESCE(started_at, ?)
+                   WHERE batch_id = ?""",
+                (datetime.now().isoformat(), batch_id)
+            )
+    
+    def pending_items(self, batch_id: str) -> List[Tuple[int, str]]:
+        """Serialized requests that have no recorded result yet"""
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT i.item_index, i.request FROM batch_items i
+                   LEFT JOIN batch_results r
+                     ON r.batch_id = i.batch_id AND r.item_index = i.item_index
+                   WHERE i.batch_id = ? AND r.item_index IS NULL
+                   ORDER BY i.item_index""",
+                (batch_id,)
+            ).fetchall()
+        return [(row["item_index"], row["request"]) for row in rows]
+    
+    def record_results(self, batch_id: str, outcomes: List[Dict[str, Any]]):
+        """Persist a group of item outcomes and refresh the batch counters"""
+        if not outcomes:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """INSERT OR REPLACE INTO batch_results
+                   (batch_id, item_index, status, compliant, confidence_score, result, error,
+                    jurisdiction, compliance_type, entity_type, rule_set_version, revision)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (
+                        batch_id,
+                        outcome["index"],
+                        "failed" if outcome.get("error") else "completed",
+                        outcome.get("compliant"),
+                        outcome.get("confidence_score"),
+                        outcome.get("result"),
+                        outcome.get("error"),
+                        outcome.get("jurisdiction"),
+                        outcome.get("compliance_type"),
+                        outcome.get("entity_type"),
+                        outcome.get("rule_set_version"),
+                        self._next_revision()
+                    )
+                    for outcome in outcomes
+                ]
+            )
+            self._conn.execute(
+                """UPDATE batches SET
+                     completed = (SELECT COUNT(*) FROM batch_results WHERE batch_id = ? AND status = 'completed'),
+                     failed = (SELECT COUNT(*) FROM batch_results WHERE batch_id = ? AND status = 'failed')
+                   WHERE batch_id = ?""",
+                (batch_id, batch_id, batch_id)
+            )
+    
+    def finish_batch(self, batch_id: str, status: str = "completed", error: Optional[str] = None):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE batches SET status = ?, completed_at = ?, error = ? WHERE batch_id = ?",
+                (status, datetime.now().isoformat(), error, batch_id)
+            )
+    
+    def incomplete_batches(self) -> List[str]:
+        """Batches a previous process accepted but did not finish"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT batch_id FROM batches WHERE status IN ('pending', 'processing') ORDER BY created_at"
+            ).fetchall()
+        return [row["batch_id"] for row in rows]
+    
+    def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Batch status, progress counters and result summary"""
+        with self._lock:
+            batch = self._conn.execute("SELECT * FROM batches WHERE batch_id = ?", (batch_id,)).fetchone()
+            if batch is None:
+                return None
+            summary = self._conn.execute(
+                """SELECT SUM(compliant = 1) AS compliant, SUM(compliant = 0) AS non_compliant,
+                          AVG(confidence_score) AS average_confidence
+                   FROM batch_results WHERE batch_id = ? AND status = 'completed'""",
+                (batch_id,)
+            ).fetchone()
+        
+        batch = dict(batch)
+        processed = batch["completed"] + batch["failed"]
+        batch["progress"] = round(processed / batch["total_requests"], 4) if batch["total_requests"] else 1.0
+        batch["summary"] = {
+            "compliant": summary["compliant"] or 0,
+            "non_compliant": summary["non_compliant"] or 0,
+            "average_confidence": summary["average_confidence"] or 0
+        }
+        return batch
+    
+    def get_results(
+        self,
+        batch_id: str,
+        offset: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """A page of per-item outcomes in request order"""
+        query = "SELECT item_index, status, result, error FROM batch_results WHERE batch_id = ?"
+        params: list = [batch_id]
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        query += " ORDER BY item_index LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        
+        return [
+            {
+                "index": row["item_index"],
+                "status": row["status"],
+                "result": json.loads(row["result"]) if row["result"] else None,
+                "error": row["error"]
+            }
+            for row in rows
+        ]
+    
+    def get_result_summaries(
+        self,
+        batch_id: str,
+        offset: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None,
+        violations: bool = False
+    ) -> List[Dict[str, Any]]:
+        """A page of per-item outcomes with only the headline fields, extracted in SQL rather than parsed"""
+        columns = """item_index, status, error, compliant, confidence_score,
+                     json_extract(result, '$.check_id') AS check_id,
+                     json_extract(result, '$.risk_score') AS risk_score,
+                     json_array_length(result, '$.violations') AS violation_count"""
+        if violations:
+            columns += """,
+                     (SELECT json_group_array(json_object(
+                          'rule_id', json_extract(v.value, '$.rule_id'),
+                          'severity', json_extract(v.value, '$.severity'),
+                          'field_name', json_extract(v.value, '$.field_name'),
+                          'description', json_extract(v.value, '$.description')))
+                      FROM json_each(result, '$.violations') AS v) AS violations"""
+        query = f"SELECT {columns} FROM batch_results WHERE batch_id = ?"
+        params: list = [batch_id]
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        query += " ORDER BY item_index LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+    
+    def save_event(
+        self,
+        event_id: str,
+        batch_id: str,
+        url: str,
+        event_type: str,
+        payload: str,
+        next_attempt_at: float,
+        supersedes: Optional[str] = None
+    ):
+        """Queue an outbound webhook event; an undelivered event with the same id takes the new payload"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT INTO webhook_events
+                   (event_id, batch_id, url, event_type, payload, next_attempt_at, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(event_id) DO UPDATE SET
+                     payload = excluded.payload,
+                     event_type = excluded.event_type,
+                     sequence = sequence + 1,
+                     attempts = CASE WHEN status = 'dead' THEN 0 ELSE attempts END,
+                     next_attempt_at = CASE WHEN status = 'dead' THEN excluded.next_attempt_at ELSE next_attempt_at END,
+                     status = 'pending'""",
+                (event_id, batch_id, url, event_type, payload, next_attempt_at, datetime.now().isoformat())
+            )
+            if supersedes:
+                self._conn.execute("DELETE FROM webhook_events WHERE event_id = ?", (supersedes,))
+    
+    def due_events(self, now: float, limit: int = 100) -> List[Dict[str, Any]]:
+        """Pending webhook events whose next attempt is due, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT * FROM webhook_events WHERE status = 'pending' AND next_attempt_at <= ?
+                   ORDER BY next_attempt_at LIMIT ?""",
+                (now, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+    
+    def next_event_due(self) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt_at) AS due FROM webhook_events WHERE status = 'pending'"
+            ).fetchone()
+        return row["due"]
+    
+    def event_delivered(self, event_id: str, sequence: int, next_attempt_at: float):
+        """Drop a delivered event, unless a newer payload arrived while it was in flight"""
+        with self._lock, self._conn:
+            deleted = self._conn.execute(
+                "DELETE FROM webhook_events WHERE event_id = ? AND sequence = ?", (event_id, sequence)
+            ).rowcount
+            if not deleted:
+                self._conn.execute(
+                    "UPDATE webhook_events SET attempts = 0, next_attempt_at = ?, last_error = NULL WHERE event_id = ?",
+                    (next_attempt_at, event_id)
+                )
+    
+    def event_failed(self, event_id: str, attempts: int, next_attempt_at: float, error: str, dead: bool = False):
+        with self._lock, self._conn:
+            self._conn.execute(
+                """UPDATE webhook_events SET attempts = ?, next_attempt_at = ?, last_error = ?, status = ?
+                   WHERE event_id = ?""",
+                (attempts, next_attempt_at, error, "dead" if dead else "pending", event_id)
+            )
+    
+    def event_counts(self) -> Dict[str, int]:
+        """Undelivered webhook events by status"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS count FROM webhook_events GROUP BY status"
+            ).fetchall()
+        return {row["status"]: row["count"] for row in rows}
+    
+    def add_check_counts(
+        self,
+        checks: Dict[Tuple[int, str], List[Any]],
+        violations: Dict[Tuple[int, str], List[Any]]
+    ):
+        """Add counts by (hour bucket, jurisdiction) -> [checks, compliant, confidence_sum]
+        and (hour bucket, rule_id) -> [violations, severity]"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """INSERT INTO check_counts (bucket, jurisdiction, checks, compliant, confidence_sum)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (bucket, jurisdiction) DO UPDATE SET
+                       checks = checks + excluded.checks,
+                       compliant = compliant + excluded.compliant,
+                       confidence_sum = confidence_sum + excluded.confidence_sum""",
+                [(bucket, jurisdiction, *counts) for (bucket, jurisdiction), counts in checks.items()]
+            )
+            self._conn.executemany(
+                """INSERT INTO rule_violation_counts (bucket, rule_id, violations, severity)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT (bucket, rule_id) DO UPDATE SET
+                       violations = violations + excluded.violations,
+                       severity = excluded.severity""",
+                [(bucket, rule_id, *counts) for (bucket, rule_id), counts in violations.items()]
+            )
+    
+    def check_count_totals(self, since_bucket: int) -> Dict[str, Any]:
+        """All-time totals per jurisdiction and rule, and per-bucket totals from since_bucket on"""
+        with self._lock:
+            jurisdictions = self._conn.execute(
+                """SELECT jurisdiction, SUM(checks) AS checks, SUM(compliant) AS compliant,
+                          SUM(confidence_sum) AS confidence_sum
+                   FROM check_counts GROUP BY jurisdiction"""
+            ).fetchall()
+            rules = self._conn.execute(
+                """SELECT rule_id, SUM(violations) AS violations,
+                          (SELECT severity FROM rule_violation_counts AS latest
+                           WHERE latest.rule_id = counts.rule_id ORDER BY bucket DESC LIMIT 1) AS severity
+                   FROM rule_violation_counts AS counts GROUP BY rule_id"""
+            ).fetchall()
+            buckets = self._conn.execute(
+                """SELECT bucket, SUM(checks) AS checks, SUM(compliant) AS compliant
+                   FROM check_counts WHERE bucket >= ? GROUP BY bucket""",
+                (since_bucket,)
+            ).fetchall()
+        return {
+            "jurisdictions": {row["jurisdiction"]: [row["checks"], row["compliant"], row["confidence_sum"]] for row in jurisdictions},
+            "rules": {row["rule_id"]: [row["violations"], row["severity"]] for row in rules},
+            "buckets": {row["bucket"]: [row["checks"], row["compliant"]] for row in buckets}
+        }
+    
+    def record_rule_set(self, version: str, rules: Dict[str, Any]):
+        """Keep a rule set's per-rule fingerprints, so later versions can be diffed against it"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO rule_set_versions (version, rules, recorded_at) VALUES (?, ?, ?)",
+                (version, json.dumps(rules), datetime.now().isoformat())
+            )
+    
+    def get_rule_set(self, version: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT rules FROM rule_set_versions WHERE version = ?", (version,)).fetchone()
+        return json.loads(row["rules"]) if row else None
+    
+    def result_versions(self, exclude: str) -> Dict[str, int]:
+        """Stored completed results per rule set version they were checked under, other than exclude"""
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT rule_set_version, COUNT(*) AS count FROM batch_results
+                   WHERE status = 'completed' AND rule_set_version IS NOT NULL AND rule_set_version != ?
+                   GROUP BY rule_set_version""",
+                (exclude,)
+            ).fetchall()
+        return {row["rule_set_version"]: row["count"] for row in rows}
+    
+    @staticmethod
+    def _scope_clause(scopes: Optional[List[Tuple[str, str, Tuple[str, ...]]]]) -> Tuple[str, list]:
+        """SQL matching results in any (jurisdiction, compliance type, entity types) scope; () means any entity type"""
+        if scopes is None:
+            return "1", []
+        if not scopes:
+            return "0", []
+        clauses, params = [], []
+        for jurisdiction, compliance_type, entity_types in scopes:
+            clause = "(jurisdiction = ? AND compliance_type = ?"
+            params.extend([jurisdiction, compliance_type])
+            if entity_types:
+                clause += f" AND entity_type IN ({', '.join('?' * len(entity_types))})"
+                params.extend(entity_types)
+            clauses.append(clause + ")")
+        return "(" + " OR ".join(clauses) + ")", params
+    
+    def results_in_scope(
+        self,
+        version: str,
+        scopes: Optional[List[Tuple[str, str, Tuple[str, ...]]]],
+        after: Tuple[str, int] = ("", -1),
+        limit: int = 500
+    ) -> List[Dict[str, Any]]:
+        """A page of completed results checked under version that fall in scopes (None: all), with their requests"""
+        clause, params = self._scope_clause(scopes)
+        with self._lock:
+            rows = self._conn.execute(
+                f"""SELECT r.batch_id, r.item_index, r.result, i.request FROM batch_results r
+                    JOIN batch_items i ON i.batch_id = r.batch_id AND i.item_index = r.item_index
+                    WHERE r.status = 'completed' AND r.rule_set_version = ? AND {clause}
+                      AND (r.batch_id, r.item_index) > (?, ?)
+                    ORDER BY r.batch_id, r.item_index LIMIT ?""",
+                [version, *params, *after, limit]
+            ).fetchall()
+        return [dict(row) for row in rows]
+    
+    def update_results(self, rows: List[Dict[str, Any]]):
+        """Replace re-checked results in place"""
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """UPDATE batch_results SET compliant = ?, confidence_score = ?, result = ?, rule_set_version = ?,
+                                          revision = ?
+                   WHERE batch_id = ? AND item_index = ?""",
+                [
+                    (row["compliant"], row["confidence_score"], row["result"], row["rule_set_version"],
+                     self._next_revision(), row["batch_id"], row["index"])
+                    for row in rows
+                ]
+            )
+    
+    def restamp_results(self, version: str, new_version: str, scopes: List[Tuple[str, str, Tuple[str, ...]]]) -> int:
+        """Move results outside every changed scope to new_version; their verdicts still hold"""
+        clause, params = self._scope_clause(scopes)
+        with self._lock, self._conn:
+            return self._conn.execute(
+                f"""UPDATE batch_results
+                    SET rule_set_version = ?, result = json_set(result, '$.metadata.rule_set_version', ?)
+                    WHERE status = 'completed' AND rule_set_version = ? AND NOT {clause}""",
+                [new_version, new_version, version, *params]
+            ).rowcount
+    
+    def create_audit(self, audit_id: str, from_version: Optional[str], to_version: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT INTO audits (audit_id, status, from_version, to_version, started_at)
+                   VALUES (?, 'processing', ?, ?, ?)""",
+                (audit_id, from_version, to_version, datetime.now().isoformat())
+            )
+    
+    def finish_audit(self, audit_id: str, report: Optional[Dict[str, Any]] = None,
+                     status: str = "completed", error: Optional[str] = None):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE audits SET status = ?, report = ?, error = ?, completed_at = ? WHERE audit_id = ?",
+                (status, json.dumps(report) if report is not None else None, error,
+                 datetime.now().isoformat(), audit_id)
+            )
+    
+    def get_audit(self, audit_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM audits WHERE audit_id = ?", (audit_id,)).fetchone()
+        if row is None:
+            return None
+        audit = dict(row)
+        audit["report"] = json.loads(audit["report"]) if audit["report"] else None
+        return audit
+    
+    def results_since(self, batch_id: str, revision: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """Risk inputs of a batch's results written after revision, and the revision they bring it to"""
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT item_index, status, compliant, confidence_score, jurisdiction, entity_type, revision,
+                          json_extract(result, '$.risk_score') AS risk_score,
+                          json_extract(result, '$.violations') AS violations
+                   FROM batch_results WHERE batch_id = ? AND revision > ?""",
+                (batch_id, revision)
+            ).fetchall()
+        rows = [dict(row) for row in rows]
+        return max((row["revision"] for row in rows), default=revision), rows
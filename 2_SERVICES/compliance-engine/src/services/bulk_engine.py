@@ -0,0 +1,255 @@
+import asyncio
+import os
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..models import ComplianceCheckRequest, ComplianceCheckResult, ComplianceJurisdiction, ComplianceViolation
+from .compliance_service import CheckVerdict, ComplianceService
+from .scheduler import PriorityScheduler, lane_for, most_urgent
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class BulkItemOutcome:
+    index: int
+    result: Optional[ComplianceCheckResult] = None
+    error: Optional[str] = None
+    # Set instead of result when the caller asked for verdicts only
+    verdict: Optional[CheckVerdict] = None
+
+IndexedRequests = Union[Iterable[Tuple[int, ComplianceCheckRequest]], AsyncIterable[Tuple[int, ComplianceCheckRequest]]]
+
+# Process pool workers build their own service once and reuse it for every chunk
+_worker_service: Optional[ComplianceService] = None
+
+def _init_worker():
+    global _worker_service
+    _worker_service = ComplianceService()
+
+async def _check_payloads(payloads: List[Dict[str, Any]], full: bool = True) -> List[Dict[str, Any]]:
+    # Workers have no watcher tasks; pick up rule and rate file changes between chunks
+    _worker_service.rules_engine.reload_if_changed()
+    _worker_service.jurisdiction_service.currency_service.reload_if_changed()
+    outcomes = []
+    for payload in payloads:
+        try:
+            request = ComplianceCheckRequest.model_validate(payload)
+            if full:
+                result = await _worker_service.perform_compliance_check(request)
+                outcomes.append({"result": result.model_dump(mode="json")})
+            else:
+                verdict = await _worker_service.check_verdict(request)
+                outcomes.append({"verdict": {
+                    **verdict.__dict__,
+                    "violations": [violation.model_dump(mode="json") for violation in verdict.violations]
+                }})
+        except Exception as e:
+            outcomes.append({"error": str(e)})
+    return outcomes
+
+def _check_chunk(payloads: List[Dict[str, Any]], full: bool = True) -> List[Dict[str, Any]]:
+    """Process pool entry point: check a chunk of serialized requests"""
+    return asyncio.run(_check_payloads(payloads, full))
+
+def _verdict(item: Dict[str, Any]) -> CheckVerdict:
+    return CheckVerdict(**{
+        **item,
+        "jurisdiction": ComplianceJurisdiction(item["jurisdiction"]),
+        "violations": [ComplianceViolation.model_validate(violation) for violation in item["violations"]]
+    })
+
+async def _aiter(items: IndexedRequests) -> AsyncIterator[Tuple[int, ComplianceCheckRequest]]:
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+class BulkComplianceEngine:
+    """Runs compliance checks for large batches with bounded concurrency"""
+    
+    def __init__(
+        self,
+        service: ComplianceService,
+        max_concurrency: Optional[int] = None,
+        backend: Optional[str] = None,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        scheduler: Optional[PriorityScheduler] = None
+    ):
+        self.service = service
+        # Shared with single checks, so batches only get the slots interactive work leaves free
+        self.scheduler = scheduler or PriorityScheduler()
+        self.max_concurrency = max_concurrency or int(os.getenv("BULK_MAX_CONCURRENCY", 64))
+        # "asyncio" runs checks on the event loop; "process" spreads CPU-bound rule sets across cores
+        self.backend = backend or os.getenv("BULK_BACKEND", "asyncio")
+        self.workers = workers or int(os.getenv("BULK_WORKERS", os.cpu_count() or 1))
+        self.chunk_size = chunk_size or int(os.getenv("BULK_CHUNK_SIZE", 50))
+        self._pool: Optional[ProcessPoolExecutor] = None
+        
+        if self.backend not in ("asyncio", "process"):
+            raise ValueError(f"Unknown bulk backend '{self.backend}'")
+    
+    def shutdown(self):
+        """Stop the process pool, if one was started"""
+        if self._pool:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+    
+    async def run(
+        self,
+        requests: IndexedRequests,
+        priority: str = "normal",
+        interactive: bool = False,
+        full: bool = True
+    ) -> AsyncIterator[BulkItemOutcome]:
+        """Check (index, request) pairs, yielding outcomes as they complete; verdicts only unless full"""
+        if self.backend == "process":
+            runner = self._run_in_processes(requests, lane_for(priority, interactive), full)
+        else:
+            runner = self._run_on_loop(requests, priority, interactive, full)
+        async for outcome in runner:
+            yield outcome
+    
+    async def _check_one(self, index: int, request: ComplianceCheckRequest, lane: str, full: bool = True) -> BulkItemOutcome:
+        try:
+            async with self.scheduler.slot(lane):
+                if not full:
+                    return BulkItemOutcome(index=index, verdict=await self.service.check_verdict(request))
+                result = await self.service.perform_compliance_check(request)
+            return BulkItemOutcome(index=index, result=result)
+        except Exception as e:
+            logger.error(f"Bulk item {index} failed: {e}")
+            return BulkItemOutcome(index=index, error=str(e))
+    
+    async def _run_on_loop(
+        self,
+        requests: IndexedRequests,
+        priority: str,
+        interactive: bool,
+        full: bool
+    ) -> AsyncIterator[BulkItemOutcome]:
+        pending = set()
+        finished: Deque[asyncio.Task] = deque()
+        
+        def collect(task: asyncio.Task):
+            pending.discard(task)
+            finished.append(task)
+        
+        def start(index: int, request: ComplianceCheckRequest):
+            # An urgent item raises its own lane above the batch's
+            lane = lane_for(most_urgent(priority, request.urgency), interactive)
+            task = asyncio.create_task(self._check_one(index, request, lane, full))
+            task.add_done_callback(collect)
+            pending.add(task)
+        
+        if hasattr(requests, "__aiter__"):
+            # Wait for the next request and for running checks together, so outcomes
+            # go out while a streamed input is still arriving
+            iterator = requests.__aiter__()
+            next_item: Optional[asyncio.Future] = asyncio.ensure_future(iterator.__anext__())
+            try:
+                while next_item is not None:
+                    while finished:
+                        yield finished.popleft().result()
+                    if len(pending) >= self.max_concurrency:
+                        await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        continue
+                    await asyncio.wait(pending | {next_item}, return_when=asyncio.FIRST_COMPLETED)
+                    if next_item.done():
+                        try:
+                            index, request = next_item.result()
+                        except StopAsyncIteration:
+                            next_item = None
+                            continue
+                        start(index, request)
+                        next_item = asyncio.ensure_future(iterator.__anext__())
+            finally:
+                if next_item is not None:
+                    next_item.cancel()
+        else:
+            for index, request in requests:
+                if len(pending) >= self.max_concurrency:
+                    await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                while finished:
+                    yield finished.popleft().result()
+                start(index, request)
+        
+        while pending or finished:
+            if not finished:
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            while finished:
+                yield finished.popleft().result()
+    
+    async def _run_in_processes(self, requests: IndexedRequests, lane: str, full: bool) -> AsyncIterator[BulkItemOutcome]:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        loop = asyncio.get_running_loop()
+        
+        # Keep every worker busy with one chunk queued behind it
+        max_in_flight = self.workers * 2
+        pending = {}
+        chunk: List[Tuple[int, ComplianceCheckRequest]] = []
+        
+        async def submit(items):
+            # A chunk holds one slot while it runs in a worker. The slot goes back as soon as
+            # the chunk finishes, not when its outcomes are collected: this generator may be
+            # blocked in acquire() below, and finished chunks must not keep the lane full.
+            await self.scheduler.acquire(lane)
+            payloads = [request.model_dump(mode="json") for _, request in items]
+            future = loop.run_in_executor(self._pool, _check_chunk, payloads, full)
+            future.add_done_callback(lambda _: self.scheduler.release(lane))
+            pending[future] = [index for index, _ in items]
+        
+        def outcomes(future) -> List[BulkItemOutcome]:
+            indexes = pending.pop(future)
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error(f"Bulk chunk of {len(indexes)} items failed: {e}")
+                return [BulkItemOutcome(index=index, error=str(e)) for index in indexes]
+            chunk_outcomes = [
+                BulkItemOutcome(
+                    index=index,
+                    result=ComplianceCheckResult.model_validate(item["result"]) if "result" in item else None,
+                    error=item.get("error"),
+                    verdict=_verdict(item["verdict"]) if "verdict" in item else None
+                )
+                for index, item in zip(indexes, results)
+            ]
+            # Workers' services have no aggregates; count their checks here
+            if self.service.aggregates:
+                for outcome in chunk_outcomes:
+                    if outcome.result is not None:
+                        self.service.aggregates.record(outcome.result)
+                    elif outcome.verdict is not None:
+                        verdict = outcome.verdict
+                        self.service.aggregates.record_verdict(
+                            verdict.jurisdiction, verdict.compliant, verdict.confidence_score, verdict.violations
+                        )
+            return chunk_outcomes
+        
+        async for item in _aiter(requests):
+            chunk.append(item)
+            if len(chunk) < self.chunk_size:
+                continue
+            if len(pending) >= max_in_flight:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    for outcome in outcomes(future):
+                        yield outcome
+            await submit(chunk)
+            chunk = []
+        
+        if chunk:
+            await submit(chunk)
+        
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                for outcome in outcomes(future):
+                    yield outcome
@@ -0,0 +1,120 @@
+import logging
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ..models import ComplianceJurisdiction, ComplianceType, ComplianceViolation
+from .currency import RateSnapshot
+from .rule_dsl import MONEY_FIELDS, RuleCheck, resolve_check, violation_builder
+from .rules_engine import RulesEngine, RuleSetSnapshot
+
+logger = logging.getLogger(__name__)
+
+# operator -> (column kind, vectorized violation predicate); mirrors rule_dsl.OPERATORS.
+# NaN marks a missing or non-numeric value and compares False, so it never fires.
+VECTOR_OPERATORS: Dict[str, Tuple[str, Callable[[np.ndarray, Any], np.ndarray]]] = {
+    "min": ("numeric", lambda values, required: (values != 0) & (values < required)),
+    "max": ("numeric", lambda values, required: (values != 0) & (values > required)),
+    "required": ("present", lambda present, required: ~present),
+}
+
+class ColumnarValidator:
+    """Validates many entities at once, evaluating rule checks as column comparisons per jurisdiction"""
+    
+    def __init__(self, rules_engine: RulesEngine):
+        self.rules_engine = rules_engine
+        self.jurisdiction_service = rules_engine.jurisdiction_service
+    
+    async def validate(
+        self,
+        items: Sequence[Tuple[ComplianceJurisdiction, Dict[str, Any]]],
+        compliance_type: ComplianceType,
+        entity_type: str
+    ) -> Dict[int, List[ComplianceViolation]]:
+        """Violations by item index, for failing items only"""
+        # One rule set and rate snapshot for the whole catalogue, even if either is reloaded meanwhile
+        rule_set = self.rules_engine.snapshot
+        rates = self.jurisdiction_service.currency_service.snapshot
+        groups: Dict[ComplianceJurisdiction, List[int]] = {}
+        for index, (jurisdiction, _) in enumerate(items):
+            groups.setdefault(jurisdiction, []).append(index)
+        
+        violations: Dict[int, List[ComplianceViolation]] = {}
+        for jurisdiction, indexes in groups.items():
+            rows = [items[index][1] for index in indexes]
+            group_violations = await self._validate_group(jurisdiction, rows, compliance_type, entity_type, rule_set, rates)
+            for position, found in group_violations.items():
+                violations[indexes[position]] = found
+        return violations
+    
+    def _entity_checks(self, rule: Any, entity_type: str) -> List[RuleCheck]:
+        # Same selection as rule_dsl.compile_rule: checks naming the entity type,
+        # else the checks that apply to every entity type
+        checks = rule.checks or ()
+        named = [check for check in checks if entity_type in (check.entity_types or rule.entity_types or ())]
+        if named:
+            return named
+        return [check for check in checks if not (check.entity_types or rule.entity_types)]
+    
+    async def _validate_group(
+        self,
+        jurisdiction: ComplianceJurisdiction,
+        rows: List[Dict[str, Any]],
+        compliance_type: ComplianceType,
+        entity_type: str,
+        rule_set: RuleSetSnapshot,
+        rates: RateSnapshot
+    ) -> Dict[int, List[ComplianceViolation]]:
+        """Violations by row position within one jurisdiction's rows"""
+        rules = rule_set.applicable_rules(jurisdiction, compliance_type, entity_type)
+        resolve_parameter = lambda parameter: self.jurisdiction_service.get_rule_parameter(
+            jurisdiction, parameter, jurisdiction_data=rule_set.jurisdiction_data
+        )
+        target_currency = rule_set.jurisdiction_data.get(jurisdiction, {}).get("currency", "USD")
+        
+        columns: Dict[Tuple[str, str], np.ndarray] = {}
+        
+        def column(kind: str, field_name: str) -> np.ndarray:
+            key = (kind, field_name)
+            if key not in columns:
+                if kind == "present":
+                    columns[key] = np.fromiter((bool(row.get(field_name)) for row in rows), bool, len(rows))
+                elif kind == "rate":
+                    columns[key] = rates.factors((row.get("currency") for row in rows), target_currency, len(rows))
+                elif field_name in MONEY_FIELDS:
+                    columns[key] = self._numeric_column(rows, field_name) * column("rate", "currency")
+                else:
+                    columns[key] = self._numeric_column(rows, field_name)
+            return columns[key]
+        
+        violations: Dict[int, List[ComplianceViolation]] = {}
+        for rule in rules:
+            for check in self._entity_checks(rule, entity_type):
+                can_fire, required = resolve_check(rule, check, resolve_parameter)
+                if not can_fire:
+                    continue
+                if check.operator not in VECTOR_OPERATORS:
+                    raise ValueError(f"Rule {rule.rule_id}: operator '{check.operator}' has no vectorized form")
+                
+                kind, violates = VECTOR_OPERATORS[check.operator]
+                failing = violates(column(kind, check.field), required)
+                if check.when:
+                    failing &= column("present", check.when)
+                
+                positions = np.flatnonzero(failing)
+                if not len(positions):
+                    continue
+                build_violation = violation_builder(rule, check, required)
+                for position in positions.tolist():
+                    violations.setdefault(position, []).append(build_violation(rows[position].get(check.field)))
+        return violations
+    
+    @staticmethod
+    def _numeric_column(rows: List[Dict[str, Any]], field_name: str) -> np.ndarray:
+        return np.array(
+            [
+                value if isinstance(value, (int, float)) else np.nan
+                for value in (row.get(field_name) for row in rows)
+            ],
+            dtype=float
+        )
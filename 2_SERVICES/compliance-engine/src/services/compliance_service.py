@@ -1,9 +1,13 @@
 import uuid
 import asyncio
+import inspect
+import os
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Awaitable, Tuple, Union
 import json
 import logging
+from dataclasses import dataclass, field
 
 from ..models import (
     ComplianceCheckRequest,
@@ -19,49 +23,82 @@ from ..models import (
     CandidateData
 )
 from .rules_engine import RulesEngine
+from .currency import RateSnapshot
 from .jurisdiction_service import JurisdictionService
+from .result_cache import ComplianceResultCache
+from .aggregates import ComplianceAggregates
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class RuleEvaluation:
+    """What the applicable rules found for one entity"""
+    applicable_rules: List[Any]
+    violations: List[ComplianceViolation] = field(default_factory=list)
+    checks_performed: List[str] = field(default_factory=list)
+    evaluated_rules: List[Any] = field(default_factory=list)
+    rules_not_evaluated: List[str] = field(default_factory=list)
+    rule_latency_ms: Dict[str, float] = field(default_factory=dict)
+    # What the evaluated rules compared, so callers can tell which fields a verdict covers
+    field_checks: List[Dict[str, Any]] = field(default_factory=list)
+
+@dataclass
+class CheckVerdict:
+    """Headline outcome of a check, without recommendations or the full result model"""
+    check_id: str
+    jurisdiction: ComplianceJurisdiction
+    compliant: bool
+    confidence_score: float
+    risk_score: float
+    violations: List[ComplianceViolation]
+
 class ComplianceService:
-    def __init__(self):
-        self.rules_engine = RulesEngine()
+    def __init__(
+        self,
+        max_concurrent_rules: Optional[int] = None,
+        rule_timeout_seconds: Optional[float] = None,
+        result_cache: Optional[ComplianceResultCache] = None,
+        aggregates: Optional[ComplianceAggregates] = None
+    ):
         self.jurisdiction_service = JurisdictionService()
+        self.rules_engine = RulesEngine(self.jurisdiction_service)
         
+        # Rule checks awaiting I/O at once within a single check, and how long each may wait
+        self.max_concurrent_rules = max_concurrent_rules or int(os.getenv("COMPLIANCE_MAX_CONCURRENT_RULES", 8))
+        self.rule_timeout_seconds = rule_timeout_seconds or float(os.getenv("COMPLIANCE_RULE_TIMEOUT_SECONDS", 5.0))
+        self.result_cache = result_cache or ComplianceResultCache()
+        # Report totals, when this service feeds them; process pool workers do not
+        self.aggregates = aggregates
+    
     async def perform_compliance_check(self, request: ComplianceCheckRequest) -> ComplianceCheckResult:
         """Perform comprehensive compliance check"""
         start_time = datetime.now()
         check_id = str(uuid.uuid4())
         
+        # One rule set for the whole check; a concurrent reload only affects later checks
+        snapshot = self.rules_engine.snapshot
+        rule_set_version = snapshot.version
+        # Likewise one set of exchange rates for every salary comparison
+        rates = self.jurisdiction_service.currency_service.snapshot
+        # Salary verdicts depend on the rates too, so a rate reload invalidates cached results
+        verdict_version = f"{rule_set_version}/{rates.version}"
+        
+        # Unchanged entities checked against an unchanged rule set reuse the earlier verdict
+        cache_key = self.result_cache.key(request, verdict_version)
+        cached = self.result_cache.get(cache_key, verdict_version)
+        if cached is not None:
+            result = self._from_cache(cached, check_id, request, start_time)
+            if self.aggregates:
+                self.aggregates.record(result)
+            return result
+        
         try:
-            # Get applicable rules for jurisdiction and compliance type
-            applicable_rules = await self.rules_engine.get_applicable_rules(
-                request.jurisdiction,
-                request.compliance_type,
-                request.entity_type
-            )
-            
-            # Perform compliance validation
-            violations = []
-            checks_performed = []
-            
-            for rule in applicable_rules:
-                try:
-                    rule_violations = await self._check_rule_compliance(
-                        rule, 
-                        request.data, 
-                        request.jurisdiction,
-                        request.entity_type
-                    )
-                    violations.extend(rule_violations)
-                    checks_performed.append(rule.rule_id)
-                except Exception as e:
-                    logger.error(f"Error checking rule {rule.rule_id}: {e}")
-                    continue
+            evaluation = await self._evaluate_rules(snapshot, request, rates)
+            violations = evaluation.violations
             
             # Calculate compliance status
             is_compliant = len(violations) == 0
-            confidence_score = self._calculate_confidence_score(violations, applicable_rules)
+            confidence_score = self._calculate_confidence_score(violations, evaluation.evaluated_rules)
             risk_score = self._calculate_risk_score(violations)
             
             # Generate recommendations
@@ -74,14 +111,14 @@ class ComplianceService:
             
             processing_time = (datetime.now() - start_time).total_seconds() * 1000
             
-            return ComplianceCheckResult(
+            result = ComplianceCheckResult(
                 check_id=check_id,
                 status=ComplianceStatus.COMPLETED,
                 compliant=is_compliant,
                 jurisdiction=request.jurisdiction,
                 compliance_type=request.compliance_type,
                 entity_type=request.entity_type,
-                checks_performed=checks_performed,
+                checks_performed=evaluation.checks_performed,
                 violations=violations,
                 recommendations=recommendations,
                 confidence_score=confidence_score,
@@ -90,289 +127,177 @@ class ComplianceService:
                 checked_at=start_time,
                 expires_at=start_time + timedelta(days=30),
                 metadata={
-                    "total_rules_checked": len(applicable_rules),
+                    "total_rules_checked": len(evaluation.applicable_rules),
+                    "rules_not_evaluated": evaluation.rules_not_evaluated,
+                    "field_checks": evaluation.field_checks,
+                    "rule_latency_ms": evaluation.rule_latency_ms,
+                    "rule_set_version": rule_set_version,
                     "urgency": request.urgency,
                     "additional_context": request.additional_context
                 }
             )
             
+            # Rules that raised would make a cached verdict incomplete
+            if not evaluation.rules_not_evaluated:
+                self.result_cache.put(cache_key, verdict_version, result)
+            if self.aggregates:
+                self.aggregates.record(result)
+            return result
+        
         except Exception as e:
             logger.error(f"Compliance check failed: {e}")
             raise
     
-    async def _check_rule_compliance(
-        self, 
-        rule: Any, 
-        data: Any, 
-        jurisdiction: ComplianceJurisdiction,
-        entity_type: str
-    ) -> List[ComplianceViolation]:
-        """Check compliance against a specific rule"""
-        violations = []
-        
-        try:
-            if entity_type == "job_posting":
-                violations.extend(await self._check_job_posting_compliance(rule, data, jurisdiction))
-            elif entity_type == "employment_contract":
-                violations.extend(await self._check_contract_compliance(rule, data, jurisdiction))
-            elif entity_type == "candidate_data":
-                violations.extend(await self._check_candidate_data_compliance(rule, data, jurisdiction))
-            else:
-                violations.extend(await self._check_generic_compliance(rule, data, jurisdiction))
-                
-        except Exception as e:
-            logger.error(f"Rule compliance check failed for {rule.rule_id}: {e}")
-        
-        return violations
-    
-    async def _check_job_posting_compliance(
-        self, 
-        rule: Any, 
-        job_posting: Dict[str, Any], 
-        jurisdiction: ComplianceJurisdiction
-    ) -> List[ComplianceViolation]:
-        """Check job posting compliance"""
-        violations = []
-        
-        # Minimum wage compliance
-        if rule.rule_id == "minimum_wage_compliance":
-            min_wage = await self.jurisdiction_service.get_minimum_wage(jurisdiction)
-            if job_posting.get("salary_min") and job_posting["salary_min"] < min_wage:
-                violations.append(ComplianceViolation(
-                    rule_id=rule.rule_id,
-                    rule_name=rule.name,
-                    severity=ViolationSeverity.HIGH,
-                    description=f"Salary below minimum wage requirement of {min_wage}",
-                    field_name="salary_min",
-                    current_value=str(job_posting.get("salary_min")),
-                    required_value=str(min_wage),
-                    remediation_steps=[
-                        f"Increase minimum salary to at least {min_wage}",
-                        "Review local minimum wage regulations",
-                        "Update job posting with compliant salary range"
-                    ],
-                    legal_reference=rule.source_url
-                ))
-        
-        # Working hours compliance
-        elif rule.rule_id == "working_time_directive":
-            max_hours = await self.jurisdiction_service.get_max_working_hours(jurisdiction)
-            if job_posting.get("working_hours") and job_posting["working_hours"] > max_hours:
-                violations.append(ComplianceViolation(
-                    rule_id=rule.rule_id,
-                    rule_name=rule.name,
-                    severity=ViolationSeverity.MEDIUM,
-                    description=f"Working hours exceed legal maximum of {max_hours} hours per week",
-                    field_name="working_hours",
-                    current_value=str(job_posting.get("working_hours")),
-                    required_value=str(max_hours),
-                    remediation_steps=[
-                        f"Reduce working hours to maximum {max_hours} per week",
-                        "Consider flexible working arrangements",
-                        "Review overtime compensation policies"
-                    ],
-                    legal_reference=rule.source_url
-                ))
+    async def check_verdict(self, request: ComplianceCheckRequest) -> CheckVerdict:
+        """Headline outcome of a check, for callers that do not need the full result
         
-        # Equal opportunity compliance
-        elif rule.rule_id == "equal_opportunity_requirements":
-            if not job_posting.get("equal_opportunity_statement"):
-                violations.append(ComplianceViolation(
-                    rule_id=rule.rule_id,
-                    rule_name=rule.name,
-                    severity=ViolationSeverity.MEDIUM,
-                    description="Missing equal opportunity employment statement",
-                    field_name="equal_opportunity_statement",
-                    current_value="None",
-                    required_value="Required equal opportunity statement",
-                    remediation_steps=[
-                        "Add equal opportunity employment statement",
-                        "Review anti-discrimination policies",
-                        "Ensure inclusive language in job description"
-                    ],
-                    legal_reference=rule.source_url
-                ))
+        Skips recommendations and the result model; a cached full result is reused,
+        but a verdict is not cached since it cannot answer a full check.
+        """
+        snapshot = self.rules_engine.snapshot
+        rates = self.jurisdiction_service.currency_service.snapshot
+        verdict_version = f"{snapshot.version}/{rates.version}"
         
-        # Visa sponsorship compliance
-        elif rule.rule_id == "immigration_compliance":
-            if jurisdiction in [ComplianceJurisdiction.US, ComplianceJurisdiction.UK, ComplianceJurisdiction.AU]:
-                if job_posting.get("visa_sponsorship") and not job_posting.get("sponsor_license"):
-                    violations.append(ComplianceViolation(
-                        rule_id=rule.rule_id,
-                        rule_name=rule.name,
-                        severity=ViolationSeverity.HIGH,
-                        description="Visa sponsorship offered without proper licensing",
-                        field_name="sponsor_license",
-                        current_value="Not specified",
-                        required_value="Valid sponsor license required",
-                        remediation_steps=[
-                            "Obtain proper sponsor license",
-                            "Remove visa sponsorship claim",
-                            "Consult immigration lawyer"
-                        ],
-                        legal_reference=rule.source_url
-                    ))
+        cached = self.result_cache.get(self.result_cache.key(request, verdict_version), verdict_version)
+        if cached is not None:
+            violations = cached.violations
+            confidence_score = cached.confidence_score
+        else:
+            evaluation = await self._evaluate_rules(snapshot, request, rates)
+            violations = evaluation.violations
+            confidence_score = self._calculate_confidence_score(violations, evaluation.evaluated_rules)
         
-        return violations
+        verdict = CheckVerdict(
+            check_id=str(uuid.uuid4()),
+            jurisdiction=request.jurisdiction,
+            compliant=not violations,
+            confidence_score=confidence_score,
+            risk_score=self._calculate_risk_score(violations),
+            violations=violations
+        )
+        if self.aggregates:
+            self.aggregates.record_verdict(verdict.jurisdiction, verdict.compliant, verdict.confidence_score, violations)
+        return verdict
     
-    async def _check_contract_compliance(
-        self, 
-        rule: Any, 
-        contract: Dict[str, Any], 
-        jurisdiction: ComplianceJurisdiction
-    ) -> List[ComplianceViolation]:
-        """Check employment contract compliance"""
-        violations = []
+    async def _evaluate_rules(self, snapshot: Any, request: ComplianceCheckRequest, rates: RateSnapshot) -> RuleEvaluation:
+        """Run every applicable rule of the snapshot against the request's entity
         
-        # Probation period compliance
-        if rule.rule_id == "probation_period_limits":
-            max_probation = await self.jurisdiction_service.get_max_probation_period(jurisdiction)
-            if contract.get("probation_period") and contract["probation_period"] > max_probation:
-                violations.append(ComplianceViolation(
-                    rule_id=rule.rule_id,
-                    rule_name=rule.name,
-                    severity=ViolationSeverity.MEDIUM,
-                    description=f"Probation period exceeds legal maximum of {max_probation} days",
-                    field_name="probation_period",
-                    current_value=str(contract.get("probation_period")),
-                    required_value=str(max_probation),
-                    remediation_steps=[
-                        f"Reduce probation period to maximum {max_probation} days",
-                        "Review employment law requirements",
-                        "Update contract template"
-                    ],
-                    legal_reference=rule.source_url
-                ))
+        Compiled checks run inline; checks that await I/O are fanned out under the
+        concurrency cap, and one that times out or raises is reported as not evaluated.
+        """
+        evaluation = RuleEvaluation(
+            applicable_rules=snapshot.applicable_rules(request.jurisdiction, request.compliance_type, request.entity_type)
+        )
+        data = self._entity_data(request.data)
         
-        # Holiday entitlement compliance
-        elif rule.rule_id == "holiday_entitlement":
-            min_holidays = await self.jurisdiction_service.get_min_holiday_entitlement(jurisdiction)
-            if contract.get("holiday_entitlement") and contract["holiday_entitlement"] < min_holidays:
-                violations.append(ComplianceViolation(
-                    rule_id=rule.rule_id,
-                    rule_name=rule.name,
-                    severity=ViolationSeverity.HIGH,
-                    description=f"Holiday entitlement below legal minimum of {min_holidays} days",
-                    field_name="holiday_entitlement",
-                    current_value=str(contract.get("holiday_entitlement")),
-                    required_value=str(min_holidays),
-                    remediation_steps=[
-                        f"Increase holiday entitlement to minimum {min_holidays} days",
-                        "Review statutory holiday requirements",
-                        "Update all employee contracts"
-                    ],
-                    legal_reference=rule.source_url
-                ))
+        outcomes: Dict[str, Optional[List[ComplianceViolation]]] = {}
+        pending = []
+        for rule in evaluation.applicable_rules:
+            start = time.perf_counter()
+            outcome = self._apply_rule(rule, data, request.entity_type, rates)
+            if inspect.isawaitable(outcome):
+                pending.append((rule, outcome))
+                continue
+            evaluation.rule_latency_ms[rule.rule_id] = round((time.perf_counter() - start) * 1000, 3)
+            outcomes[rule.rule_id] = outcome
         
-        # Notice period compliance
-        elif rule.rule_id == "notice_period_requirements":
-            min_notice = await self.jurisdiction_service.get_min_notice_period(jurisdiction)
-            if contract.get("notice_period") and contract["notice_period"] < min_notice:
-                violations.append(ComplianceViolation(
-                    rule_id=rule.rule_id,
-                    rule_name=rule.name,
-                    severity=ViolationSeverity.MEDIUM,
-                    description=f"Notice period below legal minimum of {min_notice} days",
-                    field_name="notice_period",
-                    current_value=str(contract.get("notice_period")),
-                    required_value=str(min_notice),
-                    remediation_steps=[
-                        f"Increase notice period to minimum {min_notice} days",
-                        "Review termination procedures",
-                        "Ensure mutual notice requirements"
-                    ],
-                    legal_reference=rule.source_url
-                ))
+        if pending:
+            semaphore = asyncio.Semaphore(self.max_concurrent_rules)
+            awaited = await asyncio.gather(*(
+                self._await_rule(rule, outcome, semaphore) for rule, outcome in pending
+            ))
+            for (rule, _), (rule_violations, latency_ms) in zip(pending, awaited):
+                evaluation.rule_latency_ms[rule.rule_id] = round(latency_ms, 3)
+                outcomes[rule.rule_id] = rule_violations
         
-        return violations
+        # Reported in rule order, however the checks finished
+        for rule in evaluation.applicable_rules:
+            rule_violations = outcomes[rule.rule_id]
+            if rule_violations is None:
+                evaluation.rules_not_evaluated.append(rule.rule_id)
+                continue
+            evaluation.violations.extend(rule_violations)
+            evaluation.checks_performed.append(rule.rule_id)
+            evaluation.evaluated_rules.append(rule)
+            evaluation.field_checks.extend(rule.checks_for(request.entity_type))
+        return evaluation
     
-    async def _check_candidate_data_compliance(
-        self, 
-        rule: Any, 
-        candidate_data: Dict[str, Any], 
-        jurisdiction: ComplianceJurisdiction
-    ) -> List[ComplianceViolation]:
-        """Check candidate data protection compliance"""
-        violations = []
-        
-        # GDPR/Data protection compliance
-        if rule.rule_id == "gdpr_compliance":
-            if jurisdiction in [ComplianceJurisdiction.UK, ComplianceJurisdiction.EU]:
-                if not candidate_data.get("data_processing_consent"):
-                    violations.append(ComplianceViolation(
-                        rule_id=rule.rule_id,
-                        rule_name=rule.name,
-                        severity=ViolationSeverity.CRITICAL,
-                        description="Missing explicit consent for data processing",
-                        field_name="data_processing_consent",
-                        current_value="False",
-                        required_value="True",
-                        remediation_steps=[
-                            "Obtain explicit consent for data processing",
-                            "Implement consent management system",
-                            "Provide clear privacy notice"
-                        ],
-                        legal_reference=rule.source_url
-                    ))
-        
-        # Age verification compliance
-        elif rule.rule_id == "age_verification":
-            if candidate_data.get("date_of_birth"):
-                birth_date = datetime.fromisoformat(candidate_data["date_of_birth"])
-                age = (datetime.now() - birth_date).days / 365.25
-                min_age = await self.jurisdiction_service.get_min_working_age(jurisdiction)
-                
-                if age < min_age:
-                    violations.append(ComplianceViolation(
-                        rule_id=rule.rule_id,
-                        rule_name=rule.name,
-                        severity=ViolationSeverity.CRITICAL,
-                        description=f"Candidate below minimum working age of {min_age}",
-                        field_name="date_of_birth",
-                        current_value=f"Age: {age:.1f}",
-                        required_value=f"Minimum age: {min_age}",
-                        remediation_steps=[
-                            "Verify candidate age with documentation",
-                            "Review child labor laws",
-                            "Implement age verification process"
-                        ],
-                        legal_reference=rule.source_url
-                    ))
-        
-        # Right to work compliance
-        elif rule.rule_id == "right_to_work":
-            if not candidate_data.get("work_authorization"):
-                violations.append(ComplianceViolation(
-                    rule_id=rule.rule_id,
-                    rule_name=rule.name,
-                    severity=ViolationSeverity.HIGH,
-                    description="Work authorization status not verified",
-                    field_name="work_authorization",
-                    current_value="Not specified",
-                    required_value="Valid work authorization required",
-                    remediation_steps=[
-                        "Verify right to work documentation",
-                        "Implement I-9/right to work process",
-                        "Maintain proper records"
-                    ],
-                    legal_reference=rule.source_url
-                ))
+    async def _await_rule(
+        self,
+        rule: Any,
+        outcome: Awaitable[List[ComplianceViolation]],
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Tuple[Optional[List[ComplianceViolation]], float]:
+        """Await a check doing I/O under the cap and per-rule timeout; violations are None if it timed out or raised"""
+        async with semaphore or asyncio.Semaphore(1):
+            start = time.perf_counter()
+            try:
+                violations = await asyncio.wait_for(outcome, self.rule_timeout_seconds)
+            except asyncio.TimeoutError:
+                logger.warning(f"Rule {rule.rule_id} not evaluated: timed out after {self.rule_timeout_seconds}s")
+                violations = None
+            except Exception as e:
+                logger.error(f"Rule compliance check failed for {rule.rule_id}: {e}")
+                violations = None
+            return violations, (time.perf_counter() - start) * 1000
+    
+    @staticmethod
+    def _from_cache(
+        cached: ComplianceCheckResult,
+        check_id: str,
+        request: ComplianceCheckRequest,
+        start_time: datetime
+    ) -> ComplianceCheckResult:
+        """A cached verdict under a new check id, carrying this request's context"""
+        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        return cached.model_copy(update={
+            "check_id": check_id,
+            "processing_time_ms": int(processing_time),
+            "metadata": {
+                **cached.metadata,
+                "cached": True,
+                "original_check_id": cached.check_id,
+                "urgency": request.urgency,
+                "additional_context": request.additional_context
+            }
+        })
+    
+    @staticmethod
+    def _entity_data(data: Any) -> Dict[str, Any]:
+        """Entity data as the plain dict compiled rule checks read fields from"""
+        return data.model_dump() if hasattr(data, "model_dump") else data
+    
+    def _apply_rule(
+        self,
+        rule: Any,
+        data: Dict[str, Any],
+        entity_type: str,
+        rates: Optional[RateSnapshot] = None
+    ) -> Union[None, List[ComplianceViolation], Awaitable[List[ComplianceViolation]]]:
+        """Violations of one rule, converting salaries at rates (default: current rates); None if the rule raised
         
-        return violations
+        A rule whose check awaits I/O returns an awaitable of its violations instead.
+        """
+        try:
+            # Checks are compiled onto the rule when the rules engine loads
+            return rule.evaluate(data, entity_type, rates or self.jurisdiction_service.currency_service.snapshot)
+        except Exception as e:
+            logger.error(f"Rule compliance check failed for {rule.rule_id}: {e}")
+            return None
     
-    async def _check_generic_compliance(
+    async def _check_rule_compliance(
         self, 
         rule: Any, 
         data: Dict[str, Any], 
-        jurisdiction: ComplianceJurisdiction
-    ) -> List[ComplianceViolation]:
-        """Check generic compliance rules"""
-        violations = []
-        
-        # This would contain generic compliance checks that apply to multiple entity types
-        # For now, returning empty list as specific implementations are above
-        
-        return violations
+        jurisdiction: ComplianceJurisdiction,
+        entity_type: str,
+        rates: Optional[RateSnapshot] = None
+    ) -> Optional[List[ComplianceViolation]]:
+        """Check compliance against a specific rule; None if it could not be evaluated"""
+        outcome = self._apply_rule(rule, data, entity_type, rates)
+        if inspect.isawaitable(outcome):
+            outcome, _ = await self._await_rule(rule, outcome)
+        return outcome
     
     def _calculate_confidence_score(self, violations: List[ComplianceViolation], rules: List[Any]) -> float:
         """Calculate confidence score based on violations and rules checked"""
@@ -0,0 +1,271 @@
+import os
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..models import ComplianceCheckRequest, ComplianceCheckResult
+from .batch_store import BatchJobStore
+from .compliance_service import ComplianceService
+from .rules_engine import RuleSetSnapshot
+from .scheduler import PriorityScheduler
+
+logger = logging.getLogger(__name__)
+
+# Entities listed individually in a report; counts cover the rest
+REPORT_ITEM_LIMIT = 1000
+
+Scope = Tuple[str, str, Tuple[str, ...]]
+
+def rule_set_record(snapshot: RuleSetSnapshot) -> Dict[str, Any]:
+    """Per-rule fingerprint and scope of a snapshot, as kept for later diffs"""
+    return {
+        rule.rule_id: {
+            "fingerprint": snapshot.fingerprints[rule.rule_id],
+            "name": rule.name,
+            "jurisdiction": rule.jurisdiction.value,
+            "compliance_type": rule.compliance_type.value,
+            "entity_types": list(rule.entity_types or ()),
+            "last_updated": rule.last_updated.isoformat(),
+            "effective_date": rule.effective_date.isoformat()
+        }
+        for rule in snapshot.rules
+    }
+
+@dataclass
+class RuleSetDiff:
+    """Rules that differ between a stored rule set version and the current one"""
+    base_version: str
+    # None when the base version was never recorded: every rule counts as changed
+    changed: Optional[Set[str]] = None
+    removed: Set[str] = field(default_factory=set)
+    rules: List[Dict[str, Any]] = field(default_factory=list)
+    
+    @property
+    def known(self) -> bool:
+        return self.changed is not None
+    
+    @property
+    def stale(self) -> Set[str]:
+        """Rule ids whose earlier verdicts no longer hold"""
+        return (self.changed or set()) | self.removed
+    
+    def scopes(self) -> Optional[List[Scope]]:
+        """Where stored results can be affected; None means everywhere"""
+        if not self.known:
+            return None
+        scopes = {
+            (rule["jurisdiction"], rule["compliance_type"], tuple(sorted(rule["entity_types"])))
+            for rule in self.rules
+        }
+        return sorted(scopes)
+
+def diff_rule_sets(base_version: str, base: Optional[Dict[str, Any]], current: Dict[str, Any]) -> RuleSetDiff:
+    if base is None:
+        return RuleSetDiff(base_version=base_version)
+    
+    diff = RuleSetDiff(base_version=base_version, changed=set())
+    for rule_id, rule in current.items():
+        previous = base.get(rule_id)
+        if previous is None or previous["fingerprint"] != rule["fingerprint"]:
+            diff.changed.add(rule_id)
+            diff.rules.append({"rule_id": rule_id, "change": "changed" if previous else "added", **rule})
+            # A rule that moved scope also affects results in its old scope
+            if previous and (previous["jurisdiction"], previous["compliance_type"], previous["entity_types"]) != \
+                    (rule["jurisdiction"], rule["compliance_type"], rule["entity_types"]):
+                diff.rules.append({"rule_id": rule_id, "change": "moved", **previous})
+    for rule_id, rule in base.items():
+        if rule_id not in current:
+            diff.removed.add(rule_id)
+            diff.rules.append({"rule_id": rule_id, "change": "removed", **rule})
+    for rule in diff.rules:
+        rule.pop("fingerprint", None)
+    return diff
+
+class DifferentialAuditor:
+    """Re-validates stored batch results against only the rules that changed since they were checked"""
+    
+    def __init__(
+        self,
+        service: ComplianceService,
+        store: BatchJobStore,
+        scheduler: Optional[PriorityScheduler] = None,
+        page_size: Optional[int] = None
+    ):
+        self.service = service
+        self.store = store
+        self.scheduler = scheduler
+        self.page_size = page_size or int(os.getenv("AUDIT_PAGE_SIZE", 500))
+    
+    def record_rule_set(self, snapshot: RuleSetSnapshot):
+        """Rules engine listener: remember every rule set results may be checked under"""
+        self.store.record_rule_set(snapshot.version, rule_set_record(snapshot))
+    
+    async def run(self, audit_id: str, from_version: Optional[str] = None) -> Dict[str, Any]:
+        """Bring stored results up to the current rule set, returning the delta report"""
+        snapshot = self.service.rules_engine.snapshot
+        current = rule_set_record(snapshot)
+        base_versions = self.store.result_versions(exclude=snapshot.version)
+        if from_version is not None:
+            base_versions = {version: count for version, count in base_versions.items() if version == from_version}
+        
+        report = {
+            "audit_id": audit_id,
+            "to_version": snapshot.version,
+            "base_versions": {},
+            "entities_considered": 0,
+            "entities_rechecked": 0,
+            "entities_restamped": 0,
+            "rule_evaluations": 0,
+            "violations_added": 0,
+            "violations_resolved": 0,
+            "newly_non_compliant": 0,
+            "newly_compliant": 0,
+            "changes": []
+        }
+        
+        for version, count in base_versions.items():
+            diff = diff_rule_sets(version, self.store.get_rule_set(version), current)
+            report["entities_considered"] += count
+            report["base_versions"][version] = {
+                "known": diff.known,
+                "stored_results": count,
+                "rules": diff.rules if diff.known else "all"
+            }
+            if not diff.known:
+                logger.warning(f"Rule set {version} was never recorded; fully re-checking its {count} results")
+            
+            await self._recheck_version(snapshot, diff, report)
+            # Everything left under the old version sits outside every changed scope
+            if diff.known:
+                report["entities_restamped"] += self.store.restamp_results(version, snapshot.version, diff.scopes())
+        
+        logger.info(
+            f"Differential audit {audit_id}: {report['entities_rechecked']} of {report['entities_considered']} "
+            f"stored results re-checked with {report['rule_evaluations']} rule evaluations"
+        )
+        return report
+    
+    async def _recheck_version(self, snapshot: RuleSetSnapshot, diff: RuleSetDiff, report: Dict[str, Any]):
+        after: Tuple[str, int] = ("", -1)
+        while True:
+            rows = self.store.results_in_scope(diff.base_version, diff.scopes(), after, self.page_size)
+            if not rows:
+                return
+            after = (rows[-1]["batch_id"], rows[-1]["item_index"])
+            
+            updates = []
+            for row in rows:
+                request = ComplianceCheckRequest.model_validate_json(row["request"])
+                previous = ComplianceCheckResult.model_validate_json(row["result"])
+                if self.scheduler:
+                    async with self.scheduler.slot("normal"):
+                        result, evaluated = await self.recheck(snapshot, request, previous, diff)
+                else:
+                    result, evaluated = await self.recheck(snapshot, request, previous, diff)
+                
+                updates.append({
+                    "batch_id": row["batch_id"],
+                    "index": row["item_index"],
+                    "compliant": result.compliant,
+                    "confidence_score": result.confidence_score,
+                    "result": result.model_dump_json(),
+                    "rule_set_version": snapshot.version
+                })
+                self._record_change(report, row, previous, result, evaluated)
+            self.store.update_results(updates)
+    
+    async def recheck(
+        self,
+        snapshot: RuleSetSnapshot,
+        request: ComplianceCheckRequest,
+        previous: ComplianceCheckResult,
+        diff: RuleSetDiff
+    ) -> Tuple[ComplianceCheckResult, int]:
+        """A stored result with only the changed rules re-evaluated; returns it and the rules evaluated"""
+        applicable = snapshot.applicable_rules(request.jurisdiction, request.compliance_type, request.entity_type)
+        stale = diff.stale
+        if diff.known:
+            violations = [violation for violation in previous.violations if violation.rule_id not in stale]
+            checks_performed = [rule_id for rule_id in previous.checks_performed if rule_id not in stale]
+            not_evaluated = [
+                rule_id for rule_id in previous.metadata.get("rules_not_evaluated", []) if rule_id not in stale
+            ]
+            field_checks = [
+                described for described in previous.metadata.get("field_checks", []) if described["rule_id"] not in stale
+            ]
+            rerun = [rule for rule in applicable if rule.rule_id in diff.changed]
+        else:
+            violations, checks_performed, not_evaluated, field_checks = [], [], [], []
+            rerun = list(applicable)
+        
+        data = self.service._entity_data(request.data)
+        for rule in rerun:
+            rule_violations = await self.service._check_rule_compliance(rule, data, request.jurisdiction, request.entity_type)
+            if rule_violations is None:
+                not_evaluated.append(rule.rule_id)
+                continue
+            violations.extend(rule_violations)
+            checks_performed.append(rule.rule_id)
+            field_checks.extend(rule.checks_for(request.entity_type))
+        
+        performed = set(checks_performed)
+        now = datetime.now()
+        result = previous.model_copy(update={
+            "compliant": not violations,
+            "checks_performed": checks_performed,
+            "violations": violations,
+            "recommendations": await self.service._generate_recommendations(
+                violations, request.jurisdiction, request.compliance_type, request.entity_type
+            ),
+            "confidence_score": self.service._calculate_confidence_score(
+                violations, [rule for rule in applicable if rule.rule_id in performed]
+            ),
+            "risk_score": self.service._calculate_risk_score(violations),
+            "checked_at": now,
+            "expires_at": now + timedelta(days=30),
+            "metadata": {
+                **previous.metadata,
+                "total_rules_checked": len(applicable),
+                "rules_not_evaluated": not_evaluated,
+                "field_checks": field_checks,
+                "rule_set_version": snapshot.version,
+                "previous_rule_set_version": diff.base_version,
+                "rechecked_rules": [rule.rule_id for rule in rerun]
+            }
+        })
+        return result, len(rerun)
+    
+    @staticmethod
+    def _record_change(
+        report: Dict[str, Any],
+        row: Dict[str, Any],
+        previous: ComplianceCheckResult,
+        result: ComplianceCheckResult,
+        evaluated: int
+    ):
+        def keys(result: ComplianceCheckResult) -> Set[Tuple[str, str]]:
+            return {(violation.rule_id, violation.field_name or "") for violation in result.violations}
+        
+        added = keys(result) - keys(previous)
+        resolved = keys(previous) - keys(result)
+        report["entities_rechecked"] += 1
+        report["rule_evaluations"] += evaluated
+        report["violations_added"] += len(added)
+        report["violations_resolved"] += len(resolved)
+        if previous.compliant and not result.compliant:
+            report["newly_non_compliant"] += 1
+        elif result.compliant and not previous.compliant:
+            report["newly_compliant"] += 1
+        
+        if (added or resolved) and len(report["changes"]) < REPORT_ITEM_LIMIT:
+            report["changes"].append({
+                "batch_id": row["batch_id"],
+                "index": row["item_index"],
+                "jurisdiction": result.jurisdiction.value,
+                "entity_type": result.entity_type,
+                "compliant": result.compliant,
+                "was_compliant": previous.compliant,
+                "violations_added": sorted(rule_id for rule_id, _ in added),
+                "violations_resolved": sorted(rule_id for rule_id, _ in resolved)
+            })
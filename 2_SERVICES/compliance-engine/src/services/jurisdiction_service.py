@@ -1,12 +1,14 @@
 from typing import Dict, Any, Optional
 from datetime import datetime
 from ..models import ComplianceJurisdiction
+from .currency import CurrencyService, get_currency_service
 
 class JurisdictionService:
     """Service for jurisdiction-specific compliance data"""
     
-    def __init__(self):
+    def __init__(self, currency_service: Optional[CurrencyService] = None):
         self.jurisdiction_data = self._load_jurisdiction_data()
+        self.currency_service = currency_service or get_currency_service()
     
     def _load_jurisdiction_data(self) -> Dict[str, Dict[str, Any]]:
         """Load jurisdiction-specific compliance data"""
@@ -131,6 +133,23 @@ class JurisdictionService:
             }
         }
     
+    def get_rule_parameter(
+        self,
+        jurisdiction: ComplianceJurisdiction,
+        parameter: str,
+        jurisdiction_data: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Any:
+        """Resolve a jurisdiction parameter referenced by a declarative rule check, None if not required"""
+        # Rule snapshots resolve against the data they were built with, not the live data
+        data = (jurisdiction_data if jurisdiction_data is not None else self.jurisdiction_data).get(jurisdiction, {})
+        value = data.get(parameter)
+        
+        if value == "varies" and parameter == "minimum_wage":
+            return self._get_default_minimum_wage(jurisdiction)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        return value
+    
     async def get_minimum_wage(self, jurisdiction: ComplianceJurisdiction) -> float:
         """Get minimum wage for jurisdiction"""
         data = self.jurisdiction_data.get(jurisdiction, {})
@@ -205,7 +224,7 @@ class JurisdictionService:
         
         # Convert currency if needed (simplified - in production, use real exchange rates)
         if currency != jurisdiction_currency:
-            salary = await self._convert_currency(salary, currency, jurisdiction_currency)
+            salary = self.convert_currency(salary, currency, jurisdiction_currency)
         
         # Calculate hourly rate if needed
         if working_hours:
@@ -293,25 +312,6 @@ class JurisdictionService:
             "last_updated": datetime.now().isoformat()
         }
     
-    async def _convert_currency(self, amount: float, from_currency: str, to_currency: str) -> float:
-        """Convert currency (simplified - use real exchange rates in production)"""
-        # Simplified conversion rates (in production, use real-time exchange rates)
-        rates = {
-            "USD": 1.0,
-            "GBP": 0.79,
-            "EUR": 0.85,
-            "AUD": 1.35,
-            "CAD": 1.25,
-            "JPY": 110.0,
-            "SGD": 1.35,
-            "KRW": 1200.0
-        }
-        
-        if from_currency == to_currency:
-            return amount
-        
-        # Convert to USD first, then to target currency
-        usd_amount = amount / rates.get(from_currency, 1.0)
-        target_amount = usd_amount * rates.get(to_currency, 1.0)
-        
-        return target_amount
\ No newline at end of file
+    def convert_currency(self, amount: float, from_currency: str, to_currency: str) -> float:
+        """Convert currency at the current rate snapshot"""
+        return self.currency_service.snapshot.convert(amount, from_currency, to_currency)
@@ -0,0 +1,228 @@
+import json
+import os
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..models import ComplianceCheckResult
+from .batch_store import BatchJobStore
+
+logger = logging.getLogger(__name__)
+
+# Upper edges of the risk distribution buckets; risk scores are capped at 1.0
+RISK_BUCKETS = np.array([0.0, 0.2, 0.4, 0.6, 0.8, 1.0 + 1e-9])
+HIGH_RISK = 0.6
+
+class Vocabulary:
+    """Stable small-integer codes for jurisdictions, entity types and rules"""
+    
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.names: List[str] = []
+    
+    def code(self, name: Optional[str]) -> int:
+        if name is None:
+            return -1
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+class RiskFrame:
+    """Columnar risk inputs for a set of results: one slot per entity, NaN risk where there is no result"""
+    
+    def __init__(self, size: int, rules: Vocabulary):
+        self.revision = -1
+        self.rules = rules
+        self.risk = np.full(size, np.nan)
+        self.confidence = np.zeros(size)
+        self.compliant = np.zeros(size, dtype=bool)
+        self.jurisdiction = np.full(size, -1, dtype=np.int32)
+        self.entity_type = np.full(size, -1, dtype=np.int32)
+        # Rule codes of each entity's violations, and violation/entity counts per rule code kept in step
+        self.violations: Dict[int, np.ndarray] = {}
+        self.rule_violations = np.zeros(0, dtype=np.int64)
+        self.rule_entities = np.zeros(0, dtype=np.int64)
+    
+    def _count(self, codes: np.ndarray, sign: int):
+        if not len(codes):
+            return
+        size = max(len(self.rules.names), len(self.rule_violations))
+        if size > len(self.rule_violations):
+            self.rule_violations = np.pad(self.rule_violations, (0, size - len(self.rule_violations)))
+            self.rule_entities = np.pad(self.rule_entities, (0, size - len(self.rule_entities)))
+        self.rule_violations += sign * np.bincount(codes, minlength=size)
+        self.rule_entities[np.unique(codes)] += sign
+    
+    def set(self, index: int, risk: Optional[float], confidence: float, compliant: bool,
+            jurisdiction: int, entity_type: int, violation_codes: np.ndarray):
+        """Replace one entity's slot; None risk clears it"""
+        self._count(self.violations.pop(index, np.zeros(0, dtype=np.int64)), -1)
+        if risk is None:
+            self.risk[index] = np.nan
+            return
+        self.risk[index] = risk
+        self.confidence[index] = confidence
+        self.compliant[index] = compliant
+        self.jurisdiction[index] = jurisdiction
+        self.entity_type[index] = entity_type
+        if len(violation_codes):
+            self.violations[index] = violation_codes
+            self._count(violation_codes, 1)
+
+class PortfolioRiskAggregator:
+    """Aggregate risk over stored batches and ad hoc entity sets
+    
+    Each stored batch keeps a cached RiskFrame that is patched with only the
+    results written since it was last read, so a repeated view costs a read of
+    the changed rows plus vectorized reductions over the cached columns.
+    """
+    
+    def __init__(self, store: BatchJobStore, max_batches: Optional[int] = None):
+        self.store = store
+        self.max_batches = max_batches or int(os.getenv("PORTFOLIO_CACHE_BATCHES", 256))
+        self.jurisdictions = Vocabulary()
+        self.entity_types = Vocabulary()
+        self.rules = Vocabulary()
+        # rule code -> (rule name, severity) as last seen in a violation
+        self.rule_info: Dict[int, Tuple[str, str]] = {}
+        self._frames: "OrderedDict[str, RiskFrame]" = OrderedDict()
+        self.rows_read = 0
+    
+    def _violation_codes(self, violations: Iterable[Dict[str, Any]]) -> np.ndarray:
+        codes = []
+        for violation in violations:
+            code = self.rules.code(violation["rule_id"])
+            self.rule_info[code] = (violation.get("rule_name"), violation.get("severity"))
+            codes.append(code)
+        return np.array(codes, dtype=np.int64)
+    
+    def batch_frame(self, batch_id: str) -> Optional[RiskFrame]:
+        """Cached frame for a stored batch, brought up to date; None if the batch does not exist"""
+        frame = self._frames.get(batch_id)
+        if frame is None:
+            batch = self.store.get_batch(batch_id)
+            if batch is None:
+                return None
+            frame = RiskFrame(batch["total_requests"], self.rules)
+        
+        revision, rows = self.store.results_since(batch_id, frame.revision)
+        self.rows_read += len(rows)
+        for row in rows:
+            if row["status"] != "completed" or row["risk_score"] is None:
+                frame.set(row["item_index"], None, 0.0, False, -1, -1, np.zeros(0, dtype=np.int64))
+                continue
+            frame.set(
+                row["item_index"],
+                row["risk_score"],
+                row["confidence_score"] or 0.0,
+                bool(row["compliant"]),
+                self.jurisdictions.code(row["jurisdiction"]),
+                self.entity_types.code(row["entity_type"]),
+                self._violation_codes(json.loads(row["violations"] or "[]"))
+            )
+        frame.revision = revision
+        
+        self._frames[batch_id] = frame
+        self._frames.move_to_end(batch_id)
+        while len(self._frames) > self.max_batches:
+            self._frames.popitem(last=False)
+        return frame
+    
+    def results_frame(self, results: List[ComplianceCheckResult]) -> RiskFrame:
+        """Uncached frame for results checked on request"""
+        frame = RiskFrame(len(results), self.rules)
+        for index, result in enumerate(results):
+            frame.set(
+                index,
+                result.risk_score,
+                result.confidence_score,
+                result.compliant,
+                self.jurisdictions.code(result.jurisdiction.value),
+                self.entity_types.code(result.entity_type),
+                self._violation_codes(violation.model_dump(mode="json") for violation in result.violations)
+            )
+        return frame
+    
+    def summarize(self, frames: List[RiskFrame], top_rules: int = 10) -> Dict[str, Any]:
+        """Risk distribution, top violated rules and per-jurisdiction and entity type breakdowns"""
+        frames = frames or [RiskFrame(0, self.rules)]
+        checked = ~np.isnan(np.concatenate([frame.risk for frame in frames]))
+        risk = np.concatenate([frame.risk for frame in frames])[checked]
+        confidence = np.concatenate([frame.confidence for frame in frames])[checked]
+        compliant = np.concatenate([frame.compliant for frame in frames])[checked]
+        jurisdiction = np.concatenate([frame.jurisdiction for frame in frames])[checked]
+        entity_type = np.concatenate([frame.entity_type for frame in frames])[checked]
+        
+        size = len(self.rules.names)
+        rule_violations = np.zeros(size, dtype=np.int64)
+        rule_entities = np.zeros(size, dtype=np.int64)
+        for frame in frames:
+            rule_violations[:len(frame.rule_violations)] += frame.rule_violations
+            rule_entities[:len(frame.rule_entities)] += frame.rule_entities
+        
+        entities = len(risk)
+        histogram, _ = np.histogram(risk, bins=RISK_BUCKETS)
+        top = [code for code in np.argsort(-rule_violations, kind="stable")[:top_rules] if rule_violations[code]]
+        
+        return {
+            "entities": entities,
+            "compliant": int(compliant.sum()),
+            "compliance_rate": round(float(compliant.mean()) * 100, 1) if entities else 0.0,
+            "average_confidence": round(float(confidence.mean()), 3) if entities else 0.0,
+            "risk": {
+                "mean": round(float(risk.mean()), 4) if entities else 0.0,
+                "p50": round(float(np.percentile(risk, 50)), 4) if entities else 0.0,
+                "p90": round(float(np.percentile(risk, 90)), 4) if entities else 0.0,
+                "p99": round(float(np.percentile(risk, 99)), 4) if entities else 0.0,
+                "max": round(float(risk.max()), 4) if entities else 0.0,
+                "high_risk_entities": int((risk >= HIGH_RISK).sum()),
+                "distribution": [
+                    {"range": f"{low:.1f}-{min(high, 1.0):.1f}", "entities": int(count)}
+                    for low, high, count in zip(RISK_BUCKETS[:-1], RISK_BUCKETS[1:], histogram)
+                ]
+            },
+            "top_violated_rules": [
+                {
+                    "rule_id": self.rules.names[code],
+                    "rule_name": self.rule_info.get(code, (None, None))[0],
+                    "severity": self.rule_info.get(code, (None, None))[1],
+                    "violations": int(rule_violations[code]),
+                    "entities": int(rule_entities[code])
+                }
+                for code in top
+            ],
+            "jurisdictions": self._breakdown(self.jurisdictions, jurisdiction, risk, confidence, compliant),
+            "entity_types": self._breakdown(self.entity_types, entity_type, risk, confidence, compliant)
+        }
+    
+    @staticmethod
+    def _breakdown(vocabulary: Vocabulary, codes: np.ndarray, risk: np.ndarray,
+                   confidence: np.ndarray, compliant: np.ndarray) -> Dict[str, Dict[str, Any]]:
+        if not len(codes):
+            return {}
+        # Shift so results without a value (-1) land in bin 0 and are dropped
+        shifted = codes + 1
+        size = len(vocabulary.names) + 1
+        counts = np.bincount(shifted, minlength=size)
+        compliant_counts = np.bincount(shifted, weights=compliant, minlength=size)
+        risk_sums = np.bincount(shifted, weights=risk, minlength=size)
+        confidence_sums = np.bincount(shifted, weights=confidence, minlength=size)
+        high_risk = np.bincount(shifted, weights=risk >= HIGH_RISK, minlength=size)
+        
+        return {
+            vocabulary.names[code - 1]: {
+                "entities": int(counts[code]),
+                "compliance_rate": round(float(compliant_counts[code] / counts[code]) * 100, 1),
+                "average_risk": round(float(risk_sums[code] / counts[code]), 4),
+                "average_confidence": round(float(confidence_sums[code] / counts[code]), 3),
+                "high_risk_entities": int(high_risk[code])
+            }
+            for code in np.flatnonzero(counts[1:]) + 1
+        }
+    
+    def stats(self) -> Dict[str, Any]:
+        return {"cached_batches": len(self._frames), "rows_read": self.rows_read}
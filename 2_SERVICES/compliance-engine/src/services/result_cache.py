@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..models import ComplianceCheckRequest, ComplianceCheckResult
+
+logger = logging.getLogger(__name__)
+
+class ComplianceResultCache:
+    """In-memory LRU of check results keyed by a canonical hash of the checked content"""
+    
+    def __init__(self, max_entries: Optional[int] = None, enabled: Optional[bool] = None):
+        self.max_entries = max_entries or int(os.getenv("COMPLIANCE_RESULT_CACHE_SIZE", 10000))
+        if enabled is None:
+            enabled = os.getenv("COMPLIANCE_RESULT_CACHE_ENABLED", "true").lower() == "true"
+        self.enabled = enabled
+        
+        self._entries: "OrderedDict[str, ComplianceCheckResult]" = OrderedDict()
+        self._rule_set_version: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    @staticmethod
+    def _normalize(data: Any) -> Dict[str, Any]:
+        # Absent and null fields read the same to every rule check
+        if hasattr(data, "model_dump"):
+            data = data.model_dump()
+        return {key: value for key, value in data.items() if value is not None}
+    
+    def key(self, request: ComplianceCheckRequest, rule_set_version: str) -> str:
+        """Canonical content hash of what a check result depends on"""
+        content = [
+            request.jurisdiction.value,
+            request.compliance_type.value,
+            request.entity_type,
+            self._normalize(request.data),
+            rule_set_version
+        ]
+        canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+    
+    def _check_version(self, rule_set_version: str):
+        # Entries from an older rule set can never be hit again; free them at once
+        if rule_set_version != self._rule_set_version:
+            if self._entries:
+                logger.info(f"Rule set changed to {rule_set_version}, dropping {len(self._entries)} cached results")
+                self.invalidations += 1
+            self._entries.clear()
+            self._rule_set_version = rule_set_version
+    
+    def get(self, key: str, rule_set_version: str) -> Optional[ComplianceCheckResult]:
+        """Cached result for a key, unless missing or past its expires_at"""
+        if not self.enabled:
+            return None
+        self._check_version(rule_set_version)
+        
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        if result.expires_at and result.expires_at <= datetime.now():
+            del self._entries[key]
+            self.expired += 1
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+    
+    def put(self, key: str, rule_set_version: str, result: ComplianceCheckResult):
+        # A check that started before a rule reload finishes on the old rule set;
+        # its result must not displace entries for the current one
+        if not self.enabled or rule_set_version != self._rule_set_version:
+            return
+        
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for /status"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "rule_set_version": self._rule_set_version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
@@ -0,0 +1,77 @@
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import orjson
+
+from ..models import ComplianceCheckResult, ComplianceViolation, ResultDetail
+from .bulk_engine import BulkItemOutcome
+from .compliance_service import CheckVerdict
+
+logger = logging.getLogger(__name__)
+
+# Per-item columns of a summary response; violations detail adds a "violations" column
+SUMMARY_COLUMNS = ("index", "status", "check_id", "compliant", "confidence_score", "risk_score", "violation_count", "error")
+
+def dumps(content: Any) -> bytes:
+    """orjson serialization shared by the lean response paths"""
+    return orjson.dumps(content)
+
+def compact_violation(violation: ComplianceViolation) -> Dict[str, Any]:
+    return {
+        "rule_id": violation.rule_id,
+        "severity": violation.severity.value,
+        "field_name": violation.field_name,
+        "description": violation.description
+    }
+
+def _outcome_row(outcome: BulkItemOutcome, detail: ResultDetail) -> Dict[str, Any]:
+    # A verdict and a full result carry the same headline fields
+    result: Optional[Union[CheckVerdict, ComplianceCheckResult]] = outcome.verdict or outcome.result
+    index = outcome.index
+    if result is None:
+        row = {"index": index, "status": "failed", "check_id": None, "compliant": None, "confidence_score": None,
+               "risk_score": None, "violation_count": None, "error": outcome.error}
+    else:
+        row = {"index": index, "status": "completed", "check_id": result.check_id, "compliant": result.compliant,
+               "confidence_score": result.confidence_score, "risk_score": result.risk_score,
+               "violation_count": len(result.violations), "error": None}
+    if detail == ResultDetail.VIOLATIONS:
+        row["violations"] = [compact_violation(violation) for violation in result.violations] if result else None
+    return row
+
+def columns(rows: Iterable[Dict[str, Any]], detail: ResultDetail) -> Dict[str, List[Any]]:
+    """Per-item rows as one array per field"""
+    names = SUMMARY_COLUMNS + (("violations",) if detail == ResultDetail.VIOLATIONS else ())
+    table: Dict[str, List[Any]] = {name: [] for name in names}
+    for row in rows:
+        for name in names:
+            table[name].append(row[name])
+    return table
+
+def outcome_columns(outcomes: Iterable[BulkItemOutcome], detail: ResultDetail) -> Dict[str, List[Any]]:
+    """Columns for checks just run, read off their verdicts (or results) without dumping them"""
+    return columns((_outcome_row(outcome, detail) for outcome in outcomes), detail)
+
+def stored_columns(rows: Iterable[Dict[str, Any]], detail: ResultDetail) -> Dict[str, List[Any]]:
+    """Columns for BatchJobStore.get_result_summaries rows"""
+    def normalized(row: Dict[str, Any]) -> Dict[str, Any]:
+        completed = row["status"] == "completed"
+        row = {
+            **row,
+            "index": row["item_index"],
+            "compliant": bool(row["compliant"]) if completed else None,
+            "confidence_score": row["confidence_score"] if completed else None
+        }
+        if detail == ResultDetail.VIOLATIONS:
+            row["violations"] = orjson.loads(row["violations"]) if completed else None
+        return row
+    
+    return columns((normalized(row) for row in rows), detail)
+
+def outcome_line(outcome: BulkItemOutcome, detail: ResultDetail) -> bytes:
+    """One NDJSON line of a streamed bulk check"""
+    if detail == ResultDetail.FULL:
+        if outcome.result is None:
+            return dumps({"index": outcome.index, "error": outcome.error}) + b"\n"
+        return b'{"index": %d, "result": %s}\n' % (outcome.index, outcome.result.model_dump_json().encode())
+    return dumps(_outcome_row(outcome, detail)) + b"\n"
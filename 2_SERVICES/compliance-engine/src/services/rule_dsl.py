@@ -0,0 +1,166 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+
+from ..models import ComplianceViolation, ViolationSeverity
+from .currency import RateSnapshot
+
+@dataclass(frozen=True)
+class RuleCheck:
+    """Declarative check of one entity field, usually against a jurisdiction parameter"""
+    # description and remediation may reference the resolved parameter as {required}
+    field: str
+    operator: str
+    severity: ViolationSeverity
+    description: str
+    remediation: Tuple[str, ...]
+    parameter: Optional[str] = None
+    required_value: Optional[str] = None
+    entity_types: Tuple[str, ...] = ()
+    when: Optional[str] = None
+
+# operator -> (needs a parameter, violation predicate)
+OPERATORS: Dict[str, Tuple[bool, Callable[[Any, Any], bool]]] = {
+    "min": (True, lambda value, required: bool(value) and value < required),
+    "max": (True, lambda value, required: bool(value) and value > required),
+    "required": (False, lambda value, required: not value),
+}
+
+# Money fields are compared in the jurisdiction's currency, converted from the entity's stated one
+MONEY_FIELDS = ("salary_min", "salary_max", "salary")
+
+FieldTransform = Callable[[Any, Dict[str, Any], RateSnapshot], Any]
+CheckFunction = Callable[[Dict[str, Any], RateSnapshot], Optional[ComplianceViolation]]
+RuleEvaluator = Callable[[Dict[str, Any], str, RateSnapshot], List[ComplianceViolation]]
+
+def resolve_check(rule: Any, check: RuleCheck, resolve_parameter: Callable[[str], Any]) -> Tuple[bool, Any]:
+    """Validate a check and resolve its parameter; (False, None) if it can never fire"""
+    if check.operator not in OPERATORS:
+        raise ValueError(f"Rule {rule.rule_id}: unknown operator '{check.operator}'")
+    
+    needs_parameter = OPERATORS[check.operator][0]
+    if not needs_parameter:
+        return True, None
+    if not check.parameter:
+        raise ValueError(f"Rule {rule.rule_id}: operator '{check.operator}' needs a parameter")
+    required = resolve_parameter(check.parameter)
+    # None: jurisdiction has no such requirement
+    return required is not None, required
+
+def field_transform(field_name: str, currency: Optional[str]) -> Optional[FieldTransform]:
+    """Normalization of a field value before it is compared; None when it is compared as given"""
+    if field_name not in MONEY_FIELDS or not currency:
+        return None
+    
+    def to_local_currency(value: Any, data: Dict[str, Any], rates: RateSnapshot) -> Any:
+        # Same conversion as RateSnapshot.factors: no stated currency means already local
+        stated = data.get("currency")
+        if not stated or stated == currency or isinstance(value, bool) or not isinstance(value, (int, float)):
+            return value
+        return value * rates.rate(stated, currency)
+    
+    return to_local_currency
+
+def violation_builder(rule: Any, check: RuleCheck, required: Any) -> Callable[[Any], ComplianceViolation]:
+    """Violation factory with everything but the offending field value fixed"""
+    field_name = check.field
+    rule_id = rule.rule_id
+    rule_name = rule.name
+    severity = check.severity
+    legal_reference = rule.source_url
+    description = check.description.format(required=required)
+    remediation = [step.format(required=required) for step in check.remediation]
+    required_value = check.required_value or str(required)
+    
+    def build(value: Any) -> ComplianceViolation:
+        return ComplianceViolation(
+            rule_id=rule_id,
+            rule_name=rule_name,
+            severity=severity,
+            description=description,
+            field_name=field_name,
+            current_value=str(value) if value is not None else "Not specified",
+            required_value=required_value,
+            remediation_steps=list(remediation),
+            legal_reference=legal_reference
+        )
+    
+    return build
+
+def compile_check(
+    rule: Any,
+    check: RuleCheck,
+    resolve_parameter: Callable[[str], Any],
+    currency: Optional[str] = None
+) -> Optional[CheckFunction]:
+    """Compile a check into a closure over its resolved parameter; None if it can never fire"""
+    can_fire, required = resolve_check(rule, check, resolve_parameter)
+    if not can_fire:
+        return None
+    
+    # Everything but the field value is fixed at compile time
+    _, violates = OPERATORS[check.operator]
+    field_name = check.field
+    transform = field_transform(field_name, currency)
+    when = check.when
+    build_violation = violation_builder(rule, check, required)
+    
+    def evaluate(data: Dict[str, Any], rates: RateSnapshot) -> Optional[ComplianceViolation]:
+        if when and not data.get(when):
+            return None
+        value = data.get(field_name)
+        compared = transform(value, data, rates) if transform else value
+        if not violates(compared, required):
+            return None
+        # Violations report the value as submitted
+        return build_violation(value)
+    
+    return evaluate
+
+def describe_checks(
+    rule: Any,
+    resolve_parameter: Callable[[str], Any],
+    currency: Optional[str] = None
+) -> Dict[Optional[str], Tuple[Dict[str, Any], ...]]:
+    """What a rule's checks compare, by entity type: field, operator, resolved threshold and, for money, currency"""
+    by_entity: Dict[Optional[str], List[Dict[str, Any]]] = {}
+    
+    for check in rule.checks or ():
+        can_fire, required = resolve_check(rule, check, resolve_parameter)
+        if not can_fire:
+            continue
+        described = {
+            "rule_id": rule.rule_id,
+            "field": check.field,
+            "operator": check.operator,
+            "required": required,
+            "currency": currency if field_transform(check.field, currency) else None,
+            "when": check.when
+        }
+        for entity_type in check.entity_types or rule.entity_types or (None,):
+            by_entity.setdefault(entity_type, []).append(described)
+    
+    return {entity_type: tuple(described) for entity_type, described in by_entity.items()}
+
+def compile_rule(rule: Any, resolve_parameter: Callable[[str], Any], currency: Optional[str] = None) -> RuleEvaluator:
+    """Compile a rule's checks into one evaluator dispatching on entity type; currency is the jurisdiction's"""
+    by_entity: Dict[Optional[str], List[CheckFunction]] = {}
+    
+    for check in rule.checks or ():
+        function = compile_check(rule, check, resolve_parameter, currency)
+        if function is None:
+            continue
+        for entity_type in check.entity_types or rule.entity_types or (None,):
+            by_entity.setdefault(entity_type, []).append(function)
+    
+    checks_by_entity = {entity_type: tuple(functions) for entity_type, functions in by_entity.items()}
+    any_entity = checks_by_entity.get(None, ())
+    
+    def evaluate(data: Dict[str, Any], entity_type: str, rates: RateSnapshot) -> List[ComplianceViolation]:
+        violations = []
+        for check in checks_by_entity.get(entity_type, any_entity):
+            violation = check(data, rates)
+            if violation is not None:
+                violations.append(violation)
+        return violations
+    
+    return evaluate
@@ -1,9 +1,20 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable, Mapping
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from functools import partial
+from types import MappingProxyType
+import asyncio
+import copy
+import hashlib
 import json
+import os
+import logging
 
 from ..models import ComplianceJurisdiction, ComplianceType, ViolationSeverity
+from .jurisdiction_service import JurisdictionService
+from .rule_dsl import MONEY_FIELDS, RuleCheck, compile_rule, describe_checks
+
+logger = logging.getLogger(__name__)
 
 @dataclass
 class ComplianceRule:
@@ -20,10 +31,308 @@ class ComplianceRule:
     source_url: Optional[str] = None
     severity: ViolationSeverity = ViolationSeverity.MEDIUM
     entity_types: List[str] = None
+    checks: List[RuleCheck] = None
+    # Compiled from checks at load time: evaluate(data, entity_type) -> violations
+    evaluate: Optional[Callable] = field(default=None, repr=False, compare=False)
+    # Also set at load time: entity type -> what its checks compare (see rule_dsl.describe_checks)
+    field_checks: Optional[Mapping[Optional[str], Tuple[Dict[str, Any], ...]]] = field(default=None, repr=False, compare=False)
+    
+    def checks_for(self, entity_type: str) -> Tuple[Dict[str, Any], ...]:
+        """Descriptions of the checks evaluated for an entity type"""
+        field_checks = self.field_checks or {}
+        return field_checks.get(entity_type, field_checks.get(None, ()))
+
+# Declarative checks shared by rules across jurisdictions
+MINIMUM_WAGE_CHECK = RuleCheck(
+    field="salary_min",
+    operator="min",
+    parameter="minimum_wage",
+    severity=ViolationSeverity.HIGH,
+    description="Salary below minimum wage requirement of {required}",
+    remediation=(
+        "Increase minimum salary to at least {required}",
+        "Review local minimum wage regulations",
+        "Update job posting with compliant salary range"
+    ),
+    entity_types=("job_posting",)
+)
+
+WORKING_HOURS_CHECK = RuleCheck(
+    field="working_hours",
+    operator="max",
+    parameter="max_working_hours",
+    severity=ViolationSeverity.MEDIUM,
+    description="Working hours exceed legal maximum of {required} hours per week",
+    remediation=(
+        "Reduce working hours to maximum {required} per week",
+        "Consider flexible working arrangements",
+        "Review overtime compensation policies"
+    ),
+    entity_types=("job_posting",)
+)
+
+EQUAL_OPPORTUNITY_CHECK = RuleCheck(
+    field="equal_opportunity_statement",
+    operator="required",
+    required_value="Required equal opportunity statement",
+    severity=ViolationSeverity.MEDIUM,
+    description="Missing equal opportunity employment statement",
+    remediation=(
+        "Add equal opportunity employment statement",
+        "Review anti-discrimination policies",
+        "Ensure inclusive language in job description"
+    ),
+    entity_types=("job_posting",)
+)
+
+HOLIDAY_ENTITLEMENT_CHECK = RuleCheck(
+    field="holiday_entitlement",
+    operator="min",
+    parameter="min_holiday_entitlement",
+    severity=ViolationSeverity.HIGH,
+    description="Holiday entitlement below legal minimum of {required} days",
+    remediation=(
+        "Increase holiday entitlement to minimum {required} days",
+        "Review statutory holiday requirements",
+        "Update all employee contracts"
+    ),
+    entity_types=("employment_contract",)
+)
+
+NOTICE_PERIOD_CHECK = RuleCheck(
+    field="notice_period",
+    operator="min",
+    parameter="min_notice_period",
+    severity=ViolationSeverity.MEDIUM,
+    description="Notice period below legal minimum of {required} days",
+    remediation=(
+        "Increase notice period to minimum {required} days",
+        "Review termination procedures",
+        "Ensure mutual notice requirements"
+    ),
+    entity_types=("employment_contract",)
+)
+
+DATA_PROCESSING_CONSENT_CHECK = RuleCheck(
+    field="data_processing_consent",
+    operator="required",
+    required_value="True",
+    severity=ViolationSeverity.CRITICAL,
+    description="Missing explicit consent for data processing",
+    remediation=(
+        "Obtain explicit consent for data processing",
+        "Implement consent management system",
+        "Provide clear privacy notice"
+    ),
+    entity_types=("candidate_data",)
+)
+
+# Index key for rules without entity_types, which apply to every entity type
+ANY_ENTITY = None
+
+def rule_to_dict(rule: ComplianceRule) -> Dict[str, Any]:
+    """JSON-ready form of a rule, as stored in rule data files"""
+    data = {f.name: getattr(rule, f.name) for f in fields(rule) if f.compare}
+    data["checks"] = [
+        {f.name: getattr(check, f.name) for f in fields(check)}
+        for check in rule.checks or ()
+    ]
+    return json.loads(json.dumps(data, default=lambda value: value.isoformat() if isinstance(value, datetime) else str(value)))
+
+def rule_from_dict(data: Dict[str, Any]) -> ComplianceRule:
+    """Rule from its data file form; raises ValueError/KeyError/TypeError on bad data"""
+    checks = [
+        RuleCheck(
+            **{
+                **check,
+                "severity": ViolationSeverity(check["severity"]),
+                "remediation": tuple(check.get("remediation", ())),
+                "entity_types": tuple(check.get("entity_types", ()))
+            }
+        )
+        for check in data.get("checks") or ()
+    ]
+    return ComplianceRule(
+        **{
+            **data,
+            "jurisdiction": ComplianceJurisdiction(data["jurisdiction"]),
+            "compliance_type": ComplianceType(data["compliance_type"]),
+            "severity": ViolationSeverity(data.get("severity", ViolationSeverity.MEDIUM.value)),
+            "last_updated": datetime.fromisoformat(data["last_updated"]),
+            "effective_date": datetime.fromisoformat(data["effective_date"]),
+            "checks": checks or None
+        }
+    )
+
+@dataclass(frozen=True)
+class RuleSetSnapshot:
+    """Compiled rules and the jurisdiction parameters they were compiled against"""
+    version: str
+    source: str
+    rules: Tuple[ComplianceRule, ...]
+    jurisdiction_data: Mapping[ComplianceJurisdiction, Mapping[str, Any]] = field(repr=False)
+    # applicable: (jurisdiction, compliance_type, entity_type) -> rules
+    # listing: (jurisdiction, compliance_type) -> rules, None meaning "all"
+    # type_counts: jurisdiction -> {compliance_type: rule count}
+    applicable: Mapping[tuple, Tuple[ComplianceRule, ...]] = field(repr=False)
+    listing: Mapping[tuple, Tuple[ComplianceRule, ...]] = field(repr=False)
+    type_counts: Mapping[Any, Mapping[str, int]] = field(repr=False)
+    # rule_id -> hash of the rule and the parameter values its checks resolve to
+    fingerprints: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}), repr=False)
+    loaded_at: datetime = field(default_factory=datetime.now)
+    
+    def applicable_rules(
+        self,
+        jurisdiction: ComplianceJurisdiction,
+        compliance_type: ComplianceType,
+        entity_type: str
+    ) -> Tuple[ComplianceRule, ...]:
+        rules = self.applicable.get((jurisdiction, compliance_type, entity_type))
+        if rules is None:
+            rules = self.applicable.get((jurisdiction, compliance_type, ANY_ENTITY), ())
+        return rules
+    
+    def info(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "source": self.source,
+            "rules": len(self.rules),
+            "loaded_at": self.loaded_at.isoformat()
+        }
 
 class RulesEngine:
-    def __init__(self):
-        self.rules = self._load_compliance_rules()
+    def __init__(
+        self,
+        jurisdiction_service: Optional[JurisdictionService] = None,
+        data_path: Optional[str] = None
+    ):
+        self.jurisdiction_service = jurisdiction_service or JurisdictionService()
+        # Optional data file overriding the built-in rules and/or jurisdiction parameters
+        self.data_path = data_path or os.getenv("RULES_DATA_PATH", "config/compliance_rules.json")
+        self.refresh_seconds = float(os.getenv("RULES_REFRESH_SECONDS", 60))
+        self._mtime: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[RuleSetSnapshot], None]] = []
+        
+        self._swap(self.build_snapshot())
+        self.reload_if_changed()
+    
+    @property
+    def snapshot(self) -> RuleSetSnapshot:
+        """Take once per check; a reload swaps in a new snapshot, never mutates this one"""
+        return self._snapshot
+    
+    @property
+    def rules(self) -> Tuple[ComplianceRule, ...]:
+        return self._snapshot.rules
+    
+    @property
+    def version(self) -> str:
+        return self._snapshot.version
+    
+    def _swap(self, snapshot: RuleSetSnapshot):
+        self._snapshot = snapshot
+        self.jurisdiction_service.jurisdiction_data = snapshot.jurisdiction_data
+        for listener in self._listeners:
+            try:
+                listener(snapshot)
+            except Exception as e:
+                logger.error(f"Rule set listener failed for {snapshot.version}: {e}")
+    
+    def on_swap(self, listener: Callable[[RuleSetSnapshot], None]):
+        """Call listener with the current snapshot and with every snapshot swapped in later"""
+        self._listeners.append(listener)
+        listener(self._snapshot)
+    
+    def build_snapshot(
+        self,
+        rule_data: Optional[List[Dict[str, Any]]] = None,
+        jurisdiction_overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+        label: Optional[str] = None,
+        source: str = "builtin"
+    ) -> RuleSetSnapshot:
+        """Build and compile a snapshot; sections not given fall back to the built-in data"""
+        jurisdiction_data = self.jurisdiction_service._load_jurisdiction_data()
+        for jurisdiction, overrides in (jurisdiction_overrides or {}).items():
+            jurisdiction = ComplianceJurisdiction(jurisdiction)
+            jurisdiction_data[jurisdiction] = {**jurisdiction_data.get(jurisdiction, {}), **overrides}
+        jurisdiction_data = MappingProxyType({
+            jurisdiction: MappingProxyType(copy.deepcopy(data)) for jurisdiction, data in jurisdiction_data.items()
+        })
+        
+        if rule_data is not None:
+            rules = tuple(rule_from_dict(rule) for rule in rule_data)
+        else:
+            rules = tuple(self._load_compliance_rules())
+        self._compile_rules(rules, jurisdiction_data)
+        applicable, listing, type_counts = self._build_index(rules)
+        
+        version = self._rule_set_version(rules, jurisdiction_data)
+        return RuleSetSnapshot(
+            version=f"{label}-{version[:8]}" if label else version,
+            source=source,
+            rules=rules,
+            jurisdiction_data=jurisdiction_data,
+            applicable=applicable,
+            listing=listing,
+            type_counts=type_counts,
+            fingerprints=self._rule_fingerprints(rules, jurisdiction_data)
+        )
+    
+    def load_snapshot(self) -> RuleSetSnapshot:
+        """Build a snapshot from the rule data file"""
+        with open(self.data_path) as f:
+            payload = json.load(f)
+        return self.build_snapshot(
+            rule_data=payload.get("rules"),
+            jurisdiction_overrides=payload.get("jurisdictions"),
+            label=payload.get("version"),
+            source=self.data_path
+        )
+    
+    def reload(self) -> RuleSetSnapshot:
+        """Load the rule data file and swap it in"""
+        snapshot = self.load_snapshot()
+        self._swap(snapshot)
+        logger.info(f"Loaded rule set {snapshot.version} from {snapshot.source} ({len(snapshot.rules)} rules)")
+        return snapshot
+    
+    def reload_if_changed(self) -> bool:
+        """Reload when the data file's mtime moved; a bad file keeps the current snapshot"""
+        try:
+            mtime = os.stat(self.data_path).st_mtime
+        except FileNotFoundError:
+            return False
+        if mtime == self._mtime:
+            return False
+        
+        self._mtime = mtime
+        try:
+            self.reload()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error(f"Ignoring invalid rule data file {self.data_path}: {e}")
+            return False
+        return True
+    
+    def start(self):
+        """Watch the rule data file for changes"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._watch())
+    
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            # Parse and compile off the event loop; checks keep using the current snapshot meanwhile
+            await asyncio.to_thread(self.reload_if_changed)
     
     def _load_compliance_rules(self) -> List[ComplianceRule]:
         """Load compliance rules for all jurisdictions"""
@@ -55,22 +364,113 @@ class RulesEngine:
         
         return rules
     
+    def _compile_rules(self, rules: Tuple[ComplianceRule, ...], jurisdiction_data: Mapping[Any, Mapping[str, Any]]):
+        """Compile each rule's declarative checks against its jurisdiction's parameters"""
+        for rule in rules:
+            resolve_parameter = partial(
+                self.jurisdiction_service.get_rule_parameter,
+                rule.jurisdiction,
+                jurisdiction_data=jurisdiction_data
+            )
+            currency = jurisdiction_data.get(rule.jurisdiction, {}).get("currency", "USD")
+            rule.evaluate = compile_rule(rule, resolve_parameter, currency)
+            rule.field_checks = MappingProxyType(describe_checks(rule, resolve_parameter, currency))
+    
+    @staticmethod
+    def _rule_set_version(rules: Tuple[ComplianceRule, ...], jurisdiction_data: Mapping[Any, Mapping[str, Any]]) -> str:
+        """Content hash of the rules and the jurisdiction parameters they resolve against"""
+        content = {
+            "rules": [rule_to_dict(rule) for rule in rules],
+            "jurisdictions": {
+                jurisdiction.value: dict(data) for jurisdiction, data in jurisdiction_data.items()
+            }
+        }
+        canonical = json.dumps(content, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+    
+    def _rule_fingerprints(
+        self,
+        rules: Tuple[ComplianceRule, ...],
+        jurisdiction_data: Mapping[Any, Mapping[str, Any]]
+    ) -> Mapping[str, str]:
+        """Per-rule content hashes; a changed parameter changes only the rules whose checks read it"""
+        fingerprints = {}
+        for rule in rules:
+            parameters = {
+                check.parameter: self.jurisdiction_service.get_rule_parameter(
+                    rule.jurisdiction, check.parameter, jurisdiction_data=jurisdiction_data
+                )
+                for check in rule.checks or () if check.parameter
+            }
+            # Money checks compare in the jurisdiction's currency
+            if any(check.field in MONEY_FIELDS for check in rule.checks or ()):
+                parameters["currency"] = jurisdiction_data.get(rule.jurisdiction, {}).get("currency", "USD")
+            canonical = json.dumps([rule_to_dict(rule), parameters], sort_keys=True, default=str)
+            fingerprints[rule.rule_id] = hashlib.sha256(canonical.encode()).hexdigest()[:16]
+        return MappingProxyType(fingerprints)
+    
+    @staticmethod
+    def _build_index(rules: Tuple[ComplianceRule, ...]):
+        """Compile rules into read-only lookup tables, preserving load order"""
+        applicable: Dict[tuple, List[ComplianceRule]] = {}
+        listing: Dict[tuple, List[ComplianceRule]] = {}
+        type_counts: Dict[Any, Dict[str, int]] = {}
+        
+        # Entity types named by any rule for each (jurisdiction, compliance_type)
+        entity_types: Dict[tuple, set] = {}
+        for rule in rules:
+            key = (rule.jurisdiction, rule.compliance_type)
+            entity_types.setdefault(key, set()).update(rule.entity_types or ())
+        
+        for rule in rules:
+            key = (rule.jurisdiction, rule.compliance_type)
+            
+            # Rules without entity_types match every entity type, including
+            # ones no rule names, which resolve to the ANY_ENTITY key
+            targets = rule.entity_types or (*entity_types[key], ANY_ENTITY)
+            for entity_type in targets:
+                applicable.setdefault((*key, entity_type), []).append(rule)
+            
+            for listing_key in (key, (rule.jurisdiction, None), (None, rule.compliance_type), (None, None)):
+                listing.setdefault(listing_key, []).append(rule)
+            
+            counts = type_counts.setdefault(rule.jurisdiction, {t.value: 0 for t in ComplianceType})
+            counts[rule.compliance_type.value] += 1
+        
+        return (
+            MappingProxyType({key: tuple(value) for key, value in applicable.items()}),
+            MappingProxyType({key: tuple(value) for key, value in listing.items()}),
+            MappingProxyType({key: MappingProxyType(value) for key, value in type_counts.items()})
+        )
+    
     async def get_applicable_rules(
         self, 
         jurisdiction: ComplianceJurisdiction,
         compliance_type: ComplianceType,
         entity_type: str
-    ) -> List[ComplianceRule]:
+    ) -> Tuple[ComplianceRule, ...]:
         """Get applicable rules for jurisdiction, compliance type, and entity type"""
-        applicable_rules = []
-        
-        for rule in self.rules:
-            if (rule.jurisdiction == jurisdiction and 
-                rule.compliance_type == compliance_type and
-                (not rule.entity_types or entity_type in rule.entity_types)):
-                applicable_rules.append(rule)
-        
-        return applicable_rules
+        return self._snapshot.applicable_rules(jurisdiction, compliance_type, entity_type)
+    
+    def list_rules(
+        self,
+        jurisdiction: Optional[ComplianceJurisdiction] = None,
+        compliance_type: Optional[ComplianceType] = None,
+        entity_type: Optional[str] = None
+    ) -> Tuple[ComplianceRule, ...]:
+        """List rules, treating any filter left as None as matching all"""
+        rules = self._snapshot.listing.get((jurisdiction, compliance_type), ())
+        if entity_type:
+            rules = tuple(
+                rule for rule in rules
+                if not rule.entity_types or entity_type in rule.entity_types
+            )
+        return rules
+    
+    def count_rules_by_type(self, jurisdiction: ComplianceJurisdiction) -> Dict[str, int]:
+        """Number of rules per compliance type for a jurisdiction"""
+        counts = self._snapshot.type_counts.get(jurisdiction)
+        return dict(counts) if counts else {t.value: 0 for t in ComplianceType}
     
     def _get_uk_rules(self) -> List[ComplianceRule]:
         """UK compliance rules"""
@@ -93,7 +493,8 @@ class RulesEngine:
                 effective_date=datetime(2024, 4, 1),
                 source_url="https://www.gov.uk/national-minimum-wage-rates",
                 severity=ViolationSeverity.HIGH,
-                entity_types=["job_posting", "employment_contract"]
+                entity_types=["job_posting", "employment_contract"],
+                checks=[MINIMUM_WAGE_CHECK]
             ),
             ComplianceRule(
                 rule_id="uk_working_time",
@@ -113,7 +514,8 @@ class RulesEngine:
                 effective_date=datetime(1998, 10, 1),
                 source_url="https://www.gov.uk/maximum-weekly-working-hours",
                 severity=ViolationSeverity.MEDIUM,
-                entity_types=["job_posting", "employment_contract"]
+                entity_types=["job_posting", "employment_contract"],
+                checks=[WORKING_HOURS_CHECK]
             ),
             ComplianceRule(
                 rule_id="uk_holiday_entitlement",
@@ -132,7 +534,8 @@ class RulesEngine:
                 effective_date=datetime(1998, 10, 1),
                 source_url="https://www.gov.uk/holiday-entitlement-rights",
                 severity=ViolationSeverity.HIGH,
-                entity_types=["employment_contract"]
+                entity_types=["employment_contract"],
+                checks=[HOLIDAY_ENTITLEMENT_CHECK]
             ),
             ComplianceRule(
                 rule_id="uk_gdpr",
@@ -153,7 +556,8 @@ class RulesEngine:
                 effective_date=datetime(2021, 1, 1),
                 source_url="https://ico.org.uk/for-organisations/guide-to-data-protection/",
                 severity=ViolationSeverity.CRITICAL,
-                entity_types=["candidate_data", "employment_contract"]
+                entity_types=["candidate_data", "employment_contract"],
+                checks=[DATA_PROCESSING_CONSENT_CHECK]
             ),
             ComplianceRule(
                 rule_id="uk_equality_act",
@@ -173,7 +577,8 @@ class RulesEngine:
                 effective_date=datetime(2010, 10, 1),
                 source_url="https://www.equalityhumanrights.com/en/equality-act-2010",
                 severity=ViolationSeverity.HIGH,
-                entity_types=["job_posting", "employment_contract", "candidate_data"]
+                entity_types=["job_posting", "employment_contract", "candidate_data"],
+                checks=[EQUAL_OPPORTUNITY_CHECK]
             )
         ]
     
@@ -198,7 +603,8 @@ class RulesEngine:
                 effective_date=datetime(2003, 11, 23),
                 source_url="https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=celex%3A32003L0088",
                 severity=ViolationSeverity.MEDIUM,
-                entity_types=["job_posting", "employment_contract"]
+                entity_types=["job_posting", "employment_contract"],
+                checks=[WORKING_HOURS_CHECK, HOLIDAY_ENTITLEMENT_CHECK]
             ),
             ComplianceRule(
                 rule_id="eu_gdpr",
@@ -219,7 +625,8 @@ class RulesEngine:
                 effective_date=datetime(2018, 5, 25),
                 source_url="https://gdpr-info.eu/",
                 severity=ViolationSeverity.CRITICAL,
-                entity_types=["candidate_data", "employment_contract"]
+                entity_types=["candidate_data", "employment_contract"],
+                checks=[DATA_PROCESSING_CONSENT_CHECK]
             ),
             ComplianceRule(
                 rule_id="eu_equal_treatment",
@@ -239,7 +646,8 @@ class RulesEngine:
                 effective_date=datetime(2000, 11, 27),
                 source_url="https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=celex%3A32000L0078",
                 severity=ViolationSeverity.HIGH,
-                entity_types=["job_posting", "employment_contract"]
+                entity_types=["job_posting", "employment_contract"],
+                checks=[EQUAL_OPPORTUNITY_CHECK]
             )
         ]
     
@@ -264,7 +672,8 @@ class RulesEngine:
                 effective_date=datetime(1938, 6, 25),
                 source_url="https://www.dol.gov/agencies/whd/flsa",
                 severity=ViolationSeverity.HIGH,
-                entity_types=["job_posting", "employment_contract"]
+                entity_types=["job_posting", "employment_contract"],
+                checks=[MINIMUM_WAGE_CHECK]
             ),
             ComplianceRule(
                 rule_id="us_title_vii",
@@ -283,7 +692,8 @@ class RulesEngine:
                 effective_date=datetime(1964, 7, 2),
                 source_url="https://www.eeoc.gov/statutes/title-vii-civil-rights-act-1964",
                 severity=ViolationSeverity.HIGH,
-                entity_types=["job_posting", "employment_contract", "candidate_data"]
+                entity_types=["job_posting", "employment_contract", "candidate_data"],
+                checks=[EQUAL_OPPORTUNITY_CHECK]
             ),
             ComplianceRule(
                 rule_id="us_ada",
@@ -348,7 +758,8 @@ class RulesEngine:
                 effective_date=datetime(2009, 7, 1),
                 source_url="https://www.fairwork.gov.au/",
                 severity=ViolationSeverity.HIGH,
-                entity_types=["job_posting", "employment_contract"]
+                entity_types=["job_posting", "employment_contract"],
+                checks=[MINIMUM_WAGE_CHECK, HOLIDAY_ENTITLEMENT_CHECK]
             ),
             ComplianceRule(
                 rule_id="au_privacy",
@@ -393,7 +804,8 @@ class RulesEngine:
                 effective_date=datetime(1996, 9, 4),
                 source_url="https://www.canada.ca/en/employment-social-development/services/labour-standards.html",
                 severity=ViolationSeverity.MEDIUM,
-                entity_types=["job_posting", "employment_contract"]
+                entity_types=["job_posting", "employment_contract"],
+                checks=[MINIMUM_WAGE_CHECK, HOLIDAY_ENTITLEMENT_CHECK, NOTICE_PERIOD_CHECK]
             ),
             ComplianceRule(
                 rule_id="ca_pipeda",
@@ -438,7 +850,8 @@ class RulesEngine:
                 effective_date=datetime(1947, 9, 7),
                 source_url="https://www.mhlw.go.jp/english/",
                 severity=ViolationSeverity.MEDIUM,
-                entity_types=["job_posting", "employment_contract"]
+                entity_types=["job_posting", "employment_contract"],
+                checks=[WORKING_HOURS_CHECK, HOLIDAY_ENTITLEMENT_CHECK]
             ),
             ComplianceRule(
                 rule_id="jp_appi",
@@ -483,7 +896,8 @@ class RulesEngine:
                 effective_date=datetime(1968, 12, 27),
                 source_url="https://www.mom.gov.sg/employment-practices/employment-act",
                 severity=ViolationSeverity.MEDIUM,
-                entity_types=["job_posting", "employment_contract"]
+                entity_types=["job_posting", "employment_contract"],
+                checks=[WORKING_HOURS_CHECK, HOLIDAY_ENTITLEMENT_CHECK]
             ),
             ComplianceRule(
                 rule_id="sg_pdpa",
@@ -528,7 +942,8 @@ class RulesEngine:
                 effective_date=datetime(1953, 5, 10),
                 source_url="https://www.moel.go.kr/english/",
                 severity=ViolationSeverity.MEDIUM,
-                entity_types=["job_posting", "employment_contract"]
+                entity_types=["job_posting", "employment_contract"],
+                checks=[WORKING_HOURS_CHECK, HOLIDAY_ENTITLEMENT_CHECK]
             ),
             ComplianceRule(
                 rule_id="kr_pipa",
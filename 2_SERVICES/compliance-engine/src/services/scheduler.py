@@ -0,0 +1,138 @@
+import asyncio
+import os
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PRIORITIES = ("normal", "high", "critical")
+
+# Lane -> share of slots it gets while every lane has work waiting
+LANE_WEIGHTS = {
+    "critical": 8,
+    "interactive": 4,
+    "high": 2,
+    "normal": 1
+}
+
+# Lanes allowed into the reserved slots; background batches never take the last of them
+RESERVED_LANES = ("critical", "interactive")
+
+WAIT_SAMPLES = 1000
+
+def most_urgent(*priorities: Optional[str]) -> str:
+    """Most urgent of the given priorities; unknown values count as normal"""
+    return max(
+        (priority if priority in PRIORITIES else "normal" for priority in priorities),
+        key=PRIORITIES.index,
+        default="normal"
+    )
+
+def lane_for(priority: Optional[str], interactive: bool = False) -> str:
+    """Queue a check waits in: critical work first, then callers waiting on the response, then batches"""
+    priority = most_urgent(priority)
+    if priority == "critical":
+        return "critical"
+    if interactive:
+        return "interactive"
+    return priority
+
+def _percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class PriorityScheduler:
+    """Shares check slots between per-priority queues by smooth weighted round robin"""
+    
+    def __init__(self, capacity: Optional[int] = None, reserved: Optional[int] = None,
+                 weights: Optional[Dict[str, int]] = None):
+        self.capacity = capacity or int(os.getenv("SCHEDULER_CAPACITY", 64))
+        if reserved is None:
+            reserved = int(os.getenv("SCHEDULER_RESERVED_SLOTS", max(1, self.capacity // 4)))
+        self.reserved = min(reserved, self.capacity - 1)
+        self.weights = weights or LANE_WEIGHTS
+        
+        self._queues: Dict[str, Deque[Tuple[float, asyncio.Future]]] = {lane: deque() for lane in self.weights}
+        self._credit = {lane: 0 for lane in self.weights}
+        self._running = {lane: 0 for lane in self.weights}
+        self._dispatched = {lane: 0 for lane in self.weights}
+        self._waits: Dict[str, Deque[float]] = {lane: deque(maxlen=WAIT_SAMPLES) for lane in self.weights}
+    
+    @asynccontextmanager
+    async def slot(self, lane: str) -> AsyncIterator[None]:
+        """Hold one check slot in a lane for the duration of the block"""
+        await self.acquire(lane)
+        try:
+            yield
+        finally:
+            self.release(lane)
+    
+    async def acquire(self, lane: str):
+        if lane not in self._queues:
+            raise ValueError(f"Unknown scheduler lane '{lane}'")
+        future = asyncio.get_running_loop().create_future()
+        self._queues[lane].append((time.monotonic(), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Granted just before the waiter was cancelled; hand the slot back
+            if future.done() and not future.cancelled():
+                self.release(lane)
+            raise
+    
+    def release(self, lane: str):
+        self._running[lane] -= 1
+        self._dispatch()
+    
+    def _admissible(self, lane: str) -> bool:
+        if lane in RESERVED_LANES:
+            return True
+        background = sum(running for name, running in self._running.items() if name not in RESERVED_LANES)
+        return background < self.capacity - self.reserved
+    
+    def _dispatch(self):
+        while sum(self._running.values()) < self.capacity:
+            for queue in self._queues.values():
+                while queue and queue[0][1].done():
+                    queue.popleft()
+            eligible = [lane for lane, queue in self._queues.items() if queue and self._admissible(lane)]
+            if not eligible:
+                return
+            
+            for lane in eligible:
+                self._credit[lane] += self.weights[lane]
+            lane = max(eligible, key=self._credit.get)
+            self._credit[lane] -= sum(self.weights[name] for name in eligible)
+            
+            enqueued_at, future = self._queues[lane].popleft()
+            self._running[lane] += 1
+            self._dispatched[lane] += 1
+            self._waits[lane].append(time.monotonic() - enqueued_at)
+            future.set_result(None)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, running checks and wait times per lane for /status"""
+        lanes = {}
+        for lane, queue in self._queues.items():
+            waits = self._waits[lane]
+            lanes[lane] = {
+                "weight": self.weights[lane],
+                "depth": sum(1 for _, future in queue if not future.done()),
+                "running": self._running[lane],
+                "dispatched": self._dispatched[lane],
+                "wait_ms": {
+                    "avg": round(1000 * sum(waits) / len(waits), 3) if waits else 0.0,
+                    "p50": round(1000 * _percentile(waits, 0.5), 3) if waits else 0.0,
+                    "p99": round(1000 * _percentile(waits, 0.99), 3) if waits else 0.0
+                }
+            }
+        return {
+            "capacity": self.capacity,
+            "reserved_slots": self.reserved,
+            "running": sum(self._running.values()),
+            "lanes": lanes
+        }
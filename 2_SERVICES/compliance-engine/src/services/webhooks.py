@@ -0,0 +1,201 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import random
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from .batch_store import BatchJobStore
+
+logger = logging.getLogger(__name__)
+
+# Longest the delivery loop sleeps before looking for due events again
+POLL_INTERVAL = 5.0
+
+def sign_payload(secret: str, timestamp: str, body: bytes) -> str:
+    """HMAC-SHA256 over "<timestamp>.<body>", as sent in X-Webhook-Signature"""
+    digest = hmac.new(secret.encode(), timestamp.encode() + b"." + body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+def valid_webhook_url(url: str) -> bool:
+    parsed = urlparse(url)
+    return parsed.scheme in ("http", "https") and bool(parsed.netloc)
+
+class WebhookNotifier:
+    """Pushes bulk batch progress and completion to each batch's notification_webhook
+    
+    Events go through an outbox in the batch store, so undelivered events survive
+    a restart. Progress events for a batch are coalesced: at most one is sent per
+    WEBHOOK_PROGRESS_INTERVAL and it carries the latest counters, and the final
+    event replaces any progress event still waiting.
+    """
+    
+    def __init__(
+        self,
+        store: BatchJobStore,
+        secret: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.store = store
+        self.secret = secret if secret is not None else os.getenv("WEBHOOK_SIGNING_SECRET", "")
+        self.progress_interval = float(os.getenv("WEBHOOK_PROGRESS_INTERVAL", 5))
+        self.max_attempts = int(os.getenv("WEBHOOK_MAX_ATTEMPTS", 8))
+        self.backoff_base = float(os.getenv("WEBHOOK_BACKOFF_BASE", 1.0))
+        self.backoff_max = float(os.getenv("WEBHOOK_BACKOFF_MAX", 300))
+        self.timeout = float(os.getenv("WEBHOOK_TIMEOUT", 10))
+        self.max_connections = int(os.getenv("WEBHOOK_MAX_CONNECTIONS", 20))
+        self.transport = transport
+        
+        self._client: Optional[httpx.AsyncClient] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+        self._last_progress: Dict[str, float] = {}
+        self.delivered = 0
+        self.failed_attempts = 0
+        self.given_up = 0
+    
+    def start(self):
+        """Start delivering; events left over from a previous process go out first"""
+        if self._task is None:
+            if not self.secret:
+                logger.warning("WEBHOOK_SIGNING_SECRET is not set; webhook events will be sent unsigned")
+            # One pool for every receiver, so repeat deliveries reuse keep-alive connections
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections),
+                transport=self.transport
+            )
+            self._task = asyncio.create_task(self._deliver_loop())
+    
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+    
+    def batch_progress(self, batch: Dict[str, Any]):
+        """Queue a progress event, merged with any progress event not yet sent"""
+        if not batch.get("notification_webhook"):
+            return
+        batch_id = batch["batch_id"]
+        due = self._last_progress.get(batch_id, 0.0) + self.progress_interval
+        self.store.save_event(
+            f"{batch_id}:progress", batch_id, batch["notification_webhook"], "batch.progress",
+            self._payload("batch.progress", batch), next_attempt_at=max(time.time(), due)
+        )
+        self._wake.set()
+    
+    def batch_finished(self, batch: Dict[str, Any]):
+        """Queue the final event for a batch, replacing a pending progress event"""
+        if not batch.get("notification_webhook"):
+            return
+        batch_id = batch["batch_id"]
+        event_type = "batch.completed" if batch["status"] == "completed" else "batch.failed"
+        self.store.save_event(
+            f"{batch_id}:finished", batch_id, batch["notification_webhook"], event_type,
+            self._payload(event_type, batch), next_attempt_at=time.time(),
+            supersedes=f"{batch_id}:progress"
+        )
+        self._last_progress.pop(batch_id, None)
+        self._wake.set()
+    
+    @staticmethod
+    def _payload(event_type: str, batch: Dict[str, Any]) -> str:
+        payload = {
+            "event": event_type,
+            "batch_id": batch["batch_id"],
+            "status": batch["status"],
+            "total_requests": batch["total_requests"],
+            "completed": batch["completed"],
+            "failed": batch["failed"],
+            "progress": batch["progress"],
+            "results_url": f"/api/v1/bulk-check/{batch['batch_id']}/results",
+            "occurred_at": datetime.now().isoformat()
+        }
+        if event_type != "batch.progress":
+            payload["summary"] = batch["summary"]
+            payload["error"] = batch.get("error")
+        return json.dumps(payload)
+    
+    async def _deliver_loop(self):
+        while True:
+            self._wake.clear()
+            try:
+                events = self.store.due_events(time.time())
+                if events:
+                    await asyncio.gather(*(self._deliver(event) for event in events))
+                    continue
+                next_due = self.store.next_event_due()
+                wait = POLL_INTERVAL if next_due is None else min(POLL_INTERVAL, max(0.0, next_due - time.time()))
+            except Exception as e:
+                logger.error(f"Webhook delivery loop failed: {e}")
+                wait = POLL_INTERVAL
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def _deliver(self, event: Dict[str, Any]):
+        body = event["payload"].encode()
+        timestamp = str(int(time.time()))
+        headers = {
+            "Content-Type": "application/json",
+            "X-Webhook-Event": event["event_type"],
+            # Stable per payload, so receivers can drop retried duplicates
+            "X-Webhook-Id": f"{event['event_id']}:{event['sequence']}",
+            "X-Webhook-Timestamp": timestamp
+        }
+        if self.secret:
+            headers["X-Webhook-Signature"] = sign_payload(self.secret, timestamp, body)
+        
+        try:
+            response = await self._client.post(event["url"], content=body, headers=headers)
+            error = None if response.is_success else f"HTTP {response.status_code}"
+        except httpx.HTTPError as e:
+            error = str(e) or type(e).__name__
+        
+        now = time.time()
+        if error is None:
+            self.delivered += 1
+            if event["event_type"] == "batch.progress":
+                self._last_progress[event["batch_id"]] = now
+            self.store.event_delivered(event["event_id"], event["sequence"], now + self.progress_interval)
+            return
+        
+        self.failed_attempts += 1
+        attempts = event["attempts"] + 1
+        if attempts >= self.max_attempts:
+            self.given_up += 1
+            logger.error(f"Giving up on webhook {event['event_id']} after {attempts} attempts: {error}")
+            self.store.event_failed(event["event_id"], attempts, now, error, dead=True)
+            return
+        
+        # Exponential backoff with jitter, so a recovering receiver is not hit by every batch at once
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1)) * random.uniform(0.5, 1.0)
+        logger.warning(f"Webhook {event['event_id']} attempt {attempts} failed ({error}), retrying in {delay:.1f}s")
+        self.store.event_failed(event["event_id"], attempts, now + delay, error)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Delivery counters and the outbox backlog for /status"""
+        counts = self.store.event_counts()
+        return {
+            "signed": bool(self.secret),
+            "pending": counts.get("pending", 0),
+            "undeliverable": counts.get("dead", 0),
+            "delivered": self.delivered,
+            "failed_attempts": self.failed_attempts,
+            "given_up": self.given_up
+        }
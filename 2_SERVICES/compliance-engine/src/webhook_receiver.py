@@ -0,0 +1,116 @@
+"""
+Local stand-in for a client's webhook endpoint
+
+Accepts webhook POSTs over plain HTTP/1.1 (keep-alive included), checks their
+signatures and records them, so delivery can be exercised without a real
+receiver. Run from the compliance-engine directory:
+    python -m src.webhook_receiver --port 9100 --secret dev-secret --fail-first 2
+
+then submit a background batch with "notification_webhook": "http://localhost:9100/hooks".
+"""
+
+import argparse
+import asyncio
+import hmac
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from .services.webhooks import sign_payload
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookReceiver:
+    """Minimal HTTP server that records webhook deliveries"""
+    
+    def __init__(self, secret: str = "", fail_first: int = 0):
+        self.secret = secret
+        # Answer this many requests with 503 first, to exercise retries
+        self.fail_first = fail_first
+        self.requests = 0
+        self.connections = 0
+        self.received: List[Dict[str, Any]] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+    
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start listening; returns the base URL"""
+        self._server = await asyncio.start_server(self._serve, host, port)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+    
+    async def close(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+    
+    def events(self, event_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        return [item["payload"] for item in self.received if event_type in (None, item["event"])]
+    
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                headers = {
+                    name.strip().lower(): value.strip()
+                    for name, _, value in (line.partition(":") for line in header_lines if line)
+                }
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                
+                status = self._handle(request_line, headers, body)
+                reason = {200: "OK", 401: "Unauthorized", 405: "Method Not Allowed", 503: "Service Unavailable"}[status]
+                writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Length: 0\r\n\r\n".encode())
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+    
+    def _handle(self, request_line: str, headers: Dict[str, str], body: bytes) -> int:
+        self.requests += 1
+        if not request_line.startswith("POST "):
+            return 405
+        if self.requests <= self.fail_first:
+            return 503
+        if self.secret:
+            expected = sign_payload(self.secret, headers.get("x-webhook-timestamp", ""), body)
+            if not hmac.compare_digest(expected, headers.get("x-webhook-signature", "")):
+                logger.warning("Rejected webhook with a bad signature")
+                return 401
+        
+        payload = json.loads(body)
+        self.received.append({
+            "id": headers.get("x-webhook-id"),
+            "event": headers.get("x-webhook-event"),
+            "payload": payload
+        })
+        logger.info(f"{headers.get('x-webhook-event')} {payload.get('batch_id')}: "
+                    f"{payload.get('completed')}/{payload.get('total_requests')} completed")
+        return 200
+
+
+async def serve(port: int, secret: str, fail_first: int):
+    receiver = WebhookReceiver(secret=secret, fail_first=fail_first)
+    url = await receiver.start("0.0.0.0", port)
+    logger.info(f"Webhook receiver listening on {url}")
+    await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Receive and verify compliance engine webhooks locally")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--secret", default="", help="WEBHOOK_SIGNING_SECRET of the engine; empty skips verification")
+    parser.add_argument("--fail-first", type=int, default=0, help="answer this many deliveries with 503")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+    try:
+        asyncio.run(serve(args.port, args.secret, args.fail_first))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
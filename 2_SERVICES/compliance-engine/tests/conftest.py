@@ -0,0 +1,7 @@
+import os
+import tempfile
+
+# Importing the app opens the batch store and report aggregates; keep them out of the source tree
+_state_dir = tempfile.mkdtemp(prefix="compliance-engine-tests-")
+os.environ.setdefault("BATCH_STORE_PATH", os.path.join(_state_dir, "compliance_batches.db"))
+os.environ.setdefault("AGGREGATES_PATH", os.path.join(_state_dir, "compliance_aggregates.json"))
@@ -0,0 +1,33 @@
+import asyncio
+
+from src.models import ComplianceCheckRequest, ComplianceJurisdiction, ComplianceType
+from src.services.aggregates import ComplianceAggregates
+from src.services.batch_store import BatchJobStore
+from src.services.compliance_service import ComplianceService
+
+def test_rebuild_from_store_matches_counted_checks(tmp_path):
+    store = BatchJobStore(str(tmp_path / "batches.db"))
+    aggregates = ComplianceAggregates(path=str(tmp_path / "aggregates.json"), store=store)
+    service = ComplianceService(aggregates=aggregates)
+    request = ComplianceCheckRequest(
+        jurisdiction=ComplianceJurisdiction.UK,
+        compliance_type=ComplianceType.EMPLOYMENT,
+        entity_type="job_posting",
+        data={"title": "Developer", "salary_min": 5, "working_hours": 40}
+    )
+    
+    async def run():
+        # The repeat is a cache hit, which the running totals count too
+        await service.perform_compliance_check(request)
+        aggregates.flush()
+        await service.perform_compliance_check(request)
+        expected = aggregates.summary()
+        await aggregates.rebuild_from_store()
+        return expected, aggregates.summary()
+    
+    expected, rebuilt = asyncio.run(run())
+    
+    assert rebuilt["summary"]["total_checks"] == 2
+    for key in ("summary", "jurisdiction_breakdown", "top_violations", "compliance_trends"):
+        assert rebuilt[key] == expected[key]
+    assert rebuilt["rebuilt_at"] is not None
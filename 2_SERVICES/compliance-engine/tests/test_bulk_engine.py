@@ -0,0 +1,24 @@
+import asyncio
+
+from src.benchmark import SAMPLE_DATA, build_requests
+from src.services.bulk_engine import BulkComplianceEngine
+from src.services.compliance_service import ComplianceService
+from src.services.scheduler import PriorityScheduler
+
+def test_process_backend_completes_with_few_scheduler_slots():
+    """Finished chunks hand their slot back even while the batch waits to submit more"""
+    scheduler = PriorityScheduler(capacity=4, reserved=1)
+    engine = BulkComplianceEngine(ComplianceService(), backend="process", workers=2, chunk_size=1, scheduler=scheduler)
+    requests = list(enumerate(build_requests(SAMPLE_DATA) * 2))
+    
+    async def run():
+        return [outcome async for outcome in engine.run(requests)]
+    
+    try:
+        outcomes = asyncio.run(asyncio.wait_for(run(), timeout=60))
+    finally:
+        engine.shutdown()
+    
+    assert sorted(outcome.index for outcome in outcomes) == [index for index, _ in requests]
+    assert all(outcome.result is not None for outcome in outcomes)
+    assert scheduler.stats()["running"] == 0
@@ -0,0 +1,38 @@
+import asyncio
+import json
+
+from src.benchmark import SAMPLE_DATA, build_requests
+from src.main import app
+
+def test_stream_answers_before_the_body_is_complete():
+    """Results for the first lines go out while later lines are still being sent"""
+    lines = [request.model_dump_json().encode() + b"\n" for request in build_requests(SAMPLE_DATA)[:4]]
+    
+    async def run():
+        first_result = asyncio.Event()
+        body = []
+        
+        async def receive():
+            if lines:
+                if len(lines) == 2:
+                    # Hold back the rest of the body until a result has been sent
+                    await asyncio.wait_for(first_result.wait(), timeout=10)
+                return {"type": "http.request", "body": lines.pop(0), "more_body": bool(lines)}
+            await asyncio.sleep(3600)
+        
+        async def send(message):
+            if message["type"] == "http.response.body" and message["body"]:
+                body.append(message["body"])
+                first_result.set()
+        
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+            "scheme": "http", "path": "/api/v1/bulk-check/stream", "raw_path": b"/api/v1/bulk-check/stream",
+            "query_string": b"detail=summary", "root_path": "", "headers": [], "server": ("test", 80), "client": ("test", 1)
+        }
+        await asyncio.wait_for(app(scope, receive, send), timeout=30)
+        return [json.loads(line) for line in b"".join(body).splitlines()]
+    
+    records = asyncio.run(run())
+    assert sorted(record["index"] for record in records[:-1]) == [0, 1, 2, 3]
+    assert records[-1]["completed"] == 4
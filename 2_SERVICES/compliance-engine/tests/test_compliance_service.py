@@ -0,0 +1,86 @@
+import asyncio
+
+from src.benchmark import SAMPLE_DATA, build_requests
+from src.models import ComplianceCheckRequest, ComplianceJurisdiction, ComplianceType
+from src.services.compliance_service import ComplianceService
+from src.services.result_cache import ComplianceResultCache
+
+def test_rule_that_raises_is_not_evaluated_and_not_cached():
+    service = ComplianceService()
+    request = ComplianceCheckRequest(
+        jurisdiction=ComplianceJurisdiction.UK,
+        compliance_type=ComplianceType.EMPLOYMENT,
+        entity_type="job_posting",
+        data={"title": "Developer", "salary_min": 5, "working_hours": 40, "equal_opportunity_statement": "Yes"}
+    )
+    rule = next(
+        rule for rule in service.rules_engine.snapshot.applicable_rules(
+            request.jurisdiction, request.compliance_type, request.entity_type
+        )
+        if rule.rule_id == "uk_minimum_wage"
+    )
+    
+    def broken(data, entity_type, rates):
+        raise RuntimeError("datastore unavailable")
+    
+    rule.evaluate = broken
+    result = asyncio.run(service.perform_compliance_check(request))
+    
+    assert result.metadata["rules_not_evaluated"] == ["uk_minimum_wage"]
+    assert "uk_minimum_wage" not in result.checks_performed
+    assert service.result_cache.stats()["entries"] == 0
+
+def test_verdict_matches_full_check():
+    service = ComplianceService(result_cache=ComplianceResultCache(enabled=False))
+    for request in build_requests(SAMPLE_DATA):
+        result = asyncio.run(service.perform_compliance_check(request))
+        verdict = asyncio.run(service.check_verdict(request))
+        assert (verdict.compliant, verdict.confidence_score, verdict.risk_score) == \
+            (result.compliant, result.confidence_score, result.risk_score)
+        assert verdict.violations == result.violations
+
+def test_results_describe_the_field_checks_behind_them():
+    service = ComplianceService()
+    request = ComplianceCheckRequest(
+        jurisdiction=ComplianceJurisdiction.UK,
+        compliance_type=ComplianceType.EMPLOYMENT,
+        entity_type="job_posting",
+        data={"title": "Developer"}
+    )
+    
+    result = asyncio.run(service.perform_compliance_check(request))
+    
+    checks = {check["field"]: check for check in result.metadata["field_checks"]}
+    assert checks["salary_min"]["required"] == 10.42
+    assert checks["salary_min"]["currency"] == "GBP"
+    assert checks["working_hours"]["operator"] == "max"
+    assert [violation.field_name for violation in result.violations] == ["equal_opportunity_statement"]
+
+def test_rule_checks_awaiting_io_overlap_and_time_out():
+    service = ComplianceService(max_concurrent_rules=4, rule_timeout_seconds=0.5)
+    request = ComplianceCheckRequest(
+        jurisdiction=ComplianceJurisdiction.UK,
+        compliance_type=ComplianceType.EMPLOYMENT,
+        entity_type="job_posting",
+        data={"title": "Developer", "salary_min": 20, "working_hours": 40, "equal_opportunity_statement": "Yes"}
+    )
+    rules = service.rules_engine.snapshot.applicable_rules(
+        request.jurisdiction, request.compliance_type, request.entity_type
+    )
+    
+    def lookup(seconds):
+        async def evaluate(data, entity_type, rates):
+            await asyncio.sleep(seconds)
+            return []
+        return evaluate
+    
+    rules[0].evaluate = lookup(0.3)
+    rules[1].evaluate = lookup(0.3)
+    rules[2].evaluate = lookup(5)
+    result = asyncio.run(service.perform_compliance_check(request))
+    
+    assert result.metadata["rules_not_evaluated"] == [rules[2].rule_id]
+    assert result.checks_performed == [rule.rule_id for rule in rules if rule is not rules[2]]
+    # The two lookups waited together rather than one after the other
+    assert result.processing_time_ms < 900
+    assert service.result_cache.stats()["entries"] == 0
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from src.models import ComplianceCheckRequest, ComplianceJurisdiction, ComplianceType, JobPosting
+from src.services.columnar_validation import ColumnarValidator
+from src.services.compliance_service import ComplianceService
+
+@pytest.mark.parametrize("currency, compliant", [("USD", False), ("GBP", True), (None, True)])
+def test_single_and_columnar_salary_checks_convert_alike(currency, compliant):
+    """12 USD is below the UK minimum wage once converted; 12 GBP is not"""
+    service = ComplianceService()
+    data = {"title": "Developer", "salary_min": 12, "working_hours": 40, "equal_opportunity_statement": "Yes"}
+    if currency:
+        data["currency"] = currency
+    request = ComplianceCheckRequest(
+        jurisdiction=ComplianceJurisdiction.UK,
+        compliance_type=ComplianceType.EMPLOYMENT,
+        entity_type="job_posting",
+        data=data
+    )
+    
+    result = asyncio.run(service.perform_compliance_check(request))
+    columnar = asyncio.run(ColumnarValidator(service.rules_engine).validate(
+        [(ComplianceJurisdiction.UK, data)], ComplianceType.EMPLOYMENT, "job_posting"
+    ))
+    
+    single_wage = "uk_minimum_wage" in {violation.rule_id for violation in result.violations}
+    columnar_wage = "uk_minimum_wage" in {violation.rule_id for violation in columnar.get(0, [])}
+    assert single_wage == columnar_wage == (not compliant)
+
+@pytest.mark.parametrize("currency, compliant", [(None, True), ("GBP", True), ("USD", False)])
+def test_typed_entities_convert_only_a_stated_currency(currency, compliant):
+    """A JobPosting without a currency is in the jurisdiction's currency, as a plain dict is"""
+    service = ComplianceService()
+    fields = {
+        "title": "Developer", "description": "Backend role", "requirements": [], "salary_min": 11,
+        "working_hours": 40, "location": "London", "company_name": "Acme", "equal_opportunity_statement": "Yes"
+    }
+    if currency:
+        fields["currency"] = currency
+    typed, plain = [
+        ComplianceCheckRequest(
+            jurisdiction=ComplianceJurisdiction.UK,
+            compliance_type=ComplianceType.EMPLOYMENT,
+            entity_type="job_posting",
+            data=data
+        )
+        for data in (JobPosting(**fields), dict(fields))
+    ]
+    
+    for request in (typed, plain):
+        result = asyncio.run(service.perform_compliance_check(request))
+        assert ("uk_minimum_wage" not in {violation.rule_id for violation in result.violations}) == compliant
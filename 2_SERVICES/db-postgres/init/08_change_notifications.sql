@@ -0,0 +1,38 @@
+\c iworkz_dev;
+
+-- Change notifications for AI agent cache invalidation
+-- Cached job analyses, match results and top-K lists are invalidated when the
+-- rows they were computed from change. Updates that only touch the columns
+-- passed as trigger arguments (timestamps, counters) do not notify.
+
+CREATE OR REPLACE FUNCTION notify_entity_change()
+RETURNS TRIGGER AS $$
+DECLARE
+  entity_id UUID;
+BEGIN
+  IF TG_OP = 'UPDATE' AND (to_jsonb(OLD) - TG_ARGV) = (to_jsonb(NEW) - TG_ARGV) THEN
+    RETURN NULL;
+  END IF;
+
+  IF TG_OP = 'DELETE' THEN
+    entity_id := OLD.id;
+  ELSE
+    entity_id := NEW.id;
+  END IF;
+
+  PERFORM pg_notify('entity_changes', json_build_object(
+    'table', TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME,
+    'id', entity_id,
+    'op', TG_OP
+  )::text);
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER notify_change_jobs_postings AFTER UPDATE OR DELETE ON jobs.postings FOR EACH ROW EXECUTE PROCEDURE notify_entity_change('updated_at', 'view_count', 'application_count');
+CREATE TRIGGER notify_change_users_talents AFTER UPDATE OR DELETE ON users.talents FOR EACH ROW EXECUTE PROCEDURE notify_entity_change('updated_at');
+CREATE TRIGGER notify_change_users_profiles AFTER UPDATE OR DELETE ON users.profiles FOR EACH ROW EXECUTE PROCEDURE notify_entity_change('updated_at', 'last_login');
+
+-- Rule edits, including activation changes and new rules, make every AI agent
+-- worker drop its in-process rule sets.
+CREATE TRIGGER notify_change_compliance_regulatory_rules AFTER INSERT OR UPDATE OR DELETE ON compliance.regulatory_rules FOR EACH ROW EXECUTE PROCEDURE notify_entity_change('updated_at');
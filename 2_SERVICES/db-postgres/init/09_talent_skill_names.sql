@@ -0,0 +1,26 @@
+\c iworkz_dev;
+
+-- Normalized talent skills for candidate retrieval
+-- users.talents.skills is a JSON array of skill names, an object of skill
+-- lists by category ({"technical_skills": [...], ...}), or an object keyed
+-- by skill names. The function returns the lower-cased names, so the
+-- candidate pre-filter can test overlap with the job's skills through the
+-- GIN expression index below.
+
+CREATE OR REPLACE FUNCTION users.talent_skill_names(skills JSONB)
+RETURNS TEXT[] AS $$
+  SELECT COALESCE(array_agg(DISTINCT lower(btrim(skill))), '{}')
+  FROM (
+    SELECT jsonb_array_elements_text(skills) AS skill WHERE jsonb_typeof(skills) = 'array'
+    UNION ALL
+    SELECT CASE WHEN jsonb_typeof(entry.value) = 'array' THEN category.skill ELSE entry.key END
+    FROM jsonb_each(CASE WHEN jsonb_typeof(skills) = 'object' THEN skills ELSE '{}' END) AS entry
+    LEFT JOIN LATERAL jsonb_array_elements_text(
+      CASE WHEN jsonb_typeof(entry.value) = 'array' THEN entry.value ELSE '[]' END
+    ) AS category(skill) ON true
+    WHERE jsonb_typeof(entry.value) <> 'array' OR category.skill IS NOT NULL
+  ) AS skill_names
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE INDEX IF NOT EXISTS idx_users_talents_skill_names
+  ON users.talents USING GIN(users.talent_skill_names(skills));